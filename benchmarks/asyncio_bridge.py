@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Per-call overhead of running synchronous code from a coroutine:
+``await greenlet_spawn(fn)`` against ``await loop.run_in_executor(None, fn)``.
+
+    python benchmarks/asyncio_bridge.py --calls 20000
+
+Python 3.11, x86_64, one CPU, best of 3:
+
+    direct call (baseline)           0.10 us/call
+    greenlet_spawn(noop)            12.77 us/call
+    greenlet_spawn(one await_)      19.62 us/call
+    run_in_executor(noop)           43.94 us/call
+
+Most of greenlet_spawn's cost is creating and starting the greenlet
+(~9.6us for a bare greenlet(fn).switch() on the same machine).
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from green_asyncio import await_, greenlet_spawn # pylint:disable=wrong-import-position
+
+
+def noop(x):
+    return x + 1
+
+
+def one_await(x):
+    # Sync code that makes one async call, e.g. a client request.
+    return await_(asyncio.sleep(0, x + 1))
+
+
+async def bench_spawn(fn, calls):
+    begin = time.perf_counter()
+    for i in range(calls):
+        await greenlet_spawn(fn, i)
+    return time.perf_counter() - begin
+
+
+async def bench_executor(fn, calls):
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, fn, 0) # Start the pool's threads
+    begin = time.perf_counter()
+    for i in range(calls):
+        await loop.run_in_executor(None, fn, i)
+    return time.perf_counter() - begin
+
+
+async def bench_direct(calls):
+    begin = time.perf_counter()
+    for i in range(calls):
+        noop(i)
+    return time.perf_counter() - begin
+
+
+async def main(calls, repeat):
+    cases = [
+        ('direct call (baseline)', lambda: bench_direct(calls)),
+        ('greenlet_spawn(noop)', lambda: bench_spawn(noop, calls)),
+        ('greenlet_spawn(one await_)', lambda: bench_spawn(one_await, calls)),
+        ('run_in_executor(noop)', lambda: bench_executor(noop, calls)),
+    ]
+    for name, case in cases:
+        best = min([await case() for _ in range(repeat)])
+        print(f"{name:28} {best / calls * 1e6:8.2f} us/call")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.repeat))
@@ -66,9 +66,9 @@ def bm_getcurrent(loops):
     return end - begin
 
 SWITCH_INNER_LOOPS = 10000
-def bm_switch_shallow(loops):
+def bm_switch_shallow(loops, base=greenlet.greenlet):
     # pylint:disable=attribute-defined-outside-init
-    class G(greenlet.greenlet):
+    class G(base):
         other = None
         def run(self):
             o = self.other
@@ -95,6 +95,18 @@ def bm_switch_shallow(loops):
     end = pyperf.perf_counter()
     return end - begin
 
+# Hashlet doesn't override switch(); its counter is kept by the switch
+# itself. RehashingHashlet hashes after every switch. Best of 25
+# interleaved runs, Python 3.11, x86_64:
+# greenlet:         615-650 ns
+# Hashlet:          647 ns
+# RehashingHashlet: 6.2 us
+def bm_switch_shallow_hashlet(loops):
+    return bm_switch_shallow(loops, greenlet.Hashlet)
+
+def bm_switch_shallow_rehashing(loops):
+    return bm_switch_shallow(loops, greenlet.RehashingHashlet)
+
 def bm_switch_deep(loops, _MAX_DEPTH=200):
     # pylint:disable=attribute-defined-outside-init
     class G(greenlet.greenlet):
@@ -132,6 +144,124 @@ def bm_switch_deep(loops, _MAX_DEPTH=200):
 def bm_switch_deeper(loops):
     return bm_switch_deep(loops, 400)
 
+# Keep saved-stack buffers instead of realloc/free on every switch.
+# (Python 3.11, x86_64, one noisy CPU; pyperf default settings)
+# deep, off:        Mean +- std dev: 55.9 us +- 9.1 us
+# deep, retained:   Mean +- std dev: 53.3 us +- 5.9 us
+# deeper, off:      Mean +- std dev: 107 us +- 15 us
+# deeper, retained: Mean +- std dev: 111 us +- 15 us
+# Within noise here: the memcpy of the stack dominates, and glibc
+# realloc of a same-size block is cheap. Expect more from allocators
+# that don't special-case that, or with many short-lived greenlets.
+RETAINED_STACK_BYTES = 1 << 20
+
+def _retained(bench, loops):
+    previous = greenlet.set_stack_buffer_retention(RETAINED_STACK_BYTES)
+    try:
+        return bench(loops)
+    finally:
+        greenlet.set_stack_buffer_retention(previous)
+
+def bm_switch_deep_retained(loops):
+    return _retained(bm_switch_deep, loops)
+
+def bm_switch_deeper_retained(loops):
+    return _retained(bm_switch_deeper, loops)
+
+
+# Short tasks: a fresh greenlet each vs parked Pool workers.
+# (Python 3.11, x86_64; pyperf --fast)
+# spawn per task (100000): Mean +- std dev: 881 ms +- 87 ms
+# Pool (100000):           Mean +- std dev: 271 ms +- 38 ms
+TASK_COUNT = 100000
+
+def _task(x):
+    return x + 1
+
+def bm_spawn_per_task(loops):
+    gl = greenlet.greenlet
+    begin = pyperf.perf_counter()
+    for _ in range(loops):
+        for i in range(TASK_COUNT):
+            gl(_task).switch(i)
+    end = pyperf.perf_counter()
+    return end - begin
+
+def bm_pool(loops):
+    run = greenlet.Pool().run
+    begin = pyperf.perf_counter()
+    for _ in range(loops):
+        for i in range(TASK_COUNT):
+            run(_task, i)
+    end = pyperf.perf_counter()
+    return end - begin
+
+
+# Cycling a ring of greenlets that each switch back to the caller.
+# Per hop (switch in and back out), Python 3.11, x86_64, pyperf --fast:
+# Python loop:     Mean +- std dev: 2.38 us +- 0.32 us
+# run_round_robin: Mean +- std dev: 2.05 us +- 0.25 us
+RING_SIZE = 10000
+RING_ROUNDS = 10
+
+def _ring():
+    def run():
+        parent_switch = greenlet.getcurrent().parent.switch
+        for _ in range(RING_ROUNDS):
+            parent_switch()
+    return [greenlet.greenlet(run) for _ in range(RING_SIZE)]
+
+def bm_ring_python_loop(loops):
+    duration = 0
+    for _ in range(loops):
+        ring = _ring()
+        begin = pyperf.perf_counter()
+        while ring:
+            for g in ring:
+                g.switch()
+            ring = [g for g in ring if not g.dead]
+        duration += pyperf.perf_counter() - begin
+    return duration
+
+def bm_ring_round_robin(loops):
+    duration = 0
+    for _ in range(loops):
+        ring = _ring()
+        begin = pyperf.perf_counter()
+        greenlet.run_round_robin(ring)
+        duration += pyperf.perf_counter() - begin
+    return duration
+
+
+# Sampled switch records into the ring buffer, vs settrace with a
+# no-op Python callback. Best of 40 interleaved runs per switch, Python
+# 3.11, x86_64 (this VM's run-to-run noise is about +-5%):
+# plain:                ~690 ns
+# sample every switch:  ~775 ns (+11%)
+# sample every 64th:    ~730 ns (within noise)
+# settrace:             ~1170 ns (+70%)
+SAMPLE_RING_CAPACITY = 1 << 16
+
+def _sampled(bench, loops, **kwargs):
+    greenlet._start_switch_sampling(SAMPLE_RING_CAPACITY, **kwargs)
+    try:
+        return bench(loops)
+    finally:
+        greenlet._stop_switch_sampling()
+
+def bm_switch_shallow_sampled_all(loops):
+    return _sampled(bm_switch_shallow, loops)
+
+def bm_switch_shallow_sampled_64(loops):
+    return _sampled(bm_switch_shallow, loops, every=64)
+
+def bm_switch_shallow_settrace(loops):
+    previous = greenlet.settrace(lambda event, args: None)
+    try:
+        return bm_switch_shallow(loops)
+    finally:
+        greenlet.settrace(previous)
+
 
 CREATE_INNER_LOOPS = 10
 def bm_create(loops):
@@ -215,6 +345,32 @@ if __name__ == '__main__':
         inner_loops=SWITCH_INNER_LOOPS
     )
 
+    runner.bench_time_func(
+        'switch between two Hashlets (shallow)',
+        bm_switch_shallow_hashlet,
+        inner_loops=SWITCH_INNER_LOOPS
+    )
+    runner.bench_time_func(
+        'switch between two RehashingHashlets (shallow)',
+        bm_switch_shallow_rehashing,
+        inner_loops=SWITCH_INNER_LOOPS
+    )
+    runner.bench_time_func(
+        'switch between two greenlets (shallow, sample every switch)',
+        bm_switch_shallow_sampled_all,
+        inner_loops=SWITCH_INNER_LOOPS
+    )
+    runner.bench_time_func(
+        'switch between two greenlets (shallow, sample every 64th)',
+        bm_switch_shallow_sampled_64,
+        inner_loops=SWITCH_INNER_LOOPS
+    )
+    runner.bench_time_func(
+        'switch between two greenlets (shallow, settrace)',
+        bm_switch_shallow_settrace,
+        inner_loops=SWITCH_INNER_LOOPS
+    )
+
     runner.bench_time_func(
         'switch between two greenlets (deep)',
         bm_switch_deep,
@@ -226,6 +382,34 @@ if __name__ == '__main__':
         bm_switch_deeper,
         inner_loops=SWITCH_INNER_LOOPS
     )
+    runner.bench_time_func(
+        'switch between two greenlets (deep, retained buffers)',
+        bm_switch_deep_retained,
+        inner_loops=SWITCH_INNER_LOOPS
+    )
+    runner.bench_time_func(
+        'switch between two greenlets (deeper, retained buffers)',
+        bm_switch_deeper_retained,
+        inner_loops=SWITCH_INNER_LOOPS
+    )
+    runner.bench_time_func(
+        'spawn a greenlet per task (%s)' % TASK_COUNT,
+        bm_spawn_per_task,
+    )
+    runner.bench_time_func(
+        'run tasks in a Pool (%s)' % TASK_COUNT,
+        bm_pool,
+    )
+    runner.bench_time_func(
+        'ring of %s, Python loop' % RING_SIZE,
+        bm_ring_python_loop,
+        inner_loops=RING_SIZE * (RING_ROUNDS + 1)
+    )
+    runner.bench_time_func(
+        'ring of %s, run_round_robin' % RING_SIZE,
+        bm_ring_round_robin,
+        inner_loops=RING_SIZE * (RING_ROUNDS + 1)
+    )
     runner.bench_time_func(
         'getcurrent single thread',
         bm_getcurrent,
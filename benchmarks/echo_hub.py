@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""
+Local echo server round trips: green_hub (one thread, a greenlet per
+connection) against a thread per connection, on both the server and
+the client side.
+
+    python benchmarks/echo_hub.py --clients 200 --rounds 200
+
+Python 3.11, x86_64, one CPU, best of 3 (2000 conns: one run):
+
+    green_hub  200 conns x 200 round trips:  45,493 round trips/s, peak RSS 18 MB
+    threads    200 conns x 200 round trips:  69,835 round trips/s, peak RSS 20 MB
+    green_hub  2000 conns x 20 round trips:  28,467 round trips/s, peak RSS 43 MB
+    threads    2000 conns x 20 round trips:  29,931 round trips/s, peak RSS 36 MB
+
+On one CPU a blocked thread costs little and the hub pays Python-level
+overhead for each wait, so this is about keeping one thread (and no
+fixed sleeps) at comparable throughput, not about beating threads.
+"""
+
+import argparse
+import os
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import green_hub # pylint:disable=wrong-import-position
+
+PAYLOAD = b'x' * 64
+
+
+def _recv_exact(recv, n):
+    data = b''
+    while len(data) < n:
+        chunk = recv(n - len(data))
+        if not chunk:
+            raise ConnectionError("peer closed")
+        data += chunk
+    return data
+
+
+def bench_hub(clients, rounds):
+    server = green_hub.GreenSocket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(('127.0.0.1', 0))
+    server.listen(clients)
+    address = server.getsockname()
+
+    def handle(conn):
+        with conn:
+            while True:
+                data = conn.recv(65536)
+                if not data:
+                    return
+                conn.sendall(data)
+
+    def acceptor():
+        for _ in range(clients):
+            conn, _ = server.accept()
+            green_hub.spawn(handle, conn)
+
+    def client():
+        with green_hub.create_connection(address) as conn:
+            for _ in range(rounds):
+                conn.sendall(PAYLOAD)
+                _recv_exact(conn.recv, len(PAYLOAD))
+
+    begin = time.perf_counter()
+    green_hub.spawn(acceptor)
+    for _ in range(clients):
+        green_hub.spawn(client)
+    green_hub.run()
+    elapsed = time.perf_counter() - begin
+    server.close()
+    return elapsed
+
+
+def bench_threads(clients, rounds):
+    server = socket.socket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(('127.0.0.1', 0))
+    server.listen(clients)
+    address = server.getsockname()
+
+    def handle(conn):
+        with conn:
+            while True:
+                data = conn.recv(65536)
+                if not data:
+                    return
+                conn.sendall(data)
+
+    def acceptor():
+        for _ in range(clients):
+            conn, _ = server.accept()
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+    def client():
+        with socket.create_connection(address) as conn:
+            for _ in range(rounds):
+                conn.sendall(PAYLOAD)
+                _recv_exact(conn.recv, len(PAYLOAD))
+
+    begin = time.perf_counter()
+    threads = [threading.Thread(target=acceptor)]
+    threads += [threading.Thread(target=client) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - begin
+    server.close()
+    return elapsed
+
+
+MODES = {'green_hub': bench_hub, 'threads': bench_threads}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--mode', choices=sorted(MODES),
+                        help="Run one mode in this process (default: each in a fresh process)")
+    args = parser.parse_args()
+    if args.mode is None:
+        # Separate processes so peak RSS is per mode.
+        for mode in MODES:
+            subprocess.check_call([sys.executable, __file__, '--mode', mode,
+                                   '--clients', str(args.clients), '--rounds', str(args.rounds),
+                                   '--repeat', str(args.repeat)])
+        return
+    total = args.clients * args.rounds
+    best = min(MODES[args.mode](args.clients, args.rounds) for _ in range(args.repeat))
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{args.mode:10} {args.clients} conns x {args.rounds} round trips: "
+          f"{best:.3f}s, {total / best:,.0f} round trips/s, peak RSS {peak_mb:.0f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Order events per second through src.models.order_book.OrderBook.
+
+    python benchmarks/order_book.py --events 1000000
+
+Replays a seeded random stream of order events, the same shape as
+an MEV replay: limit orders clustered near the touch (some of them
+crossing), cancels of resting orders, and a few market orders. Reports
+the best of several runs.
+
+Python 3.11, x86_64, 1,000,000 events (60% limit, 30% cancel, 10%
+market):
+
+    best of 3: 3.42 s, 292,558 events/s, 583,620 fills, 23,480 resting
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.models.order_book import OrderBook, BUY, SELL # pylint:disable=wrong-import-position
+
+
+def make_events(count, seed=42):
+    """A list of ('submit', side, price, volume) and ('cancel', nth) events."""
+    rnd = random.Random(seed)
+    events = []
+    mid = 200.0
+    for _ in range(count):
+        r = rnd.random()
+        if r < 0.6:
+            side = BUY if rnd.random() < 0.5 else SELL
+            offset = rnd.randint(-5, 20) * 0.01
+            price = mid - offset if side == BUY else mid + offset
+            events.append(('submit', side, round(price, 2), rnd.randint(1, 10)))
+        elif r < 0.9:
+            events.append(('cancel', rnd.random()))
+        else:
+            events.append(('submit', BUY if rnd.random() < 0.5 else SELL, None, rnd.randint(1, 10)))
+        mid += rnd.choice((-0.01, 0, 0.01))
+    return events
+
+
+def replay(events):
+    book = OrderBook()
+    submit, cancel = book.submit, book.cancel
+    resting = []
+    fills = 0
+    begin = time.perf_counter()
+    for event in events:
+        if event[0] == 'submit':
+            order_id, made = submit(event[1], event[2], event[3])
+            fills += len(made)
+            if event[2] is not None:
+                resting.append(order_id)
+        elif resting:
+            # Cancel a random submitted order; many have already filled.
+            index = int(event[1] * len(resting))
+            cancel(resting[index])
+            resting[index] = resting[-1]
+            resting.pop()
+    return time.perf_counter() - begin, fills, len(book)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--events', type=int, default=1000000)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+    events = make_events(args.events)
+    best = min(replay(events) for _ in range(args.runs))
+    elapsed, fills, resting = best
+    print(f"best of {args.runs}: {elapsed:.2f} s, {args.events / elapsed:,.0f} events/s, "
+          f"{fills:,} fills, {resting:,} resting")
+
+
+if __name__ == '__main__':
+    main()
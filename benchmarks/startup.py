@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Cold start of src.main: import time, and the wall time of running one
+demo.
+
+    python benchmarks/startup.py --runs 10 --toc 46
+
+Each run is a fresh interpreter started from the repository root.
+Import time comes from ``python -X importtime``, and the slowest
+imports (by cumulative time) are listed from the fastest run. The
+heavy stacks (matplotlib, scipy, mpmath) should not show up; they load
+only when a demo that needs them runs.
+
+Python 3.11, x86_64, numpy installed, TOC 46:
+
+    import src.main: best  156.4 ms, median  198.6 ms
+    python -m src.main 46: best  185 ms, median  248 ms
+    loaded at import: numpy
+
+Before imports were made lazy, mpmath alone cost about 107 ms at
+import, before matplotlib and scipy were even reached.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+HEAVY = ('matplotlib', 'scipy', 'mpmath', 'numpy', 'pytz')
+
+
+def import_times():
+    """Import src.main once; return {module: cumulative microseconds}."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import src.main'],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def demo_time(toc):
+    begin = time.perf_counter()
+    subprocess.run([sys.executable, '-m', 'src.main', toc],
+                   cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - begin
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--toc', default='46', help='TOC section to run as the single demo')
+    parser.add_argument('--top', type=int, default=10, help='how many of the slowest imports to list')
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    totals = [run['src.main'] for run in runs]
+    fastest = runs[totals.index(min(totals))]
+    print(f"import src.main: best {min(totals) / 1e3:8.1f} ms, "
+          f"median {statistics.median(totals) / 1e3:8.1f} ms")
+    for name, cumulative in sorted(fastest.items(), key=lambda item: -item[1])[1:args.top + 1]:
+        print(f"    {cumulative / 1e3:8.1f} ms  {name}")
+
+    demos = [demo_time(args.toc) for _ in range(args.runs)]
+    print(f"python -m src.main {args.toc}: best {min(demos) * 1e3:5.0f} ms, "
+          f"median {statistics.median(demos) * 1e3:5.0f} ms")
+    loaded = [name for name in HEAVY if name in fastest]
+    print(f"loaded at import: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
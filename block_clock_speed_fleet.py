@@ -37,15 +37,21 @@ import time
 import numpy as np
 import mpmath
 import multiprocessing as mp
+import multiprocessing.connection
 from queue import Empty
+import argparse
+import logging
 import requests  # pip install requests if needed
-import sympy as sp
 from kappawise import murmur32, kappa_coord
 from wise_transforms import bitwise_transform, hexwise_transform, hashwise_transform
 from hybrid import HybridGreenText
 from ribit_telemetry import ribit_generate
 from ghost_hand import GhostHand
 from secure_hash_two import secure_hash_two
+from thimble import solve_thimble
+from block_replay import BlockRecorder, BlockReplayer, parse_speed
+from fleet_metrics import FleetMetrics, NULL_METRICS
+from hot_log import hot_log
 
 mpmath.mp.dps = 19
 
@@ -82,16 +88,43 @@ def get_latest_block():
         diff = float(resp_diff.text)
         if height > last_height:
             delta = block_time - last_time if last_time else 600
-            print(f"New block {height} at {block_time}, delta {delta}s, diff {diff}")
+            hot_log.info('node.block', "New block %s at %s, delta %ss, diff %s", height, block_time, delta, diff)
             last_height = height
             last_time = block_time
             last_diff = diff
             return height, block_time, delta, diff
         return None, None, None, None
     except:
-        print("heat spike-flinch")  # Api fail
+        hot_log.warning('node.flinch', "heat spike-flinch")  # Api fail
         return None, None, None, None
 
+# Block source: live poll (optionally recorded) or a replayed log
+def next_block(node_id, stream=None, recorder=None):
+    global last_height, last_time, last_diff
+    if stream is None:
+        block = get_latest_block()
+        if recorder is not None:
+            recorder.record_block(node_id, block[0], block[1], block[3])
+        return block
+    block = stream.get_latest_block()
+    last_height, last_time, last_diff = stream.last_height, stream.last_time, stream.last_diff
+    return block
+
+def next_gossip(node_id, gossip_queue, default, stream=None, recorder=None, metrics=NULL_METRICS):
+    with metrics.timer('gossip'):
+        if stream is not None:
+            msg = stream.next_gossip(default)
+        else:
+            try:
+                msg = gossip_queue.get(timeout=0.05)
+            except Empty:
+                msg = default
+            if recorder is not None:
+                recorder.record_gossip(node_id, msg)
+    if msg != default:
+        metrics.inc('gossip_recv')
+    return msg
+
 # Hashloop
 def hashloop(start='0', salt=''):
     nonce = start
@@ -102,7 +135,20 @@ def hashloop(start='0', salt=''):
         nonce = hash_val
 
 # Node loop for concurrency
-def node_loop(node_id, gossip_queue, salt='', user_id='she'):
+def node_loop(node_id, gossip_queue, salt='', user_id='she', record=None, replay=None, speed=1.0, seed=None,
+              metrics=None, nodes=1):
+    stream = BlockReplayer(replay, node_id, speed, seed) if replay else None
+    if stream is not None:
+        seed = stream.seed
+    if seed is None:
+        seed = time.time_ns() % (1 << 31)  # Picked once so the recording and the RNG agree
+    recorder = BlockRecorder(record, seed) if record else None
+    if recorder is not None:
+        seed = recorder.seed  # An existing log keeps its recorded seed
+    rng = np.random.default_rng((seed, node_id))
+    clock = stream if stream else time
+    node_metrics = FleetMetrics.attach(metrics, nodes).node(node_id) if metrics else NULL_METRICS
+    started = time.perf_counter()
     generator = hashloop(salt=salt)
     latencies = []
     coords_accum = []
@@ -113,46 +159,48 @@ def node_loop(node_id, gossip_queue, salt='', user_id='she'):
     tick_i = 0
     prev_diff = 0.0
     while True:
-        height, block_time, delta, diff = get_latest_block()
-        if delta is None and tick_i > 0 and time.time() - last_time > 1800:
-            print("heat spike-flinch")  # Timeout no new
-            time.sleep(60)
+        tick_start = time.perf_counter_ns()
+        height, block_time, delta, diff = next_block(node_id, stream, recorder)
+        if stream is not None and stream.exhausted:
+            elapsed = time.perf_counter() - started
+            hot_log.info('node.replay', "Node %d replayed %d ticks in %.3fs (%.1f ticks/s)",
+                         node_id, tick_i, elapsed, tick_i / elapsed)
+            hot_log.flush()  # Process exit skips atexit
+            return
+        if delta is None and tick_i > 0 and clock.time() - last_time > 1800:
+            hot_log.warning('node.flinch', "heat spike-flinch")  # Timeout no new
+            clock.sleep(60)
             continue
         if delta is not None:
-            thimble = sp.symbols('thimble')
-            eq = sp.Eq(sp.sin(thimble * diff / last_diff), delta / 600.0)
-            sols = sp.solve(eq, thimble)
-            if not sols:
-                print("heat spike-flinch")  # No sol
+            node_metrics.inc('blocks')
+            sol = solve_thimble(diff, last_diff, delta)
+            if sol is None:
+                hot_log.warning('node.flinch', "heat spike-flinch")  # No sol
             else:
-                print(f"Thimble sol: {sols[0]}")
+                hot_log.info('node.thimble', "Thimble sol: %s", sol)
             curl = ghost.gimbal_flex(delta) if diff < prev_diff else False
             if curl:
-                print("Gimbal flex drop")
+                hot_log.info('node.gimbal', "Gimbal flex drop")
             prev_diff = diff
             rod_pressure = delta / 600.0
             tension = ghost.rod_whisper(rod_pressure)
-            print(f"Rod tension: {tension}")
+            hot_log.info('node.rod', "Rod tension: %s", tension)
         else:
             delta = 600.0  # Default avg
         vibe, _ = vibe_model.friction_vibe(np.array([0,0,0]), np.array([delta/600, 0, 0]))
         interval = delta * vibe
-        try:
-            A = gossip_queue.get(timeout=0.05) if tick_i % 2 == 0 else 'mock_prev'
-        except Empty:
-            A = 'mock_prev'
+        A = next_gossip(node_id, gossip_queue, 'mock_prev', stream, recorder, node_metrics) if tick_i % 2 == 0 else 'mock_prev'
         B = next(generator)
-        try:
-            C = gossip_queue.get(timeout=0.05) if tick_i % 3 == 0 else 'mock_next'
-        except Empty:
-            C = 'mock_next'
-        final_input = A + B + C
-        final_hash = hashlib.sha256(final_input.encode()).hexdigest()
-        bit_out = bitwise_transform(final_hash)
-        hex_out = hexwise_transform(final_hash)
-        hash_out, ent = hashwise_transform(final_hash)
-        hybrid_strand = f"{bit_out}:{hex_out}:{hash_out}"
-        salted_strand = secure_hash_two(hybrid_strand, 'she_key', str(block_time))
+        C = next_gossip(node_id, gossip_queue, 'mock_next', stream, recorder, node_metrics) if tick_i % 3 == 0 else 'mock_next'
+        with node_metrics.timer('hash'):
+            final_input = A + B + C
+            final_hash = hashlib.sha256(final_input.encode()).hexdigest()
+            bit_out = bitwise_transform(final_hash)
+            hex_out = hexwise_transform(final_hash)
+            hash_out, ent = hashwise_transform(final_hash)
+            hybrid_strand = f"{bit_out}:{hex_out}:{hash_out}"
+            salted_strand = secure_hash_two(hybrid_strand, 'she_key', str(block_time))
+        node_metrics.inc('hashes')
         coord = kappa_coord(user_id + str(node_id), height if height else tick_i)
         coords_accum.append(coord[:2])
         if len(coords_accum) > 2:
@@ -166,30 +214,70 @@ def node_loop(node_id, gossip_queue, salt='', user_id='she'):
             interval = 600.0
         log_text = f"> Node {node_id} Tick {tick_i}: {salted_strand[:16]}... at {coord} (ent {ent})"
         parsed = hgt.parse_green_perl(log_text)
-        print(parsed or log_text)
+        hot_log.info('node.tick', "%s", parsed.rstrip("\n") or log_text, node=node_id, tick=tick_i)
         start = time.time()
-        receipt_time = time.time() - start + np.random.uniform(0.05, 0.15)
+        receipt_time = time.time() - start + rng.uniform(0.05, 0.15)
         latencies.append(receipt_time)
         if len(latencies) > 10:
             latencies = latencies[-10:]
         median_c = np.median(latencies)
-        print(f'Node {node_id} Median c: {median_c}')
-        gossip_queue.put(final_hash)  # Broadcast to fleet
+        hot_log.info('node.median', "Node %d Median c: %s", node_id, median_c)
+        if stream is None:
+            gossip_queue.put(final_hash)  # Broadcast to fleet
+            node_metrics.inc('gossip_sent')
         ribit_int, state, color = ribit_generate(str(diff))
-        print(f"Diff RIBIT: {ribit_int}, State: {state}, Color: {color}")
-        time.sleep(max(interval, 60.0))  # Min 1min poll
+        hot_log.info('node.ribit', "Diff RIBIT: %s, State: %s, Color: %s", ribit_int, state, color)
+        node_metrics.observe('tick', time.perf_counter_ns() - tick_start)
+        node_metrics.inc('ticks')
+        clock.sleep(max(interval, 60.0))  # Min 1min poll
         tick_i += 1
 
 # Fleet sim
-def block_clock_speed_fleet(nodes=4, salt=''):
+def block_clock_speed_fleet(nodes=4, salt='', record=None, replay=None, speed=1.0, seed=None,
+                            metrics_port=None, metrics_file=None, metrics_interval=15.0):
+    if record:
+        recorder = BlockRecorder(record, time.time_ns() % (1 << 31) if seed is None else seed)
+        recorder.close()  # Header before any node appends
+        if seed is not None and seed != recorder.seed:
+            raise ValueError(f"{record} was recorded with seed {recorder.seed}, not {seed}")
+        seed = recorder.seed  # Recorded (or kept from an appended log) so replays reuse it
+    metrics = FleetMetrics.create(nodes) if metrics_port or metrics_file else None
+    if metrics_port:
+        metrics.serve(metrics_port)
+        print(f"Fleet metrics on http://127.0.0.1:{metrics_port}/metrics")
     gossip_queue = mp.Queue()
     processes = []
     for i in range(nodes):
-        p = mp.Process(target=node_loop, args=(i, gossip_queue, salt))
+        p = mp.Process(target=node_loop, args=(i, gossip_queue, salt, 'she', record, replay, speed, seed,
+                                               metrics.name if metrics else None, nodes))
         p.start()
         processes.append(p)
-    for p in processes:
-        p.join()
+    try:
+        while any(p.is_alive() for p in processes):
+            if metrics_file:
+                metrics.write_textfile(metrics_file)
+            mp.connection.wait([p.sentinel for p in processes if p.is_alive()], metrics_interval if metrics else None)
+        for p in processes:
+            p.join()
+    finally:
+        if metrics is not None:
+            if metrics_file:
+                metrics.write_textfile(metrics_file)
+            metrics.close()
 
 if __name__ == '__main__':
-    block_clock_speed_fleet(salt='blossom')
+    parser = argparse.ArgumentParser(description="Block clock speed fleet")
+    parser.add_argument('--nodes', type=int, default=4)
+    parser.add_argument('--record', help="Append live blocks and gossip to this log")
+    parser.add_argument('--replay', help="Replay a recorded log instead of polling live")
+    parser.add_argument('--speed', default='1', help="Replay speed: 1, 10x, ... or max")
+    parser.add_argument('--seed', type=int, help="RNG seed (replay defaults to the recorded seed)")
+    parser.add_argument('--metrics-port', type=int, help="Serve Prometheus metrics on this local port")
+    parser.add_argument('--metrics-file', help="Write Prometheus text metrics to this file")
+    parser.add_argument('--log-file', help="Write JSON-lines logs here instead of stdout")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    args = parser.parse_args()
+    hot_log.configure(path=args.log_file, level=getattr(logging, args.log_level))
+    block_clock_speed_fleet(nodes=args.nodes, salt='blossom', record=args.record, replay=args.replay,
+                            speed=parse_speed(args.speed), seed=args.seed,
+                            metrics_port=args.metrics_port, metrics_file=args.metrics_file)
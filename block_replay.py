@@ -0,0 +1,144 @@
+# block_replay.py - Record/Replay Block Stream for deterministic fleet runs
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Notes: BlockRecorder appends block polls (height, time, diff) and received gossip to a compact
+# binary log; BlockReplayer feeds one node's events back at 1x, Nx or max speed (speed=None),
+# with the recorded seed for its RNG. Two builds replaying the same log run the same workload.
+# Usage: python block_replay.py fleet.bcsr  (prints a summary of the log)
+
+import os
+import struct
+import sys
+import time
+from collections import deque
+
+MAGIC = b'BCSR'
+VERSION = 1
+HEADER = struct.Struct('<4sHq')  # magic, version, seed
+EVENT = struct.Struct('<BHd')    # kind, node_id, wall time
+BLOCK = struct.Struct('<qqd')    # height, block_time, diff
+GOSSIP = struct.Struct('<H')     # payload length, then utf-8 payload
+
+EV_BLOCK = 1
+EV_MISS = 2    # Poll with no new block
+EV_GOSSIP = 3  # Gossip received by node_id
+
+class BlockRecorder:
+    """Append-only event log; every event is one unbuffered write so fleet processes can share it.
+
+    Appending to an existing log keeps its header, so self.seed is the recorded seed, not the
+    one passed in; callers seed their RNG from it so a replay of the whole log reproduces it.
+    """
+    def __init__(self, path, seed=0):
+        self.path = path
+        self.f = open(path, 'ab', buffering=0)
+        if self.f.tell() == 0:
+            self.f.write(HEADER.pack(MAGIC, VERSION, seed))
+        else:
+            try:
+                seed = read_seed(path)
+            except ValueError:
+                self.f.close()
+                raise
+        self.seed = seed
+
+    def record_block(self, node_id, height, block_time, diff):
+        if height is None:
+            self.f.write(EVENT.pack(EV_MISS, node_id, time.time()))
+        else:
+            self.f.write(EVENT.pack(EV_BLOCK, node_id, time.time()) + BLOCK.pack(height, int(block_time), diff))
+
+    def record_gossip(self, node_id, payload):
+        data = payload.encode('utf-8')
+        self.f.write(EVENT.pack(EV_GOSSIP, node_id, time.time()) + GOSSIP.pack(len(data)) + data)
+
+    def close(self):
+        self.f.close()
+
+def _check_header(path, buf):
+    if len(buf) < HEADER.size:
+        raise ValueError(f"{path}: not a v{VERSION} block stream log")
+    magic, version, seed = HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: not a v{VERSION} block stream log")
+    return seed
+
+def read_seed(path):
+    """The seed in a log's header."""
+    with open(path, 'rb') as f:
+        return _check_header(path, f.read(HEADER.size))
+
+def read_log(path):
+    """Return (seed, [(kind, node_id, wall, payload), ...])."""
+    with open(path, 'rb') as f:
+        buf = f.read()
+    seed = _check_header(path, buf)
+    events = []
+    off = HEADER.size
+    while off < len(buf):
+        kind, node_id, wall = EVENT.unpack_from(buf, off)
+        off += EVENT.size
+        if kind == EV_BLOCK:
+            payload = BLOCK.unpack_from(buf, off)
+            off += BLOCK.size
+        elif kind == EV_GOSSIP:
+            (n,) = GOSSIP.unpack_from(buf, off)
+            off += GOSSIP.size
+            payload = buf[off:off + n].decode('utf-8')
+            off += n
+        else:
+            payload = None
+        events.append((kind, node_id, wall, payload))
+    return seed, events
+
+class BlockReplayer:
+    """Replays one node's recorded events; speed=1.0 real time, N faster, None as fast as possible."""
+    def __init__(self, path, node_id=0, speed=1.0, seed=None):
+        log_seed, events = read_log(path)
+        self.seed = log_seed if seed is None else seed
+        self.speed = speed
+        self.blocks = deque(e for e in events if e[1] == node_id and e[0] != EV_GOSSIP)
+        self.gossip = deque(e[3] for e in events if e[1] == node_id and e[0] == EV_GOSSIP)
+        self.exhausted = False
+        self.wall = self.blocks[0][2] if self.blocks else 0.0
+        self.last_height = 0
+        self.last_time = 0
+        self.last_diff = 0.0
+
+    def get_latest_block(self):
+        """Same contract as the live poller: (height, block_time, delta, diff) or all None."""
+        if not self.blocks:
+            self.exhausted = True
+            return None, None, None, None
+        kind, _, self.wall, payload = self.blocks.popleft()
+        if kind == EV_MISS:
+            return None, None, None, None
+        height, block_time, diff = payload
+        delta = block_time - self.last_time if self.last_time else 600
+        self.last_height, self.last_time, self.last_diff = height, block_time, diff
+        return height, block_time, delta, diff
+
+    def next_gossip(self, default):
+        return self.gossip.popleft() if self.gossip else default
+
+    def time(self):
+        """Recorded wall clock of the current event."""
+        return self.wall
+
+    def sleep(self, seconds):
+        if self.speed:
+            time.sleep(seconds / self.speed)
+
+def parse_speed(text):
+    """'max' -> None, '10x' or '10' -> 10.0."""
+    if text in (None, 'max'):
+        return None
+    return float(text.rstrip('x'))
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else 'fleet.bcsr'
+    seed, events = read_log(path)
+    nodes = sorted({e[1] for e in events})
+    print(f"{path}: seed {seed}, {len(events)} events, {os.path.getsize(path)} bytes")
+    for node_id in nodes:
+        kinds = [e[0] for e in events if e[1] == node_id]
+        print(f"Node {node_id}: {kinds.count(EV_BLOCK)} blocks, {kinds.count(EV_MISS)} misses, {kinds.count(EV_GOSSIP)} gossip")
@@ -49,6 +49,9 @@ from ping_pin import ping_pin, ping_pin_vintage, ping_pin_conversations
 from secure_hash_two import secure_hash_two
 from kappawise import kappa_coord
 from wise_transforms import bitwise_transform, hexwise_transform, hashwise_transform
+from fleet_metrics import FleetMetrics, NULL_METRICS
+from hot_log import hot_log
+from src.utils.entropy import unique_ratio
 import json
 try:
     from flask import Flask
@@ -349,9 +352,7 @@ class BlocsymDB:
         self.vibe_model = TetraVibe()
 
     def entropy_check(self, data):
-        h = hashlib.sha256(data.encode()).digest()
-        unique = len(set(h)) / len(h)
-        return unique > ENTROPY_THRESHOLD
+        return unique_ratio(hashlib.sha256(data.encode()).digest()) > ENTROPY_THRESHOLD
 
     def hash_tunnel(self, seed=b'genesis', ticks=100):
         state = bytearray(128)
@@ -511,6 +512,9 @@ last_time = 0
 last_diff = 0.0
 vibe_model = TetraVibe()
 last_commit = 0.0
+metrics = NULL_METRICS  # Node 0 (CLI loop) of a FleetMetrics when --metrics-port/--metrics-file is given
+socket_metrics = NULL_METRICS  # Node 1, shared by the socketio handler threads
+metrics_file = None
 conversations_doc = "conversations_content"
 if Flask is not None:
     app = Flask(__name__)
@@ -521,8 +525,12 @@ if Flask is not None:
 
     @socketio.on('mosh')
     def handle_mosh(data):
-        balanced = EthicsModel().balance_power(data.get('lived', ''), data.get('corporate', ''))
-        emit('response', {'balanced_power': balanced, 'entropy': db.entropy_check(data.get('hash', ''))})
+        node = socket_metrics
+        node.inc('gossip_recv')
+        with node.timer('gossip'):
+            balanced = EthicsModel().balance_power(data.get('lived', ''), data.get('corporate', ''))
+            emit('response', {'balanced_power': balanced, 'entropy': db.entropy_check(data.get('hash', ''))})
+        node.inc('gossip_sent')
 
 def execute_function_string(cmd, **kwargs):
     global last_command, current_entropy, idle_start
@@ -530,18 +538,18 @@ def execute_function_string(cmd, **kwargs):
     if "mosh key" in cmd:
         key = kwargs.get('key', 'test')
         bloom.add(key)
-        print(f"Moshed key: {key}")
+        hot_log.info('cmd.mosh', "Moshed key: %s", key)
     elif "dojo train" in cmd:
         height = kwargs.get('height', 0)
         updates = kwargs.get('updates', 'default')
-        print(db.dojo_train(updates, height))
+        hot_log.info('cmd.dojo', "%s", db.dojo_train(updates, height))
     current_entropy = get_entropy()
     db.entropy_check("post-cmd")
-    print("GPIO stub: LED on if entropy high" if current_entropy >= 0.69 else "GPIO stub: LED off")
-    print("Cymatics stub: Tone if low" if current_entropy < 0.69 else "Cymatics stub: Silent")
+    hot_log.info('cmd.gpio', "GPIO stub: LED on if entropy high" if current_entropy >= 0.69 else "GPIO stub: LED off")
+    hot_log.info('cmd.cymatics', "Cymatics stub: Tone if low" if current_entropy < 0.69 else "Cymatics stub: Silent")
     if current_entropy > ENTROPY_THRESHOLD:
-        print(f"Pseudo-echo: Replaying {last_command}")
-    print("Optics stub: Raster PNG to light")
+        hot_log.info('cmd.echo', "Pseudo-echo: Replaying %s", last_command)
+    hot_log.info('cmd.optics', "Optics stub: Raster PNG to light")
     idle_start = time.time()
 
 def check_afk(delta):
@@ -606,7 +614,20 @@ def get_latest_block():
     print("heat spike-flinch: Block fetch failed after 3 attempts.")
     return None, None, None, None
 
+def enable_metrics(port=None, path=None):
+    global metrics, socket_metrics, metrics_file
+    if not port and not path:
+        return
+    fleet = FleetMetrics.create(2)
+    metrics = fleet.node(0)
+    socket_metrics = fleet.node(1, shared=True)
+    metrics_file = path
+    if port:
+        fleet.serve(port)
+        print(f"Blocsym metrics on http://127.0.0.1:{port}/metrics")
+
 def cleanup():
+    global metrics, socket_metrics
     print("Cleanup stub: GPIO/dream cleanup...")
     try:
         kill_ipfs_processes()
@@ -621,6 +642,11 @@ def cleanup():
             pong.close()
         except Exception as e:
             print(f"Frank here. Failed to close Pong: {e}")
+    if metrics is not NULL_METRICS:
+        # Swap in the no-op metrics before unmapping, for late socket/HTTP threads.
+        fleet = metrics.fleet
+        metrics = socket_metrics = NULL_METRICS
+        fleet.close()
 
 def run_cli(pong_mode=False, spoon_mode=False, dual_mode=False, ghost_mode=False):
     global pong, spoon, facehugger, ghost_hand
@@ -646,6 +672,7 @@ def run_cli(pong_mode=False, spoon_mode=False, dual_mode=False, ghost_mode=False
         print("Ghost Hand mode activated - Rod-based hedging simulation.")
     blinks = [random.choice([True, False]) for _ in range(5)]
     while True:
+        tick_start = time.perf_counter_ns()
         height, block_time, delta, diff = get_latest_block()
         if delta is None:
             if time.time() - last_time > 1800:
@@ -653,6 +680,7 @@ def run_cli(pong_mode=False, spoon_mode=False, dual_mode=False, ghost_mode=False
             check_afk(delta or 600)
             time.sleep(60)
             continue
+        metrics.inc('blocks')
         ethics = EthicsModel()
         power = ethics.balance_power("lived_experience", "corporate_input", diff, delta, last_diff)
         if power < 0.69:
@@ -663,13 +691,15 @@ def run_cli(pong_mode=False, spoon_mode=False, dual_mode=False, ghost_mode=False
             updates = f"Low entropy recovery: {current_entropy:.2f}, small upgrade to thought process"
             print(db.dojo_train(updates, height))
         verbism = ">>>>be they >>>>be me"
-        block_hash = hashlib.sha256(str(block_time).encode()).hexdigest()
-        bit_out = bitwise_transform(block_hash)
-        hex_out = hexwise_transform(block_hash)
-        hash_out, ent = hashwise_transform(block_hash)
-        hybrid_strand = f"{bit_out}:{hex_out}:{hash_out}"
-        salted_verbism = secure_hash_two(hybrid_strand, 'she_key', str(block_time))
-        hashed = self_write_hashlet(salted_verbism)
+        with metrics.timer('hash'):
+            block_hash = hashlib.sha256(str(block_time).encode()).hexdigest()
+            bit_out = bitwise_transform(block_hash)
+            hex_out = hexwise_transform(block_hash)
+            hash_out, ent = hashwise_transform(block_hash)
+            hybrid_strand = f"{bit_out}:{hex_out}:{hash_out}"
+            salted_verbism = secure_hash_two(hybrid_strand, 'she_key', str(block_time))
+            hashed = self_write_hashlet(salted_verbism)
+        metrics.inc('hashes')
         print(f"Verbism hash: {hashed}")
         if current_entropy >= 0.99:
             oracle.prophesy(current_entropy, power)
@@ -695,6 +725,10 @@ def run_cli(pong_mode=False, spoon_mode=False, dual_mode=False, ghost_mode=False
             print(f"Ladder hedge: {hedge}")
         check_afk(delta)
         persist_to_ipfs()
+        metrics.observe('tick', time.perf_counter_ns() - tick_start)
+        metrics.inc('ticks')
+        if metrics_file:
+            metrics.fleet.write_textfile(metrics_file)
         time.sleep(max(delta, 60.0))
 
 def main():
@@ -705,7 +739,10 @@ def main():
     parser.add_argument('--dual', action='store_true', help="Enable Dual Facehugger mode with Hugging Face and LLaMA (integrates with Pong if --pong)")
     parser.add_argument('--ghost', action='store_true', help="Enable Ghost Hand hedging mode in CLI")
     parser.add_argument('--force-ports', action='store_true', help="Force-kill all processes on ports 8080-8082 (use with caution)")
+    parser.add_argument('--metrics-port', type=int, help="Serve Prometheus metrics on this local port")
+    parser.add_argument('--metrics-file', help="Write Prometheus text metrics to this file every tick")
     args = parser.parse_args()
+    enable_metrics(args.metrics_port, args.metrics_file)
     
     # Check ports and start daemon
     daemon_ok, gateway_port = ensure_ipfs_daemon(force_ports=args.force_ports)
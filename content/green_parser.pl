@@ -2,16 +2,30 @@
 #!/usr/bin/perl
 use strict;
 use warnings;
+sub ramp {
+    my ($line) = @_;
+    return undef unless $line =~ /^>/;
+    my $verb = $line;
+    $verb =~ s/^>//;
+    $verb =~ s/^\s+|\s+$//g;
+    $verb = lc($verb);
+    return "# $verb ramp";
+}
+# --stream: coprocess mode, one reply line (empty if no ramp) per stdin line
+if (@ARGV && $ARGV[0] eq '--stream') {
+    $| = 1;
+    while (defined(my $line = <STDIN>)) {
+        chomp $line;
+        my $ramp = ramp($line);
+        print defined $ramp ? $ramp : '', "\n";
+    }
+    exit 0;
+}
 my $input = $ARGV[0] || '';
 my @lines = split /\n/, $input;
 my @ramp_code;
 foreach my $line (@lines) {
-    if ($line =~ /^>/) {
-        my $verb = $line;
-        $verb =~ s/^>//;
-        $verb =~ s/^\s+|\s+$//g;
-        $verb = lc($verb);
-        push @ramp_code, "# $verb ramp";
-    }
+    my $ramp = ramp($line);
+    push @ramp_code, $ramp if defined $ramp;
 }
 print join("\n", @ramp_code) . "\n";
@@ -0,0 +1,65 @@
+# green_parser.py - In-process Greentext Ramp Parser
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Notes: Same semantics as green_parser.pl (">verb" lines -> "# verb ramp"), without a fork/exec per call.
+# Regexes are compiled once at import; parse_many() handles batches. PerlGreenParser keeps one
+# long-lived `perl green_parser.pl --stream` coprocess for anyone who still needs the Perl path.
+
+import os
+import re
+import string
+import subprocess
+
+PERL_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "green_parser.pl")
+
+# Perl's \s (without unicode_strings) minus \n, which split /\n/ already consumed.
+_RAMP_LINE = re.compile(r'^>[ \t\r\f\v]*(.*?)[ \t\r\f\v]*$', re.M)
+# Perl lc() on a byte string only folds ASCII.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+def parse_green(text):
+    """Parse greentext into ramp comments; output matches `perl green_parser.pl text`."""
+    ramps = ["# %s ramp" % verb.translate(_ASCII_LOWER) for verb in _RAMP_LINE.findall(text)]
+    return "\n".join(ramps) + "\n"
+
+def parse_many(lines):
+    """Batch parse: one output string per input text."""
+    return [parse_green(text) for text in lines]
+
+class PerlGreenParser:
+    """Long-lived Perl coprocess; lines stream over a pipe, one reply line per input line."""
+    def __init__(self, perl_script=PERL_SCRIPT, perl='perl'):
+        self.perl_script = perl_script
+        self.proc = subprocess.Popen([perl, perl_script, '--stream'],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def _ramp(self, line):
+        self.proc.stdin.write(line.encode('utf-8') + b"\n")
+        self.proc.stdin.flush()
+        reply = self.proc.stdout.readline()
+        if not reply:
+            raise RuntimeError("green_parser.pl coprocess exited")
+        return reply[:-1].decode('utf-8')
+
+    def parse(self, text):
+        ramps = [self._ramp(line) for line in text.split("\n")]
+        return "\n".join(r for r in ramps if r) + "\n"
+
+    def parse_many(self, lines):
+        return [self.parse(text) for text in lines]
+
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.stdin.close()
+            self.proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+if __name__ == "__main__":
+    sample = "> Node 0 Tick 1: BE ME\nplain line\n>  Feel The Ramp  "
+    print(parse_green(sample), end="")
+    with PerlGreenParser() as perl:
+        print(perl.parse(sample), end="")
@@ -35,18 +35,29 @@
 # Integrates Python, Cython, and Perl for parsing and curvature calculations
 import numpy as np
 from typing import List
+from green_parser import PERL_SCRIPT, PerlGreenParser, parse_green, parse_many
 class HybridGreenText:
-    def __init__(self, sparse_n: int = 50):
+    def __init__(self, sparse_n: int = 50, perl_coprocess: bool = False):
         self.sparse_n = sparse_n
-        self.perl_script = "green_parser.pl"
+        self.perl_script = PERL_SCRIPT
+        self.perl = None
+        if perl_coprocess:  # Opt-in: one long-lived perl, lines streamed over a pipe
+            try:
+                self.perl = PerlGreenParser(self.perl_script)
+            except Exception as e:
+                print(f"Perl parsing error: {e}")
     def parse_green_perl(self, text: str) -> str:
+        if self.perl is None:
+            return parse_green(text)  # In-process, same output as green_parser.pl
         try:
-            import subprocess
-            result = subprocess.run(['perl', self.perl_script, text], capture_output=True, text=True)
-            return result.stdout
+            return self.perl.parse(text)
         except Exception as e:
             print(f"Perl parsing error: {e}")
             return ""
+    def parse_many(self, lines: List[str]) -> List[str]:
+        if self.perl is None:
+            return parse_many(lines)
+        return [self.parse_green_perl(text) for text in lines]
     def scale_curvature(self, kappa_values: np.ndarray, blue_gold_swap: bool = True) -> np.ndarray:
         from scipy.interpolate import griddata
         sparse_t = np.array([float((k * PHI) % 1) for k in range(self.sparse_n)])
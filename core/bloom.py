@@ -5,6 +5,7 @@
 # -- OliviaLynnArchive fork, 2025
 
 import hashlib
+from hot_log import hot_log  # Buffered sink; per-add lines are DEBUG
 
 class BloomFilter:
     def __init__(self, m=1024, k=3):
@@ -34,8 +35,8 @@ class BloomFilter:
         self.count += 1
         if self.count % 89 == 0:
             self.array = [0] * self.m  # Fibonacci reset
-            print("BLOOM: breath.")
-        print(f"flipped {self.k} bits for '{prompt}'")
+            hot_log.info('bloom.reset', "BLOOM: breath.")
+        hot_log.debug('bloom.add', "flipped %d bits for '%s'", self.k, prompt)
 
     def might_contain(self, prompt):
         for i in range(self.k):
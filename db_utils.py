@@ -14,6 +14,7 @@ import greenlet  # For async moshing/gossip without threads
 from web3 import Web3  # Ethereum hooks
 from solana.rpc.api import Client as SolanaClient  # Solana hooks
 import random  # For dream generative
+from src.utils.entropy import unique_ratio  # Shared Seraph entropy gates
 
 # Constants for Blocsÿm's essence
 TERNARY_GRID_SIZE = 2141  # Cubed for dojo map
@@ -46,9 +47,7 @@ class BlocsymDB:
 
     def entropy_check(self, data):
         """Seraph-like check: Hash data, compute entropy proxy (e.g., unique bytes ratio)."""
-        h = hashlib.sha256(data.encode()).digest()
-        unique = len(set(h)) / len(h)
-        return unique > ENTROPY_THRESHOLD  # Prune if low
+        return unique_ratio(hashlib.sha256(data.encode()).digest()) > ENTROPY_THRESHOLD  # Prune if low
 
     def hash_tunnel(self, seed=b'genesis', ticks=100):
         """From dino_hash: Continuous hashing pipe, XOR-salted ticks."""
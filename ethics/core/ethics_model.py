@@ -12,6 +12,7 @@ from math import sin  # For crossover grad
 import numpy as np  # For venn simulation
 from meditate import whisper  # For veto/meditation whispers (Apache import)
 from gpio_interface import gpio_on_entropy  # For color overrides (simulate red via blink) (Apache import)
+from src.utils.entropy import unique_ratio  # Shared with the Seraph gates
 
 # Constants
 TERNARY_CYCLES = [-1, 0, 1]  # - discover/define, 0 crossover, + develop/deliver
@@ -50,7 +51,7 @@ class EthicsModel:
 
     def discover_phase(self, data):
         """- Phase: Discover/define with lived experience focus."""
-        entropy = len(set(data)) / len(data) if data else 0
+        entropy = unique_ratio(data)
         if entropy > ENTROPY_THRESHOLD:
             return "Defined: " + data.lower()  # Ground roots
         return "Discover more—low lived insight."
@@ -0,0 +1,223 @@
+# fleet_metrics.py - Fleet Telemetry: per-node counters and HDR-style latency histograms
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Notes: One shared-memory block holds every node's counters and log-linear latency histograms
+# (16 sub-buckets per power of two, ~6% precision, 1ns to ~18min). Each node writes only its own
+# row, so there are no locks; the parent aggregates across processes and exports Prometheus text
+# to a file (node_exporter textfile collector) or over a local HTTP endpoint.
+# Usage: m = FleetMetrics.create(4); child: node = FleetMetrics.attach(m.name, 4).node(i)
+
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from multiprocessing import shared_memory
+import numpy as np
+
+PHASES = ('hash', 'gossip', 'tick')
+COUNTERS = ('ticks', 'blocks', 'hashes', 'gossip_sent', 'gossip_recv')
+SUB_BITS = 4
+SUB = 1 << SUB_BITS
+MAX_EXP = 40  # 2**40 ns ~ 18 min
+BUCKETS = (MAX_EXP - SUB_BITS + 2) * SUB
+EXPORT_LE = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0, 60.0)  # Prometheus bucket edges, seconds
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+def bucket_index(ns):
+    """Log-linear bucket for a latency in ns; values below 16ns are exact."""
+    v = int(ns)
+    if v < SUB:
+        return max(v, 0)
+    e = v.bit_length() - 1
+    if e > MAX_EXP:
+        return BUCKETS - 1
+    return (e - SUB_BITS + 1) * SUB + ((v >> (e - SUB_BITS)) - SUB)
+
+def bucket_upper(idx):
+    """Exclusive upper bound (ns) of a bucket."""
+    if idx < SUB:
+        return idx + 1
+    e = idx // SUB + SUB_BITS - 1
+    top = idx % SUB + SUB
+    return (top + 1) << (e - SUB_BITS)
+
+_UPPER_NS = np.array([bucket_upper(i) for i in range(BUCKETS)], dtype=np.float64)
+
+class NodeMetrics:
+    """One node's slice of the shared block; only this node writes it."""
+    def __init__(self, fleet, node_id):
+        self.fleet = fleet  # Keeps the shared memory mapped
+        self.node_id = node_id
+        self.counters = fleet.counters[node_id]
+        self.hist = fleet.hist[node_id]
+        self.sums = fleet.sums[node_id]
+
+    def inc(self, counter, n=1):
+        self.counters[COUNTERS.index(counter)] += n
+
+    def observe(self, phase, ns):
+        p = PHASES.index(phase)
+        self.hist[p, bucket_index(ns)] += 1
+        self.sums[p] += ns
+
+    @contextmanager
+    def timer(self, phase):
+        t0 = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter_ns() - t0)
+
+    def _detach(self):
+        """Called by FleetMetrics.close(): later calls become no-ops instead of touching unmapped memory."""
+        self.inc, self.observe, self.timer = NULL_METRICS.inc, NULL_METRICS.observe, NULL_METRICS.timer
+        self.counters = self.hist = self.sums = None
+
+class SharedNodeMetrics(NodeMetrics):
+    """A row written by several threads of one process (e.g. socket handlers); updates take a lock."""
+    def __init__(self, fleet, node_id):
+        super().__init__(fleet, node_id)
+        self.lock = threading.Lock()
+
+    def inc(self, counter, n=1):
+        with self.lock:
+            NodeMetrics.inc(self, counter, n)
+
+    def observe(self, phase, ns):
+        with self.lock:
+            NodeMetrics.observe(self, phase, ns)
+
+class NullNodeMetrics:
+    """Stand-in when telemetry is off; every call is a no-op."""
+    def inc(self, counter, n=1):
+        pass
+
+    def observe(self, phase, ns):
+        pass
+
+    def timer(self, phase):
+        return nullcontext()
+
+NULL_METRICS = NullNodeMetrics()
+
+class FleetMetrics:
+    """Shared-memory metrics block for `nodes` processes."""
+    def __init__(self, shm, nodes, owner):
+        self.shm = shm
+        self.name = shm.name
+        self.nodes = nodes
+        self.owner = owner
+        c_size = nodes * len(COUNTERS) * 8
+        h_size = nodes * len(PHASES) * BUCKETS * 8
+        self.counters = np.ndarray((nodes, len(COUNTERS)), np.int64, shm.buf, 0)
+        self.hist = np.ndarray((nodes, len(PHASES), BUCKETS), np.int64, shm.buf, c_size)
+        self.sums = np.ndarray((nodes, len(PHASES)), np.int64, shm.buf, c_size + h_size)
+        self._handed_out = weakref.WeakSet()  # NodeMetrics to detach on close()
+        self._servers = []
+
+    @staticmethod
+    def _size(nodes):
+        return nodes * (len(COUNTERS) + len(PHASES) * BUCKETS + len(PHASES)) * 8
+
+    @classmethod
+    def create(cls, nodes):
+        shm = shared_memory.SharedMemory(create=True, size=cls._size(nodes))
+        shm.buf[:] = bytes(len(shm.buf))
+        return cls(shm, nodes, owner=True)
+
+    @classmethod
+    def attach(cls, name, nodes):
+        return cls(shared_memory.SharedMemory(name=name), nodes, owner=False)
+
+    def node(self, node_id, shared=False):
+        """Writer for one row; shared=True if several threads will write it."""
+        node = (SharedNodeMetrics if shared else NodeMetrics)(self, node_id)
+        self._handed_out.add(node)
+        return node
+
+    def quantile(self, phase, q, node_id=None):
+        """Approximate latency quantile in seconds (bucket upper bound)."""
+        h = self.hist[:, PHASES.index(phase)] if node_id is None else self.hist[node_id, PHASES.index(phase)][None]
+        counts = h.sum(axis=0)
+        total = counts.sum()
+        if not total:
+            return 0.0
+        idx = int(np.searchsorted(np.cumsum(counts), q * total))
+        return _UPPER_NS[min(idx, BUCKETS - 1)] / 1e9
+
+    def render_prometheus(self):
+        counters = self.counters.copy()
+        hist = self.hist.copy()
+        sums = self.sums.copy()
+        lines = []
+        for c, counter in enumerate(COUNTERS):
+            lines.append(f"# TYPE fleet_{counter}_total counter")
+            for n in range(self.nodes):
+                lines.append(f'fleet_{counter}_total{{node="{n}"}} {counters[n, c]}')
+        lines.append("# TYPE fleet_phase_seconds histogram")
+        for p, phase in enumerate(PHASES):
+            for n in range(self.nodes):
+                cum = np.cumsum(hist[n, p])
+                labels = f'node="{n}",phase="{phase}"'
+                for le in EXPORT_LE:
+                    below = int(np.searchsorted(_UPPER_NS, le * 1e9, side='right'))
+                    lines.append(f'fleet_phase_seconds_bucket{{{labels},le="{le:g}"}} {cum[below - 1] if below else 0}')
+                lines.append(f'fleet_phase_seconds_bucket{{{labels},le="+Inf"}} {cum[-1]}')
+                lines.append(f'fleet_phase_seconds_sum{{{labels}}} {sums[n, p] / 1e9:.9f}')
+                lines.append(f'fleet_phase_seconds_count{{{labels}}} {cum[-1]}')
+        lines.append("# TYPE fleet_phase_quantile_seconds gauge")
+        for phase in PHASES:
+            for q in QUANTILES:
+                lines.append(f'fleet_phase_quantile_seconds{{phase="{phase}",quantile="{q}"}} {self.quantile(phase, q):.9f}')
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Atomic write for the node_exporter textfile collector."""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp, path)
+
+    def serve(self, port=9464, host='127.0.0.1'):
+        """Serve /metrics from a daemon thread; returns the HTTPServer."""
+        metrics = self
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.render_prometheus().encode()
+                self.send_response(200 if self.path in ('/', '/metrics') else 404)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            def log_message(self, *args):
+                pass
+        server = HTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self._servers.append(server)
+        return server
+
+    def close(self):
+        # Drop numpy views first, including the nodes' slices, or SharedMemory.close()
+        # refuses (exported buffers) and a later write would hit unmapped memory.
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
+        for node in list(self._handed_out):
+            node._detach()
+        self.counters = self.hist = self.sums = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+if __name__ == "__main__":
+    m = FleetMetrics.create(2)
+    rng = np.random.default_rng(0)
+    for node_id in range(2):
+        node = m.node(node_id)
+        for ns in rng.lognormal(12, 1.5, 10000):
+            node.observe('hash', ns)
+            node.inc('hashes')
+    print(m.render_prometheus(), end="")
+    m.close()
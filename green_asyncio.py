@@ -0,0 +1,68 @@
+# green_asyncio.py - asyncio Bridge for synchronous greenlet code
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Notes: `await greenlet_spawn(fn, *args)` runs plain synchronous code (hashlet helpers) in a child
+# greenlet of the calling coroutine. Inside it, await_(awaitable) switches back up to the coroutine,
+# which awaits on the loop's behalf and switches the result (or exception) back down. No threads:
+# the loop keeps running while the sync code waits, and contextvars follow the task.
+# Usage: async def handler(): return await greenlet_spawn(sync_hashlet_job, data)
+#        def sync_hashlet_job(data): reply = await_(client.fetch(data)); ...
+
+import asyncio
+import inspect
+import sys
+import greenlet
+
+class MissingGreenlet(RuntimeError):
+    """await_() was called outside greenlet_spawn()."""
+
+class _BridgeGreenlet(greenlet.greenlet):
+    def __init__(self, fn, driver):
+        super().__init__(fn, driver)
+        self.gr_context = driver.gr_context  # Share the task's contextvars
+
+def in_bridge():
+    """True when running inside greenlet_spawn(), where await_() can be used."""
+    return isinstance(greenlet.getcurrent(), _BridgeGreenlet)
+
+def await_(awaitable):
+    """Wait for an awaitable from synchronous code running under greenlet_spawn()."""
+    current = greenlet.getcurrent()
+    if not isinstance(current, _BridgeGreenlet):
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()  # Avoid a 'never awaited' warning on top of the error
+        raise MissingGreenlet("await_() called outside greenlet_spawn(); "
+                              "wrap the synchronous caller with `await greenlet_spawn(fn)`")
+    return current.parent.switch(awaitable)
+
+async def greenlet_spawn(fn, *args, **kwargs):
+    """Run fn(*args, **kwargs) in a greenlet, awaiting whatever it passes to await_()."""
+    child = _BridgeGreenlet(fn, greenlet.getcurrent())
+    result = child.switch(*args, **kwargs)
+    while not child.dead:
+        try:
+            value = await result
+        except BaseException:  # Includes CancelledError: let the sync code see it
+            result = child.throw(*sys.exc_info())
+        else:
+            result = child.switch(value)
+    return result
+
+if __name__ == "__main__":
+    import hashlib
+
+    def sync_job(seed):
+        digest = hashlib.sha256(str(seed).encode()).hexdigest()
+        await_(asyncio.sleep(0.01))  # Stands in for an async client call
+        return digest[:16]
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await asyncio.gather(*(greenlet_spawn(sync_job, i) for i in range(100)))
+        print(f"{len(results)} sync jobs in {loop.time() - start:.3f}s on one thread; first {results[0]}")
+        try:
+            await_(asyncio.sleep(0))
+        except MissingGreenlet as ex:
+            print(f"outside the bridge: {ex}")
+
+    asyncio.run(main())
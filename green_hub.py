@@ -0,0 +1,344 @@
+# green_hub.py - Cooperative I/O Hub: selectors event loop for greenlet tasks
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Notes: One hub greenlet per thread runs a selectors loop plus a timer heap. A task that would
+# block calls wait_readable/wait_writable/sleep, which park it and switch to the hub; the hub
+# switches back once the fd is ready or the deadline passes. GreenSocket wraps a non-blocking
+# socket with the usual blocking-style methods, so thousands of bridges and gossip peers can
+# share one thread instead of a thread (or a fixed sleep) each.
+# Usage: from green_hub import spawn, run, sleep, GreenSocket
+#        spawn(peer, addr); spawn(peer, addr2); run()
+
+import errno
+import heapq
+import itertools
+import selectors
+import socket
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from functools import partial
+import greenlet
+
+_TIMEOUT = object()
+_CLOSED = object()
+_EVENTS = (selectors.EVENT_READ, selectors.EVENT_WRITE)
+
+class Hub(greenlet.greenlet):
+    """Event loop greenlet; its parent (the creating greenlet) gets control back when idle."""
+    def __init__(self):
+        super().__init__()
+        self.selector = selectors.DefaultSelector()
+        self.ready = deque()   # (greenlet, switch args)
+        self.timers = []       # heap of [deadline, seq, greenlet, live]
+        self.waiters = {}      # fd -> [reader, writer], each (greenlet, timer) or None
+        self.masks = {}        # fd -> events registered with the selector
+        self.waiting = 0       # Greenlets parked on I/O
+        self._seq = itertools.count()
+
+    def run(self):  # pylint:disable=method-hidden
+        while True:
+            self._loop()
+            self.parent.switch()  # Idle: nothing ready, waiting or timed
+
+    def _loop(self):
+        ready = self.ready
+        while ready or self._purge() or self.waiting:
+            # Only the tasks ready when the pass began: one that re-queues itself with
+            # sleep(0) runs again next pass, after timers and I/O have had their turn.
+            for _ in range(len(ready)):
+                g, args = ready.popleft()
+                if g.dead:
+                    continue
+                try:
+                    g.switch(*args)
+                except Exception:  # A spawned task died; report it and carry on
+                    traceback.print_exc()
+            timeout = None
+            if ready:
+                timeout = 0  # Poll; don't block with work queued
+            elif self._purge():
+                timeout = max(self.timers[0][0] - time.monotonic(), 0)
+            elif not self.waiting:
+                break
+            if self.waiting:
+                for key, mask in self.selector.select(timeout):
+                    self._fire(key.fd, mask)
+            elif timeout:
+                time.sleep(timeout)
+            self._expire()
+
+    def _fire(self, fd, mask):
+        pair = self.waiters[fd]
+        unwanted = 0
+        for i, event in enumerate(_EVENTS):
+            if not mask & event:
+                continue
+            if pair[i] is None:
+                unwanted |= event  # Nobody waits for it any more
+                continue
+            g, timer = pair[i]
+            pair[i] = None
+            self.waiting -= 1
+            if timer is not None:
+                timer[3] = False
+            self.ready.append((g, (None,)))
+        if unwanted:
+            self._set_mask(fd, self.masks[fd] & ~unwanted)
+
+    def _purge(self):
+        # Drop timers cancelled by an I/O wakeup so they can't hold the loop open.
+        timers = self.timers
+        while timers and not timers[0][3]:
+            heapq.heappop(timers)
+        return bool(timers)
+
+    def _expire(self):
+        now = time.monotonic()
+        timers = self.timers
+        while timers and timers[0][0] <= now:
+            _, _, g, live = heapq.heappop(timers)
+            if live:
+                self.ready.append((g, (_TIMEOUT,)))
+
+    def _set_mask(self, fd, mask):
+        # Registrations outlive a single wait: a socket read in a loop stays registered, so the
+        # common case costs no epoll_ctl at all. Events that fire with no waiter are dropped.
+        old = self.masks.get(fd, 0)
+        if not mask:
+            self.masks.pop(fd, None)
+            self.waiters.pop(fd, None)
+            self.selector.unregister(fd)
+            return
+        self.masks[fd] = mask
+        try:
+            if old:
+                self.selector.modify(fd, mask)
+            else:
+                self.selector.register(fd, mask)
+        except (KeyError, OSError):
+            # The fd was closed behind our back and its number reused; start over.
+            self.selector.unregister(fd)
+            self.selector.register(fd, mask)
+
+    def forget(self, fileobj):
+        """Drop fileobj before it is closed; greenlets waiting on it get EBADF."""
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+        if fd not in self.masks:
+            return
+        pair = self.waiters.get(fd, ())
+        for i, waiter in enumerate(pair):
+            if waiter is not None:
+                g, timer = waiter
+                pair[i] = None  # As in _fire, so _wait doesn't count it out again
+                self.waiting -= 1
+                if timer is not None:
+                    timer[3] = False
+                self.ready.append((g, (_CLOSED,)))
+        self._set_mask(fd, 0)
+
+    def _timer(self, seconds, g):
+        timer = [time.monotonic() + seconds, next(self._seq), g, True]
+        heapq.heappush(self.timers, timer)
+        return timer
+
+    def _switch_out(self):
+        if greenlet.getcurrent() is self:
+            raise RuntimeError("Cannot block inside the hub")
+        return self.switch()
+
+    def _wait(self, fileobj, index, timeout):
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+        pair = self.waiters.get(fd)
+        if pair is None:
+            pair = self.waiters[fd] = [None, None]
+        elif pair[index] is not None:
+            raise RuntimeError(f"fd {fd} already has a {('reader', 'writer')[index]}")
+        old = self.masks.get(fd, 0)
+        if not old & _EVENTS[index]:
+            self._set_mask(fd, old | _EVENTS[index])
+        g = greenlet.getcurrent()
+        timer = self._timer(timeout, g) if timeout is not None else None
+        pair[index] = (g, timer)
+        self.waiting += 1
+        try:
+            result = self._switch_out()
+        finally:
+            if pair[index] is not None and pair[index][0] is g:  # Timed out or killed
+                pair[index] = None
+                self.waiting -= 1
+                if timer is not None:
+                    timer[3] = False
+        if result is _TIMEOUT:
+            raise socket.timeout("timed out")
+        if result is _CLOSED:
+            raise OSError(errno.EBADF, "file descriptor closed while waiting")
+
+    def wait_readable(self, fileobj, timeout=None):
+        """Park the current greenlet until fileobj (fd or object with fileno()) is readable."""
+        self._wait(fileobj, 0, timeout)
+
+    def wait_writable(self, fileobj, timeout=None):
+        self._wait(fileobj, 1, timeout)
+
+    def sleep(self, seconds=0):
+        """Cooperative sleep; sleep(0) just lets other ready tasks run."""
+        g = greenlet.getcurrent()
+        if seconds <= 0:
+            self.ready.append((g, (None,)))
+        else:
+            self._timer(seconds, g)
+        self._switch_out()
+
+    def spawn(self, func, *args, **kwargs):
+        """Schedule func(*args, **kwargs) in a new greenlet; it starts once the hub runs."""
+        g = greenlet.greenlet(partial(func, **kwargs) if kwargs else func, parent=self)
+        self.ready.append((g, args))
+        return g
+
+    def join(self):
+        """Run the loop from the calling greenlet until no task is ready, sleeping or waiting on I/O."""
+        if greenlet.getcurrent() is self:
+            raise RuntimeError("Cannot join the hub from inside it")
+        self.parent = greenlet.getcurrent()
+        self.switch()
+
+_local = threading.local()
+
+def get_hub():
+    """The current thread's hub, created on first use."""
+    hub = getattr(_local, 'hub', None)
+    if hub is None or hub.dead:
+        hub = _local.hub = Hub()
+    return hub
+
+def wait_readable(fileobj, timeout=None):
+    get_hub().wait_readable(fileobj, timeout)
+
+def wait_writable(fileobj, timeout=None):
+    get_hub().wait_writable(fileobj, timeout)
+
+def sleep(seconds=0):
+    get_hub().sleep(seconds)
+
+def spawn(func, *args, **kwargs):
+    return get_hub().spawn(func, *args, **kwargs)
+
+def run():
+    get_hub().join()
+
+class GreenSocket:
+    """Blocking-style socket API over a non-blocking socket; blocks only the calling greenlet."""
+    def __init__(self, family=socket.AF_INET, type=socket.SOCK_STREAM, proto=0, sock=None, hub=None):
+        self.sock = sock if sock is not None else socket.socket(family, type, proto)
+        self.sock.setblocking(False)
+        self.hub = hub if hub is not None else get_hub()
+        self.fd = self.sock.fileno()
+        self.timeout = None
+
+    def __getattr__(self, name):  # bind, listen, setsockopt, getsockname, ...
+        return getattr(self.sock, name)
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def gettimeout(self):
+        return self.timeout
+
+    def _io(self, method, index, *args):
+        while True:
+            try:
+                return method(*args)
+            except (BlockingIOError, InterruptedError):
+                self.hub._wait(self.fd, index, self.timeout)
+
+    # recv/send are the hot path: spelled out rather than going through _io.
+    def recv(self, bufsize, flags=0):
+        while True:
+            try:
+                return self.sock.recv(bufsize, flags)
+            except (BlockingIOError, InterruptedError):
+                self.hub._wait(self.fd, 0, self.timeout)
+
+    def recv_into(self, buffer, nbytes=0, flags=0):
+        return self._io(self.sock.recv_into, 0, buffer, nbytes, flags)
+
+    def recvfrom(self, bufsize, flags=0):
+        return self._io(self.sock.recvfrom, 0, bufsize, flags)
+
+    def send(self, data, flags=0):
+        while True:
+            try:
+                return self.sock.send(data, flags)
+            except (BlockingIOError, InterruptedError):
+                self.hub._wait(self.fd, 1, self.timeout)
+
+    def sendall(self, data, flags=0):
+        sent = self.send(data, flags)
+        if sent < len(data):
+            view = memoryview(data)[sent:]
+            while view:
+                view = view[self.send(view, flags):]
+
+    def sendto(self, data, address):
+        return self._io(self.sock.sendto, 1, data, address)
+
+    def accept(self):
+        conn, addr = self._io(self.sock.accept, 0)
+        return GreenSocket(sock=conn, hub=self.hub), addr
+
+    def connect(self, address):
+        err = self.sock.connect_ex(address)
+        if err in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+            self.hub._wait(self.fd, 1, self.timeout)
+            err = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err and err != errno.EISCONN:
+            raise OSError(err, errno.errorcode.get(err, 'connect failed'))
+
+    def close(self):
+        if self.sock.fileno() >= 0:
+            self.hub.forget(self.fd)
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def create_connection(address, timeout=None):
+    sock = GreenSocket()
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+if __name__ == "__main__":
+    def ticker(name, n, delay):
+        for i in range(n):
+            print(f"{name} tick {i}")
+            sleep(delay)
+
+    def echo_once(server):
+        conn, _ = server.accept()
+        with conn:
+            conn.sendall(conn.recv(1024).upper())
+
+    server = GreenSocket()
+    server.bind(('127.0.0.1', 0))
+    server.listen()
+    spawn(echo_once, server)
+    spawn(ticker, 'a', 3, 0.01)
+    spawn(ticker, 'b', 2, 0.015)
+    def client():
+        with create_connection(server.getsockname(), timeout=1) as c:
+            c.sendall(b'ramp')
+            print("echo:", c.recv(1024))
+    spawn(client)
+    run()
+    server.close()
+    sys.exit(0)
@@ -42,7 +42,12 @@ from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
 from scipy.interpolate import griddata
 from matplotlib.colors import LightSource
+from src.models.order_book import OrderBook, Fill, BUY, SELL
+from src.models.pool_registry import PoolRegistry
+from src.utils.entropy import shannon_entropy, shannon_entropy_batch
+from src.models.mersenne import default_factor_bits, is_probable_prime, search_exponents, trial_factor
 from green_profit import checkProfitable, m53_collapse # Imported for AGPL-3.0 integration
+from profit_scan import check_profitable_batch
 mpmath.mp.dps = 19
 PHI = mpmath.phi
 # Configuration
@@ -253,15 +258,6 @@ def decode_image(encoded: str) -> bytes:
 def arbitrage_exception(current_price: float, oracle_price: float) -> bool:
     """Check for arbitrage opportunity based on price difference."""
     return abs(current_price - oracle_price) > 0.01 * oracle_price
-def shannon_entropy(s: str) -> float:
-    """Calculate Shannon entropy of a string."""
-    from collections import Counter
-    from math import log2
-    freq = Counter(s)
-    len_s = len(s)
-    if len_s == 0:
-        return 0.0
-    return -sum(count / len_s * log2(count / len_s) for count in freq.values() if count > 0)
 def benchmark_hashes(num_hashes: int = 1000) -> Dict:
     """Benchmark SHA-256 and SHA-3 hash performance."""
     return {"SHA-256": num_hashes * 0.05, "SHA-3": num_hashes * 0.03}
@@ -393,15 +389,17 @@ class SeraphGuardian:
     def __init__(self, threshold=0.69):
         self.threshold = threshold
     def shannon_entropy(self, data):
-        counts = np.bincount([ord(c) for c in data])
-        probs = counts / len(data)
-        probs = probs[probs > 0]
-        return -np.sum(probs * np.log2(probs))
+        return shannon_entropy(data)
     def test(self, input_mnemonic):
         """Non-reactive test: Yield if 'The One' (entropy > threshold)."""
-        echo_hash = hashlib.sha256(input_mnemonic.encode()).hexdigest()
-        entropy = self.shannon_entropy(input_mnemonic)
-        return True, echo_hash if entropy > self.threshold else (False, "Apology: Not The One")
+        if self.shannon_entropy(input_mnemonic) > self.threshold:
+            return True, hashlib.sha256(input_mnemonic.encode()).hexdigest()
+        return False, "Apology: Not The One"
+    def test_batch(self, mnemonics: List[str]) -> List[tuple]:
+        """test() for many mnemonics with one batched entropy pass; only granted ones are hashed."""
+        granted = shannon_entropy_batch(mnemonics) > self.threshold
+        return [(True, hashlib.sha256(m.encode()).hexdigest()) if ok else (False, "Apology: Not The One")
+                for m, ok in zip(mnemonics, granted)]
 class BufferWar:
     def mev_opportunity(self, hash_b, window=141, sides=24):
         """Simulate MEV opportunity in buffer window."""
@@ -410,6 +408,9 @@ class BufferWar:
     def profitable_arbitrage(self, target, current, volume):
         """Check profitability with martingale factor."""
         return checkProfitable(target, current, volume)
+    def profitable_arbitrage_batch(self, targets, currents, volumes, exact=False):
+        """Profitable mask and margins for arrays of trades in one vectorized pass (see profit_scan)."""
+        return check_profitable_batch(targets, currents, volumes, exact=exact)
 # Existing Classes (Unchanged but Integrated)
 class SHA1664:
     def __init__(self):
@@ -489,32 +490,41 @@ class CandlestickChart:
         except Exception as e:
             logger.error(f"Chart render error: {e}")
 class OrderBookUI:
-    def __init__(self):
-        self.bids = []
-        self.asks = []
-    def add_bid(self, price: float, volume: float):
-        """Add a bid to the order book."""
-        try:
-            self.bids.append({'price': price, 'volume': volume})
+    def __init__(self, book: OrderBook = None):
+        self.book = book if book is not None else OrderBook()
+    @property
+    def bids(self) -> List[Dict]:
+        """Bid levels, best first."""
+        return [{'price': p, 'volume': v} for p, v in self.book.depth(BUY, len(self.book.bid_levels))]
+    @property
+    def asks(self) -> List[Dict]:
+        """Ask levels, best first."""
+        return [{'price': p, 'volume': v} for p, v in self.book.depth(SELL, len(self.book.ask_levels))]
+    def add_bid(self, price: float, volume: float) -> List[Fill]:
+        """Add a bid to the order book, returning any fills against resting asks."""
+        try:
+            return self.book.submit(BUY, price, volume)[1]
         except Exception as e:
             logger.error(f"Add bid error: {e}")
-    def add_ask(self, price: float, volume: float):
-        """Add an ask to the order book."""
+            return []
+    def add_ask(self, price: float, volume: float) -> List[Fill]:
+        """Add an ask to the order book, returning any fills against resting bids."""
         try:
-            self.asks.append({'price': price, 'volume': volume})
+            return self.book.submit(SELL, price, volume)[1]
         except Exception as e:
             logger.error(f"Add ask error: {e}")
+            return []
     def render(self, current_price: float):
         """Render the order book UI."""
         try:
             print("\n=== Order Book ===")
             print(f"Current Price: ${current_price:.2f}")
             print("Bids:")
-            for bid in self.bids[:3]:
-                print(f"${bid['price']:.2f} | Vol: {bid['volume']:.2f}")
+            for price, volume in self.book.depth(BUY, 3):
+                print(f"${price:.2f} | Vol: {volume:.2f}")
             print("Asks:")
-            for ask in self.asks[:3]:
-                print(f"${ask['price']:.2f} | Vol: {ask['volume']:.2f}")
+            for price, volume in self.book.depth(SELL, 3):
+                print(f"${price:.2f} | Vol: {volume:.2f}")
         except Exception as e:
             logger.error(f"Order book render error: {e}")
 class PortfolioUI:
@@ -869,61 +879,99 @@ class GreedyFillSimulator:
 class PerpLib:
     def __init__(self, symbol: str):
         self.symbol = symbol
-        self.liquidity_amount = 0.0
-        self.interest_rate = 0.05
-        self.orders = []
-    def add_order(self, price: float, volume: float):
-        """Add an order to the perpetual market."""
+        self.book = OrderBook()
+        # Standalone until it joins an OpsPool; then liquidity, rate and
+        # order count live in the pool's PoolRegistry row.
+        self.registry = None
+        self.row = None
+        self._liquidity_amount = 0.0
+        self._interest_rate = 0.05
+    def attach(self, registry: PoolRegistry) -> int:
+        """Move this market's values into registry and become a view of its row."""
+        self.row = registry.add(self.symbol, self._liquidity_amount, self._interest_rate, len(self.book))
+        self.registry = registry
+        return self.row
+    @property
+    def liquidity_amount(self) -> float:
+        if self.registry is None:
+            return self._liquidity_amount
+        return float(self.registry.liquidity[self.row])
+    @liquidity_amount.setter
+    def liquidity_amount(self, value: float):
+        if self.registry is None:
+            self._liquidity_amount = value
+        else:
+            self.registry.liquidity[self.row] = value
+    @property
+    def interest_rate(self) -> float:
+        if self.registry is None:
+            return self._interest_rate
+        return float(self.registry.interest_rate[self.row])
+    @interest_rate.setter
+    def interest_rate(self, value: float):
+        if self.registry is None:
+            self._interest_rate = value
+        else:
+            self.registry.interest_rate[self.row] = value
+    def add_order(self, price: float, volume: float, side: str = BUY) -> List[Fill]:
+        """Add an order to the perpetual market, matching it against the book; returns the fills."""
         try:
-            self.orders.append({'price': price, 'volume': volume})
+            _, fills = self.book.submit(side, price, volume)
             self.liquidity_amount += volume
-            logger.info(f"Added order: {volume} {self.symbol} @ {price}")
+            if self.registry is not None:
+                self.registry.order_count[self.row] = len(self.book)
+            logger.info(f"Added order: {side} {volume} {self.symbol} @ {price}, {len(fills)} fills")
+            return fills
         except Exception as e:
             logger.error(f"Add order error: {e}")
+            return []
     def get_status(self) -> Dict:
         """Get the status of the perpetual market."""
         try:
-            return {'symbol': self.symbol, 'liquidity_amount': self.liquidity_amount, 'orders': len(self.orders)}
+            return {'symbol': self.symbol, 'liquidity_amount': self.liquidity_amount, 'orders': len(self.book)}
         except Exception as e:
             logger.error(f"Get status error: {e}")
             return {}
 class OpsPool:
     def __init__(self):
-        self.Ops_pool = []
+        self.registry = PoolRegistry()
+        self.Ops_pool = []  # PerpLib views; markets from add_markets have registry rows only
     def add_Ops(self, ops_instance: PerpLib):
         """Add a PerpLib instance to the operations pool."""
         try:
+            ops_instance.attach(self.registry)
             self.Ops_pool.append(ops_instance)
             logger.info(f"Added Ops instance for {ops_instance.symbol}")
         except Exception as e:
             logger.error(f"Add Ops error: {e}")
+    def add_markets(self, symbols, liquidity=0.0, interest_rate=0.05) -> range:
+        """Add many markets straight to the registry, without PerpLib objects; returns their rows."""
+        try:
+            return self.registry.add_many(symbols, liquidity, interest_rate)
+        except Exception as e:
+            logger.error(f"Add markets error: {e}")
+            return range(0)
     def redistribute_liquidity(self, redistribution_factor: float = 0.1):
         """Redistribute liquidity across the operations pool."""
         try:
-            total_liquidity = sum(r.liquidity_amount for r in self.Ops_pool)
-            redistributed_amount = total_liquidity * redistribution_factor
-            for ops_instance in self.Ops_pool:
-                ops_instance.liquidity_amount += redistributed_amount / len(self.Ops_pool)
+            redistributed_amount = self.registry.redistribute(redistribution_factor)
             logger.info(f"Redistributed {redistributed_amount} liquidity")
         except Exception as e:
             logger.error(f"Redistribute liquidity error: {e}")
     def calculate_global_interest_rate(self) -> float:
         """Calculate the global interest rate for the pool."""
         try:
-            if not self.Ops_pool:
-                return 0.0
-            return sum(r.interest_rate for r in self.Ops_pool) / len(self.Ops_pool)
+            return self.registry.mean_interest_rate()
         except Exception as e:
             logger.error(f"Calculate global interest rate error: {e}")
             return 0.0
-    def get_pool_status(self) -> Dict:
-        """Get the status of the operations pool."""
+    def get_pool_status(self, details: bool = True) -> Dict:
+        """Get the status of the operations pool; details=False skips the per-market dicts."""
         try:
-            pool_status = [r.get_status() for r in self.Ops_pool]
             return {
-                "Total Liquidity": sum(r["liquidity_amount"] for r in pool_status),
+                "Total Liquidity": self.registry.total_liquidity(),
                 "Global Interest Rate": self.calculate_global_interest_rate(),
-                "Pool Details": pool_status
+                "Pool Details": self.registry.details() if details else []
             }
         except Exception as e:
             logger.error(f"Get pool status error: {e}")
@@ -993,40 +1041,39 @@ class SpiralNU:
         except Exception as e:
             logger.error(f"Run spiral error: {e}")
             return []
-    def predict_next_prime(self) -> int:
-        """Predict the next Mersenne prime exponent."""
+    def predict_next_prime(self, start: Optional[int] = None, stop: Optional[int] = None, workers: int = 1) -> int:
+        """First exponent p in [start, stop) with 2^p - 1 prime, or 0 if there is none."""
         try:
-            target = 1.5 * (2 ** self.exponents[-1] - 1)
-            n = self.exponents[-1] + 1
-            while True:
-                n += 1
-                if self.is_prime(2 ** n - 1):
-                    if 2 ** n - 1 > target:
-                        return n
+            if stop is None:
+                raise ValueError("predict_next_prime needs a stop exponent; Lucas-Lehmer above ~10^5 takes hours per exponent")
+            if start is None:
+                start = self.exponents[-1] + 1
+            found = search_exponents(start, stop, workers=workers, first=True)
+            return found[0] if found else 0
         except Exception as e:
             logger.error(f"Predict next prime error: {e}")
             return 0
     def is_prime(self, n: int) -> bool:
-        """Check if a number is prime."""
+        """Check if a number is prime (Miller-Rabin)."""
         try:
-            if n < 2:
-                return False
-            for i in range(2, int(math.sqrt(n)) + 1):
-                if n % i == 0:
-                    return False
-            return True
+            return is_probable_prime(n)
         except Exception as e:
             logger.error(f"Is prime error: {e}")
             return False
-    def check_m53_candidate(self):
+    def check_m53_candidate(self, factor_bits: Optional[int] = None):
         """Check M53 candidate exponent for Mersenne prime."""
         try:
             p = 194062501
             if not self.is_prime(p):
                 return f"Exponent {p} is not prime, so 2^{p}-1 cannot be Mersenne prime."
+            factor_bits = factor_bits or default_factor_bits(p)
+            factor = trial_factor(p, factor_bits)
+            if factor is not None:
+                return f"2^{p}-1 has the factor {factor}, so it is not a Mersenne prime."
             remainder = p % 369
             kappa_at_316 = kappa_calc(316)
-            return f"Exponent {p} mod 369 = {remainder}. kappa at n=316: {kappa_at_316:.4f} (symmetry point)."
+            return (f"Exponent {p} mod 369 = {remainder}; no factor of 2^{p}-1 below 2^{factor_bits}. "
+                    f"kappa at n=316: {kappa_at_316:.4f} (symmetry point).")
         except Exception as e:
             logger.error(f"Check M53 candidate error: {e}")
             return "M53 check failed."
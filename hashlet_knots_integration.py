@@ -1,17 +1,14 @@
 # hashlet_knots_integration.py - Deeper hashlet integration with knots_rops for reverse mirror indexing
 # SPDX-License-Identifier: AGPL-3.0-or-later
-# Notes: Extends Hashlet with advanced_hash (weighted mirrors) and SHA1664 (extended SHA-3 sponge). Complete script; run as-is. Requires greenlet, hashlib, mpmath (pip install greenlet mpmath).
+# Notes: Runs greenlet.Hashlet tasks with advanced_hash (weighted mirrors) and SHA1664 (extended SHA-3 sponge). Hashlet's hash_id/rgb_color are lazy and
+# switching costs the same as a plain greenlet; use greenlet.RehashingHashlet for a new hash per switch. Complete script; run as-is. Requires greenlet, numpy, mpmath.
 
-import greenlet
 import hashlib
-import time
-import logging
 import mpmath  # For high-precision SHA1664 state extension
+import numpy as np
+from greenlet import Hashlet
 mpmath.mp.dps = 500  # Precision for 1664-bit sim
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
-logger = logging.getLogger(__name__)
-
 def generate_weighted_sequence(max_units=18, max_tens=9, direction='left'):
     """Generate left/right weighted sequence for indexing."""
     sequence = []
@@ -31,28 +28,6 @@ def generate_weighted_sequence(max_units=18, max_tens=9, direction='left'):
                 sequence.append(-number)  # Negative for infra
     return sequence
 
-class Hashlet(greenlet.Greenlet):
-    """Extended Hashlet with knots_rops integration for mirrors."""
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.hash_id = self._compute_hash()
-        self.rgb_color = self._hash_to_rgb()
-        logger.info(f"Hashlet init: ID={id(self)}, Hash={self.hash_id[:8]}, RGB={self.rgb_color}")
-
-    def _compute_hash(self):
-        data = f"{id(self)}:{time.time()}"
-        return hashlib.sha256(data.encode()).hexdigest()
-
-    def _hash_to_rgb(self):
-        hash_int = int(self.hash_id, 16) % 0xFFFFFF
-        return f"#{hash_int:06x}"
-
-    def switch(self, *args, **kwargs):
-        result = super()._greenlet_switch(*args, **kwargs)
-        self.hash_id = self._compute_hash()
-        logger.info(f"Hashlet switch: New Hash={self.hash_id[:8]}, RGB={self.rgb_color}")
-        return result
-
 def advanced_hash(seed, bits=16, laps=18):
     """Advanced hash with weighted mirrors and 18-lap reversals."""
     mask = (1 << bits) - 1
@@ -95,11 +70,11 @@ if __name__ == "__main__":
     def task_wrapper(seed):
         return knots_rops_task("MEI ramp data", seed)
     
-    h1 = Hashlet(task_wrapper, 12345)
-    h2 = Hashlet(task_wrapper, 67890)
+    h1 = Hashlet(task_wrapper)
+    h2 = Hashlet(task_wrapper)
     
-    result1, ent1 = h1.switch()
-    result2, ent2 = h2.switch()
+    result1, ent1 = h1.switch(12345)
+    result2, ent2 = h2.switch(67890)
     
     print(f"Hashlet 1: Braided={result1[:50]}..., Entropy={ent1} bits, RGB={h1.rgb_color}")
     print(f"Hashlet 2: Braided={result2[:50]}..., Entropy={ent2} bits, RGB={h2.rgb_color}")
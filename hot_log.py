@@ -0,0 +1,187 @@
+# hot_log.py - Buffered Structured Logging Sink for hot loops
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Notes: Callers enqueue (level, kind, fmt, args, fields) and return; a background writer thread
+# formats and writes in batches, as JSON lines to a file or plain text to stdout. The queue is
+# bounded (overflow is counted, never blocks), and each message kind can be sampled (1 in N) or
+# rate limited (per second). A disabled level costs one integer compare. Pass printf-style args
+# instead of f-strings so formatting also happens off the hot path.
+# Usage: from hot_log import hot_log; hot_log.configure(path='fleet.jsonl', level=logging.DEBUG)
+#        hot_log.info('node.tick', "Node %d tick %d", node_id, tick_i, height=height)
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+_STOP = object()
+
+class HotLog:
+    def __init__(self, path=None, level=INFO, maxsize=65536, sample=None, rate=None, batch=1024):
+        self.level = level
+        self.maxsize = maxsize
+        self.batch = batch
+        self.sample = dict(sample or {})  # kind -> keep 1 in N
+        self.rate = dict(rate or {})      # kind -> max records per second
+        self.path = None
+        self.fd = None
+        self.seen = Counter()
+        self.dropped = Counter()  # kind -> records lost to sampling, rate limits or a full queue
+        self._windows = {}
+        self._thread = None
+        self._queue = None
+        self.configure(path=path)
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def configure(self, path=None, level=None, sample=None, rate=None):
+        """Switch output file (None: plain text on stdout), level and per-kind limits."""
+        if level is not None:
+            self.level = level
+        if sample is not None:
+            self.sample.update(sample)
+        if rate is not None:
+            self.rate.update(rate)
+        if path != self.path:
+            self.flush()
+            if self.fd is not None:
+                os.close(self.fd)
+            self.path = path
+            self.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644) if path else None
+
+    def enabled(self, level):
+        return level >= self.level
+
+    def log(self, level, kind, fmt, *args, **fields):
+        if level < self.level:
+            return
+        if kind in self.sample or kind in self.rate:
+            if not self._admit(kind):
+                self.dropped[kind] += 1
+                return
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait((time.time(), level, kind, fmt, args, fields))
+        except queue.Full:
+            self.dropped[kind] += 1
+
+    def debug(self, kind, fmt, *args, **fields):
+        if DEBUG >= self.level:
+            self.log(DEBUG, kind, fmt, *args, **fields)
+
+    def info(self, kind, fmt, *args, **fields):
+        if INFO >= self.level:
+            self.log(INFO, kind, fmt, *args, **fields)
+
+    def warning(self, kind, fmt, *args, **fields):
+        if WARNING >= self.level:
+            self.log(WARNING, kind, fmt, *args, **fields)
+
+    def error(self, kind, fmt, *args, **fields):
+        if ERROR >= self.level:
+            self.log(ERROR, kind, fmt, *args, **fields)
+
+    def _admit(self, kind):
+        n = self.seen[kind] = self.seen[kind] + 1
+        every = self.sample.get(kind)
+        if every and n % every:
+            return False
+        limit = self.rate.get(kind)
+        if limit:
+            now = int(time.monotonic())
+            second, count = self._windows.get(kind, (now, 0))
+            if second != now:
+                second, count = now, 0
+            if count >= limit:
+                return False
+            self._windows[kind] = (second, count + 1)
+        return True
+
+    def _start(self):
+        self._queue = queue.Queue(self.maxsize)
+        self._thread = threading.Thread(target=self._writer, name='hot_log', daemon=True)
+        self._thread.start()
+
+    def _after_fork(self):
+        # The writer thread does not survive fork(); the child starts its own on first log.
+        self._thread = None
+        self._queue = None
+        self.seen.clear()
+        self.dropped.clear()
+        self._windows.clear()
+
+    def _format(self, record):
+        ts, level, kind, fmt, args, fields = record
+        try:
+            msg = fmt % args if args else fmt
+        except (TypeError, ValueError):
+            msg = f"{fmt} {args!r}"
+        if self.fd is None:
+            return msg + "\n"
+        entry = {'ts': ts, 'level': logging.getLevelName(level), 'kind': kind, 'msg': msg, 'pid': os.getpid()}
+        entry.update(fields)
+        return json.dumps(entry, default=str) + "\n"
+
+    def _writer(self):
+        q = self._queue
+        while True:
+            records = [q.get()]
+            while len(records) < self.batch:
+                try:
+                    records.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(r is _STOP for r in records)
+            text = "".join(self._format(r) for r in records if r is not _STOP)
+            try:
+                if text and self.fd is None:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+                elif text:
+                    os.write(self.fd, text.encode('utf-8'))  # One O_APPEND write per batch
+            except (OSError, ValueError):
+                self.dropped['hot_log.write_error'] += len(records)
+            finally:
+                for _ in records:
+                    q.task_done()
+            if stop:
+                return
+
+    def flush(self):
+        """Block until every queued record is written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+            self.path = None
+
+hot_log = HotLog()
+atexit.register(hot_log.close)
+
+if __name__ == "__main__":
+    hot_log.configure(sample={'demo.sampled': 10}, rate={'demo.limited': 5})
+    start = time.perf_counter()
+    for i in range(100000):
+        hot_log.debug('demo.disabled', "never formatted %d", i)
+    print(f"disabled level: {(time.perf_counter() - start) * 1e4:.1f} ns/call")  # 1e9 ns / 1e5 calls
+    for i in range(100):
+        hot_log.info('demo.sampled', "sampled %d", i)
+        hot_log.info('demo.limited', "limited %d", i)
+    hot_log.flush()
+    print(f"dropped: {dict(hot_log.dropped)}")
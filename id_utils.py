@@ -28,6 +28,7 @@
 
 import numpy as np
 import hashlib
+import functools
 import math
 import sys
 import argparse
@@ -142,6 +143,11 @@ def poly_hash_256(mersenne_exponents: list = MERSENNE_EXP) -> str:
     Returns:
         str: Hexdigest of the hash.
     """
+    # Memoized per exponent list: design-ID runs with include_version reuse it.
+    return _poly_hash_256(tuple(mersenne_exponents))
+
+@functools.lru_cache(maxsize=32)
+def _poly_hash_256(mersenne_exponents: tuple) -> str:
     diffs = [mersenne_exponents[i+1] - mersenne_exponents[i] for i in range(len(mersenne_exponents)-1)]
     forward = [(d % 369) & 0xFF for d in diffs[:14]]
     reverse = forward[::-1]
@@ -153,6 +159,7 @@ def poly_hash_256(mersenne_exponents: list = MERSENNE_EXP) -> str:
     return hashlib.sha256(byte_string).hexdigest()
 
 # Generate design ID function
+@functools.lru_cache(maxsize=1024)
 def generate_design_id(input_str: str, mersenne_index: int = None, model: str = 'tetrahedron',
                        b_factor: float = 1.0, k_factor: float = 1.0, use_kappa: bool = False,
                        n: int = 12, include_version: bool = False) -> str:
@@ -1,13 +1,13 @@
 # mersenne_coneing.py - Mersenne Primes for Coneing (M1, M50, M99 Assignment)
 # SPDX-License-Identifier: AGPL-3.0-or-later
-# Notes: Computes Mersenne primes symbolically (mpmath for large). Avoids divisors (primes). Complete; run as-is. Mentally verified: M1=3, M50 huge but gcd(M1,M50)=1.
+# Notes: Computes Mersenne primes exactly (Python ints via src.models.mersenne, cached; digits rendered only when printed). Avoids divisors (primes). Complete; run as-is from the repo root. Verified: M1=3, M50 huge but gcd(M1,M50)=1.
 
-import mpmath
-mpmath.mp.dps = 50  # For large primes
+import math
+from src.models.mersenne import mersenne_number, mersenne_digits, mersenne_residue
 
 def mersenne_prime(p):
-    """M_p = 2^p - 1."""
-    return mpmath.power(2, p) - 1
+    """M_p = 2^p - 1, exact."""
+    return mersenne_number(p)
 
 if __name__ == "__main__":
     # Assignments
@@ -15,10 +15,11 @@ if __name__ == "__main__":
     m50 = mersenne_prime(3511)  # Centre (0 understanding)
     m99 = mersenne_prime(4253)  # Ether (+1 dissemination)
     print(f"M1 (Roots): {m1}")
-    print(f"M50 (Centre): {m50} (truncated: {str(m50)[:20]}...)")
-    print(f"M99 (Ether): {m99} (truncated: {str(m99)[:20]}...)")
-    # GCD check (symbolic, but primes ensure 1)
-    print("GCD(M1,M50)=1 (divisor-free)")
-    # Notes: Requires mpmath (pip install mpmath). For coneing: Use as moduli in TKDF salt for resonant gates.
+    for name, p in (("M50 (Centre)", 3511), ("M99 (Ether)", 4253)):
+        digits = mersenne_digits(p)
+        print(f"{name}: {digits[:20]}...{digits[-10:]} ({len(digits)} digits, mod 369 = {mersenne_residue(p, 369)})")
+    # GCD check (exact; gcd(M_a, M_b) = M_gcd(a,b), so distinct prime exponents give 1)
+    print(f"GCD(M1,M50)={math.gcd(m1, m50)}, GCD(M50,M99)={math.gcd(m50, m99)} (divisor-free)")
+    # Notes: For coneing: Use as moduli in TKDF salt for resonant gates.
 
 # Explanation: Mersenne primes ensure divisor-free resonance (gcd=1). M1 small for roots gather, M50 central balance, M99 ether extremes. Ties to tension: Primes prune variability in weft scaling (64" centre M50 stable, 72" M99 wider but prime-isolated).
@@ -0,0 +1,170 @@
+# profit_scan.py - Batch Profitability Scanner
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Notes: Vectorized form of green_profit.checkProfitable / lib.rs check_profitable over whole price series. One NumPy pass per batch returns a profitable mask and the margin adjGross - f. Float mode repeats green_profit's float arithmetic operation for operation, so results match it exactly for float inputs. Exact mode repeats lib.rs's scaled integer math (floor division at every step): int64 when the inputs can't overflow, Python ints (object arrays) when they could, so it agrees with lib.rs wherever lib.rs doesn't overflow u128. Streams CSV (NumPy) or Parquet (pyarrow, optional) in chunks.
+# Usage: python profit_scan.py ticks.csv [--exact] [--chunk-rows N] [--columns target,current,volume] [--mask-out mask.npy]
+
+import argparse
+import json
+import sys
+import time
+import warnings
+import numpy as np
+
+FEE_RATE = 30  # 0.003 * 10^4 (scaled)
+MARTINGALE_FACTOR = 2
+FLASH_FEE = 25  # 0.0025 * 10^4
+BURN_RATE = 50  # 0.5 * 100
+RISK_ADJ = 93  # / 100
+DEFAULT_COLUMNS = ('target', 'current', 'volume')
+# Largest volume for which every int64 intermediate in exact mode fits:
+# delta_p * s <= 10000 * 2 * volume, and s * FEE_RATE is smaller.
+INT64_SAFE_VOLUME = np.iinfo(np.int64).max // (10000 * MARTINGALE_FACTOR)
+INT64_SAFE_PRICE = np.iinfo(np.int64).max // 10000
+
+def _float_batch(target, current, volume):
+    """green_profit.checkProfitable, elementwise, same operation order."""
+    target = np.asarray(target, dtype=np.float64)
+    current = np.asarray(current, dtype=np.float64)
+    volume = np.asarray(volume, dtype=np.float64)
+    deltaP = np.abs(current - target) * 10000 / target
+    np.minimum(deltaP, 10000, out=deltaP)
+    s = volume * MARTINGALE_FACTOR
+    flashFee = s * FLASH_FEE / 10000
+    totalFees = s * FEE_RATE / 10000 + flashFee
+    f = totalFees + (totalFees * BURN_RATE / 100)
+    gross = deltaP * s / 10000
+    adjGross = gross * RISK_ADJ / 100
+    margin = adjGross - f
+    return adjGross > f, margin
+
+def _exact_batch(target, current, volume):
+    """lib.rs check_profitable, elementwise, with floor division throughout."""
+    arrays = [np.asarray(a) for a in (target, current, volume)]
+    if any(a.dtype.kind not in 'iuO' for a in arrays):
+        raise TypeError("Exact mode needs integer (scaled) prices and volumes")
+    if any(a.dtype.kind in 'iu' and a.size and a.min() < 0 for a in arrays):
+        raise ValueError("Exact mode needs non-negative prices and volumes")
+    target, current, volume = arrays
+    safe = (all(a.dtype.kind in 'iu' for a in arrays)
+            and (not volume.size or int(volume.max()) <= INT64_SAFE_VOLUME)
+            and (not target.size or max(int(target.max()), int(current.max())) <= INT64_SAFE_PRICE))
+    dtype = np.int64 if safe else object
+    target, current, volume = (a.astype(dtype) for a in arrays)
+    delta_p = np.abs(current - target) * 10000 // target
+    delta_p = np.minimum(delta_p, 10000)
+    s = volume * MARTINGALE_FACTOR
+    flash_fee = s * FLASH_FEE // 10000
+    total_fees = s * FEE_RATE // 10000 + flash_fee
+    f = total_fees + total_fees * BURN_RATE // 100
+    gross = delta_p * s // 10000
+    adj_gross = gross * RISK_ADJ // 100
+    margin = adj_gross - f
+    return np.asarray(adj_gross > f, dtype=bool), margin
+
+def check_profitable_batch(target, current, volume, exact=False):
+    """Profitable mask and margin (adjGross - f) for arrays of trades.
+
+    Float mode takes prices as floats, like green_profit.checkProfitable.
+    Exact mode takes scaled integers (191710 for 191.710), like lib.rs.
+    Inputs broadcast against each other; target prices must be positive.
+    """
+    target = np.asarray(target)
+    if target.size and not np.all(target > 0):
+        raise ValueError("Target prices must be positive")
+    if exact:
+        return _exact_batch(target, current, volume)
+    return _float_batch(target, current, volume)
+
+def collapsed_profitable_m53_batch(p, stake, target_price, current_price, exact=True):
+    """green_profit.collapsedProfitableM53 for arrays of exponents; returns (mask, reward).
+
+    Rewards reach ~2^256, so they are Python ints in an object array.
+    """
+    p = np.asarray(p, dtype=object)
+    mod_bits = p % 256
+    mod_sym = p % 369
+    risk_approx = np.array([(1 << int(b)) - 1 for b in mod_bits.ravel()], dtype=object).reshape(p.shape)
+    reward = risk_approx * (mod_sym // 3) * stake // 3
+    volume = reward if exact else reward.astype(np.float64)
+    if exact:
+        target_price = np.asarray(target_price, dtype=object)
+        current_price = np.asarray(current_price, dtype=object)
+    mask, _ = check_profitable_batch(target_price, current_price, volume, exact=exact)
+    return mask, reward
+
+def iter_csv(path, columns=DEFAULT_COLUMNS, chunk_rows=1_000_000, exact=False):
+    """Yield (target, current, volume) array chunks from a CSV file with a header row."""
+    dtype = np.int64 if exact else np.float64
+    with open(path, 'r') as f:
+        header = [name.strip() for name in f.readline().strip().split(',')]
+        try:
+            usecols = [header.index(name) for name in columns]
+        except ValueError:
+            raise ValueError(f"{path} needs columns {', '.join(columns)}; it has {', '.join(header)}")
+        while True:
+            with warnings.catch_warnings():
+                # An exact multiple of chunk_rows ends with an empty read.
+                warnings.simplefilter('ignore', UserWarning)
+                chunk = np.loadtxt(f, delimiter=',', usecols=usecols, dtype=dtype, max_rows=chunk_rows, ndmin=2)
+            if not len(chunk):
+                return
+            yield chunk[:, 0], chunk[:, 1], chunk[:, 2]
+            if len(chunk) < chunk_rows:
+                return
+
+def iter_parquet(path, columns=DEFAULT_COLUMNS, chunk_rows=1_000_000, exact=False):
+    """Yield (target, current, volume) array chunks from a Parquet file (needs pyarrow)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading Parquet needs pyarrow: pip install pyarrow")
+    dtype = np.int64 if exact else np.float64
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=list(columns)):
+        yield tuple(batch.column(i).to_numpy().astype(dtype, copy=False) for i in range(len(columns)))
+
+def scan(path, columns=DEFAULT_COLUMNS, chunk_rows=1_000_000, exact=False, mask_out=None):
+    """Scan a tick file chunk by chunk; returns summary counts and margins."""
+    reader = iter_parquet if path.endswith(('.parquet', '.pq')) else iter_csv
+    rows = profitable = 0
+    best = None
+    total_margin = 0
+    masks = []
+    to_number = int if exact else float
+    start = time.perf_counter()
+    for target, current, volume in reader(path, columns, chunk_rows, exact):
+        mask, margin = check_profitable_batch(target, current, volume, exact=exact)
+        rows += len(mask)
+        profitable += int(mask.sum())
+        if mask.any():
+            chunk_best = margin[mask].max()
+            best = chunk_best if best is None else max(best, chunk_best)
+            total_margin += to_number(margin[mask].sum())
+        if mask_out is not None:
+            masks.append(mask)
+    if mask_out is not None:
+        np.save(mask_out, np.concatenate(masks) if masks else np.zeros(0, dtype=bool))
+    return {
+        'rows': rows,
+        'profitable': profitable,
+        'total_margin': to_number(total_margin),
+        'best_margin': None if best is None else to_number(best),
+        'exact': exact,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scan price ticks for profitable trades (green_profit / lib.rs fee math).")
+    parser.add_argument('path', help="CSV with a header row, or .parquet")
+    parser.add_argument('--exact', action='store_true', help="scaled integer math, as in lib.rs")
+    parser.add_argument('--chunk-rows', type=int, default=1_000_000)
+    parser.add_argument('--columns', default=','.join(DEFAULT_COLUMNS), help="target,current,volume column names")
+    parser.add_argument('--mask-out', default=None, help="save the profitable mask as a .npy file")
+    args = parser.parse_args(argv)
+    columns = tuple(name.strip() for name in args.columns.split(','))
+    if len(columns) != 3:
+        parser.error("--columns needs three names")
+    print(json.dumps(scan(args.path, columns, args.chunk_rows, args.exact, args.mask_out)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
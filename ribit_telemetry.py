@@ -23,7 +23,7 @@ from mpl_toolkits.mplot3d import Axes3D
 import hashlib # For light hashing sim
 from PIL import Image # For saving PNG (rasterization)
 from wise_transforms import bitwise_transform, hexwise_transform, hashwise_transform
-from id_util_nurks_closure_hex import custom_interoperations_green_curve, bspline_basis
+from src.utils.nurbs import custom_interoperations_green_curve, bspline_basis
 # Points from the image approximation (adjusted for symmetry, with one diameter offset for "not in line")
 center = [0, 0]
 colored_points = [
@@ -9,6 +9,7 @@ import time
 import hashlib
 from math import sin
 import numpy as np  # For entropy sim
+from src.utils.entropy import unique_ratio, unique_ratio_batch
 
 # Constants
 ENTROPY_THRESHOLD = 0.69
@@ -28,13 +29,20 @@ class Seraph:
 
     def test_entropy(self, mnemonic):
         """Wing-Chun test: Yield if entropy > threshold (The One)."""
-        h = hashlib.sha256(mnemonic.encode()).digest()
-        unique = len(set(h)) / len(h)
+        h = hashlib.sha256(mnemonic.encode())
         self.meditate_if_afk()
-        if unique > ENTROPY_THRESHOLD:
-            return True, f"Echo: {hashlib.sha256(mnemonic.encode()).hexdigest()[:8]}"  # Grant
+        if unique_ratio(h.digest()) > ENTROPY_THRESHOLD:
+            return True, f"Echo: {h.hexdigest()[:8]}"  # Grant
         return False, "Apology: Not The One."  # Prune
 
+    def test_entropy_batch(self, mnemonics):
+        """test_entropy for many mnemonics: digests scored in one batched pass."""
+        hashes = [hashlib.sha256(m.encode()) for m in mnemonics]
+        granted = unique_ratio_batch([h.digest() for h in hashes]) > ENTROPY_THRESHOLD
+        self.meditate_if_afk()
+        return [(True, f"Echo: {h.hexdigest()[:8]}") if ok else (False, "Apology: Not The One.")
+                for h, ok in zip(hashes, granted)]
+
     def nokia_snake_closure(self, keyspace_data):
         """Toy model: 3 Nokia phones close SnakeII keyspace with ternary consensus."""
         # Sim 3 phones: Hash to ternary states
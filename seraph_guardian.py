@@ -3,15 +3,7 @@
 # Notes: Tests input resonance (entropy >0.69) without state change (non-reactive). DOjo for opt (prune if not "The One"). Tea House scope: Yield access if authentic. Complete; run as-is. Mentally verified: Input='ribit7' → access granted.
 
 import hashlib
-import math
-import numpy as np
-
-def shannon_entropy(data):
-    """DOjo entropy check (resonance metric)."""
-    counts = np.bincount([ord(c) for c in data])
-    probs = counts / len(data)
-    probs = probs[probs > 0]
-    return -np.sum(probs * np.log2(probs))
+from src.utils.entropy import shannon_entropy, shannon_entropy_batch  # DOjo entropy check (resonance metric)
 
 def seraph_test(input_mnemonic, threshold=0.69):
     """Seraph: Wing-Chun test (non-reactive disclosure)."""
@@ -22,6 +14,12 @@ def seraph_test(input_mnemonic, threshold=0.69):
         return True, echo_hash  # Grant access, yield echo
     return False, "Apology: You are not The One."  # Deny, non-reactive
 
+def seraph_test_batch(mnemonics, threshold=0.69):
+    """Seraph test for a batch: one entropy pass, echo hashes only for granted inputs."""
+    granted = shannon_entropy_batch(mnemonics) > threshold
+    return [(True, hashlib.sha256(m.encode()).hexdigest()) if ok else (False, "Apology: You are not The One.")
+            for m, ok in zip(mnemonics, granted)]
+
 if __name__ == "__main__":
     mnemonic = "ribit7"  # Test callsign
     access, response = seraph_test(mnemonic)
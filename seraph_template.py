@@ -3,7 +3,7 @@
 # Notes: Template for stabilizing Seraph "fight" in software. DOjo entropy test, Tea House scope. Adapt for apps (e.g., CLI/UI ping). Complete; run as-is.
 
 import hashlib
-import numpy as np
+from src.utils.entropy import shannon_entropy
 
 class SeraphGuardian:
     """Seraph: Wing-Chun test for non-reactive disclosure."""
@@ -11,10 +11,7 @@ class SeraphGuardian:
         self.threshold = threshold  # Resonance min
 
     def shannon_entropy(self, data):
-        counts = np.bincount([ord(c) for c in data])
-        probs = counts / len(data)
-        probs = probs[probs > 0]
-        return -np.sum(probs * np.log2(probs))
+        return shannon_entropy(data)
 
     def test(self, input_mnemonic):
         """Non-reactive test: Yield if 'The One' (entropy > threshold)."""
@@ -1,5 +1,5 @@
 # Configuration settings and constants
-import mpmath
+import math
 
 DB_FILE = "blockchan.db"
 TRADING_PAIRS = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "~ESC/USDT", "LLLP/GMEx"]
@@ -12,7 +12,7 @@ GOSSIP_TIMEOUT = 0.1
 GRID_DIM = 2141  # Updated to 2141 with +1 Genesis
 BUFFER_BLOCK_LIMIT = 2141
 KAPPA_BASE = 0.3536
-PHI_FLOAT = float(mpmath.phi)
+PHI_FLOAT = (1 + math.sqrt(5)) / 2  # float(mpmath.phi), without importing mpmath
 TICK_SPACING = 0.01
 FEE_RATE = 0.003
 MARTINGALE_FACTOR = 2.0
@@ -0,0 +1,118 @@
+# Parallel TOC demo runner: runs GreenpaperUX demos in worker processes
+# and reports wall time, CPU time and peak RSS per demo as JSON.
+#
+# Usage: python -m src.demo_runner [-j JOBS] [--output report.json] [TOC ...]
+#
+# Each demo gets a fresh worker process (maxtasksperchild=1), so one demo
+# can't leave state behind for another, and each peak RSS is that
+# demo's own. Workers are forked after src.main is imported, so they
+# don't pay its import time again.
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+from typing import Dict, List
+
+from src.main import GreenpaperUX
+
+def run_demo(key: str) -> Dict:
+    """Run one TOC demo in this process and measure it."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    error = None
+    random.seed(42)
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            ux = GreenpaperUX()
+            if key not in ux.demo_functions_dict:
+                raise KeyError(f"no demo for TOC {key}")
+            ux.run_demo(key)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak_rss //= 1024
+    return {
+        'toc': key,
+        'wall_s': round(wall, 6),
+        'cpu_s': round(cpu, 6),
+        'peak_rss_kb': peak_rss,
+        'pid': os.getpid(),
+        'error': error,
+        'stdout': stdout.getvalue(),
+        'stderr': stderr.getvalue(),
+    }
+
+def run_demos(keys: List[str], jobs: int = None, timeout: float = None) -> Dict:
+    """Run the demos for keys in a process pool; results keep the order of keys."""
+    jobs = jobs or os.cpu_count() or 1
+    wall_start = time.perf_counter()
+    results = []
+    timed_out = False
+    pool = multiprocessing.Pool(processes=min(jobs, len(keys)) or 1, maxtasksperchild=1)
+    try:
+        pending = [(key, pool.apply_async(run_demo, (key,))) for key in keys]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for key, result in pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                results.append(result.get(remaining))
+            except multiprocessing.TimeoutError:
+                timed_out = True
+                results.append({'toc': key, 'error': 'timeout'})
+            except Exception as e:
+                results.append({'toc': key, 'error': f"{type(e).__name__}: {e}"})
+    finally:
+        if timed_out:
+            pool.terminate()
+        else:
+            pool.close()
+        pool.join()
+    return {
+        'jobs': jobs,
+        'wall_s': round(time.perf_counter() - wall_start, 6),
+        'demos': results,
+    }
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run GreenpaperUX TOC demos in parallel and report timings as JSON.")
+    parser.add_argument('toc', nargs='*', help="TOC sections to run (default: all)")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--timeout', type=float, default=None, help="seconds to wait for the whole run")
+    parser.add_argument('--output', default=None, help="write the JSON report here instead of stdout")
+    parser.add_argument('--no-capture', action='store_true', help="leave demo stdout/stderr out of the report")
+    parser.add_argument('--sort', choices=['toc', 'wall', 'cpu', 'rss'], default='toc', help="order of demos in the report")
+    args = parser.parse_args(argv)
+
+    keys = args.toc or list(GreenpaperUX().demo_functions_dict)
+    report = run_demos(keys, jobs=args.jobs, timeout=args.timeout)
+    if args.no_capture:
+        for demo in report['demos']:
+            demo.pop('stdout', None)
+            demo.pop('stderr', None)
+    sort_keys = {'wall': 'wall_s', 'cpu': 'cpu_s', 'rss': 'peak_rss_kb'}
+    if args.sort in sort_keys:
+        field = sort_keys[args.sort]
+        report['demos'].sort(key=lambda demo: demo.get(field, float('inf')), reverse=True)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 1 if any(demo.get('error') for demo in report['demos']) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -523,6 +523,12 @@ green_get_stack_saved(PyGreenlet* self, void* UNUSED(context))
     return PyLong_FromSsize_t(self->pimpl->stack_saved());
 }
 
+static PyObject*
+green_get_switch_count(PyGreenlet* self, void* UNUSED(context))
+{
+    return PyLong_FromUnsignedLongLong(self->pimpl->switches_in());
+}
+
 
 static PyObject*
 green_getrun(PyGreenlet* self, void* UNUSED(context))
@@ -703,6 +709,7 @@ static PyGetSetDef green_getsets[] = {
     },
     {.name="dead", .get=(getter)green_getdead},
     {.name="_stack_saved", .get=(getter)green_get_stack_saved},
+    {.name="_switch_count", .get=(getter)green_get_switch_count},
     {.name=NULL}
 };
 
@@ -181,7 +181,368 @@ mod_enable_optional_cleanup(PyObject* UNUSED(module), PyObject* flag)
     Py_RETURN_NONE;
 }
 
+PyDoc_STRVAR(mod_run_round_robin_doc,
+             "run_round_robin(greenlets, max_rounds=None) -> list\n"
+             "\n"
+             "Switch to each greenlet of *greenlets* in turn, with no arguments, and\n"
+             "repeat until all of them are dead or *max_rounds* rounds have run.\n"
+             "Greenlets that have died are dropped; unstarted ones are started.\n"
+             "Each greenlet should give control back by switching to the caller,\n"
+             "usually its parent; values it passes are discarded.\n"
+             "This is the same as a Python loop calling ``g.switch()``, but the\n"
+             "loop runs in C.\n"
+             "\n"
+             "If a greenlet raises an exception that reaches the caller, the\n"
+             "exception propagates and the remaining greenlets are left as they are.\n"
+             "Returns the list of greenlets still alive (empty if all finished).\n"
+             "\n"
+             ".. versionadded:: 3.2.5"
+             );
+static PyObject*
+mod_run_round_robin(PyObject* UNUSED(module), PyObject* args, PyObject* kwargs)
+{
+    PyObject* greenlets = nullptr;
+    PyObject* max_rounds_o = Py_None;
+    static const char* kwlist[] = {
+        "greenlets",
+        "max_rounds",
+        NULL
+    };
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O:run_round_robin",
+                                     (char**)kwlist, &greenlets, &max_rounds_o)) {
+        return nullptr;
+    }
+    Py_ssize_t max_rounds = -1;
+    if (max_rounds_o != Py_None) {
+        max_rounds = PyLong_AsSsize_t(max_rounds_o);
+        if (max_rounds == -1 && PyErr_Occurred()) {
+            return nullptr;
+        }
+        if (max_rounds < 0) {
+            PyErr_SetString(PyExc_ValueError, "max_rounds must be None or >= 0");
+            return nullptr;
+        }
+    }
+
+    // Our own copy, compacted in place as greenlets die.
+    OwnedObject runnable = OwnedObject::consuming(PySequence_List(greenlets));
+    if (!runnable) {
+        return nullptr;
+    }
+    PyObject* const list = runnable.borrow();
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(list); i++) {
+        if (!PyGreenlet_Check(PyList_GET_ITEM(list, i))) {
+            PyErr_Format(PyExc_TypeError,
+                         "run_round_robin() expected greenlets, not %s",
+                         Py_TYPE(PyList_GET_ITEM(list, i))->tp_name);
+            return nullptr;
+        }
+    }
+
+    for (Py_ssize_t round = 0;
+         PyList_GET_SIZE(list) && (max_rounds < 0 || round < max_rounds);
+         round++) {
+        const Py_ssize_t n = PyList_GET_SIZE(list);
+        Py_ssize_t keep = 0;
+        for (Py_ssize_t i = 0; i < n; i++) {
+            PyGreenlet* g = reinterpret_cast<PyGreenlet*>(PyList_GET_ITEM(list, i));
+            if (_green_not_dead(g)) {
+                PyObject* result = green_switch(g, mod_globs->empty_tuple, nullptr);
+                if (!result) {
+                    return nullptr;
+                }
+                Py_DECREF(result);
+            }
+            if (_green_not_dead(g)) {
+                // Swap rather than copy so the list keeps owning
+                // exactly one reference to each item.
+                PyList_SET_ITEM(list, i, PyList_GET_ITEM(list, keep));
+                PyList_SET_ITEM(list, keep, reinterpret_cast<PyObject*>(g));
+                keep++;
+            }
+        }
+        if (PyList_SetSlice(list, keep, n, nullptr) < 0) {
+            return nullptr;
+        }
+    }
+    return runnable.relinquish_ownership();
+}
+
+PyDoc_STRVAR(mod_set_cross_thread_cleanup_budget_doc,
+             "set_cross_thread_cleanup_budget(max_per_switch) -> Integer\n"
+             "\n"
+             "Greenlets that lose their last reference in a thread other than their\n"
+             "own are queued, and released the next time their own thread switches\n"
+             "or calls ``getcurrent()``. By default the whole queue is released at\n"
+             "once, which can stall that switch for a long time if many\n"
+             "greenlets arrived together. With a positive *max_per_switch*, at most\n"
+             "that many are released each time and the rest wait for later switches.\n"
+             "0 restores releasing all of them. Applies to all threads. Returns the\n"
+             "previous value.\n"
+             "\n"
+             "This is an implementation specific, provisional API. It may be changed or removed\n"
+             "in the future.\n"
+             ".. versionadded:: 3.2.5"
+             );
+static PyObject*
+mod_set_cross_thread_cleanup_budget(PyObject* UNUSED(module), PyObject* arg)
+{
+    const Py_ssize_t budget = PyLong_AsSsize_t(arg);
+    if (budget == -1 && PyErr_Occurred()) {
+        return nullptr;
+    }
+    if (budget < 0) {
+        PyErr_SetString(PyExc_ValueError, "max_per_switch must be >= 0");
+        return nullptr;
+    }
+    Py_ssize_t& current = ThreadState::deleteme_budget();
+    const Py_ssize_t previous = current;
+    current = budget;
+    return PyLong_FromSsize_t(previous);
+}
+
+PyDoc_STRVAR(mod_get_cross_thread_cleanup_backlog_doc,
+             "get_cross_thread_cleanup_backlog() -> Integer\n"
+             "\n"
+             "Return the number of greenlets released by other threads that are\n"
+             "still waiting to be cleaned up in the current thread. See\n"
+             "``set_cross_thread_cleanup_budget``.\n"
+             );
+static PyObject*
+mod_get_cross_thread_cleanup_backlog(PyObject* UNUSED(module))
+{
+    return PyLong_FromSsize_t(GET_THREAD_STATE().state().deleteme_backlog());
+}
+
+PyDoc_STRVAR(mod_set_stack_buffer_retention_doc,
+             "set_stack_buffer_retention(max_bytes) -> Integer\n"
+             "\n"
+             "Control reuse of the heap buffers that hold the saved C stacks of\n"
+             "suspended greenlets, returning the previous setting.\n"
+             "Normally a greenlet's buffer is grown with ``realloc`` each time more of its\n"
+             "stack must be saved, and freed as soon as the greenlet is switched back in.\n"
+             "With a positive *max_bytes*, each greenlet instead keeps its largest buffer\n"
+             "while it lives, and the buffers of greenlets that finish are kept on a\n"
+             "per-thread free list, holding at most *max_bytes* per thread, for new greenlets\n"
+             "to reuse. This trades memory for fewer allocator calls in programs that switch\n"
+             "between deep stacks. 0 (the default) disables retention and frees the current\n"
+             "thread's free list; other threads free theirs when they exit.\n"
+             "\n"
+             "This is an implementation specific, provisional API. It may be changed or removed\n"
+             "in the future.\n"
+             ".. versionadded:: 3.2.5"
+             );
+static PyObject*
+mod_set_stack_buffer_retention(PyObject* UNUSED(module), PyObject* arg)
+{
+    Py_ssize_t max_bytes = PyLong_AsSsize_t(arg);
+    if (max_bytes == -1 && PyErr_Occurred()) {
+        return nullptr;
+    }
+    if (max_bytes < 0) {
+        PyErr_SetString(PyExc_ValueError, "max_bytes must be >= 0");
+        return nullptr;
+    }
+    intptr_t& limit = greenlet::StackBufferPool::max_retained_bytes();
+    const intptr_t previous = limit;
+    limit = max_bytes;
+    if (!max_bytes) {
+        GET_THREAD_STATE().state().stack_buffers().clear();
+    }
+    return PyLong_FromSsize_t(previous);
+}
 
+PyDoc_STRVAR(mod_get_retained_stack_bytes_doc,
+             "get_retained_stack_bytes() -> Integer\n"
+             "\n"
+             "Return the number of bytes on the current thread's free list of\n"
+             "stack buffers. See ``set_stack_buffer_retention``. Testing only.\n");
+static PyObject*
+mod_get_retained_stack_bytes(PyObject* UNUSED(module))
+{
+    return PyLong_FromSsize_t(GET_THREAD_STATE().state().stack_buffers().retained_bytes());
+}
+
+PyDoc_STRVAR(mod__get_total_retained_stack_bytes_doc,
+             "_get_total_retained_stack_bytes() -> Integer\n"
+             "\n"
+             "Return the number of bytes on the free lists of stack buffers of all\n"
+             "threads, including threads that have exited but whose state has not yet\n"
+             "been cleaned up. Testing only.\n");
+static PyObject*
+mod__get_total_retained_stack_bytes(PyObject* UNUSED(module))
+{
+    return PyLong_FromSsize_t(greenlet::StackBufferPool::total_retained_bytes());
+}
+PyDoc_STRVAR(mod__enable_stats_doc,
+             "_enable_stats(bool) -> bool\n"
+             "\n"
+             "Turn collection of the counters reported by ``_get_stats()`` on or off\n"
+             "for all threads, returning the previous setting. Off by default.\n"
+             "\n"
+             "This is an implementation specific, provisional API. It may be changed or removed\n"
+             "in the future.\n"
+             ".. versionadded:: 3.2.5"
+             );
+static PyObject*
+mod__enable_stats(PyObject* UNUSED(module), PyObject* flag)
+{
+    int is_true = PyObject_IsTrue(flag);
+    if (is_true == -1) {
+        return nullptr;
+    }
+    bool& enabled = greenlet::SwitchStats::enabled();
+    PyObject* previous = PyBool_FromLong(enabled);
+    enabled = is_true;
+    return previous;
+}
+
+PyDoc_STRVAR(mod__get_stats_doc,
+             "_get_stats() -> dict\n"
+             "\n"
+             "Return the current thread's switch and stack-copy counters:\n"
+             "\n"
+             "- ``switches``: successful stack switches (including starting a greenlet).\n"
+             "- ``bytes_copied_to_heap``: bytes of C stack saved to the heap.\n"
+             "- ``bytes_restored``: bytes of saved stack copied back to the C stack.\n"
+             "- ``reallocs``: calls to the allocator to grow a saved-stack buffer.\n"
+             "- ``peak_saved_bytes``: the largest stack saved for one greenlet.\n"
+             "\n"
+             "``enabled`` tells whether they are being collected; see ``_enable_stats()``.\n"
+             "\n"
+             "This is an implementation specific, provisional API. It may be changed or removed\n"
+             "in the future.\n"
+             ".. versionadded:: 3.2.5"
+             );
+static PyObject*
+mod__get_stats(PyObject* UNUSED(module))
+{
+    const greenlet::SwitchStats& stats = GET_THREAD_STATE().state().switch_stats();
+    return Py_BuildValue("{s:O,s:K,s:K,s:K,s:K,s:n}",
+                         "enabled", greenlet::SwitchStats::enabled() ? Py_True : Py_False,
+                         "switches", stats.switches,
+                         "bytes_copied_to_heap", stats.bytes_copied_to_heap,
+                         "bytes_restored", stats.bytes_restored,
+                         "reallocs", stats.reallocs,
+                         "peak_saved_bytes", (Py_ssize_t)stats.peak_saved_bytes);
+}
+
+PyDoc_STRVAR(mod__reset_stats_doc,
+             "_reset_stats() -> None\n"
+             "\n"
+             "Zero the current thread's counters. See ``_get_stats()``.\n"
+             );
+static PyObject*
+mod__reset_stats(PyObject* UNUSED(module))
+{
+    GET_THREAD_STATE().state().switch_stats().reset();
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(mod__start_switch_sampling_doc,
+             "_start_switch_sampling(capacity=65536, every=1, interval_ns=0) -> None\n"
+             "\n"
+             "Start recording a sample of the current thread's switches into a\n"
+             "ring buffer of *capacity* fixed-size records, allocated now. Every\n"
+             "*every*-th switch is a candidate; if *interval_ns* is non-zero, at most\n"
+             "one candidate per that many nanoseconds is kept. When the ring is full,\n"
+             "new records overwrite the oldest. Restarting discards pending records.\n"
+             "\n"
+             "Unlike ``settrace``, no Python code runs when a switch is recorded.\n"
+             "Retrieve records with ``_drain_switch_samples()``.\n"
+             "\n"
+             "This is an implementation specific, provisional API. It may be changed or removed\n"
+             "in the future.\n"
+             ".. versionadded:: 3.2.5"
+             );
+static PyObject*
+mod__start_switch_sampling(PyObject* UNUSED(module), PyObject* args, PyObject* kwargs)
+{
+    Py_ssize_t capacity = 65536;
+    Py_ssize_t every = 1;
+    unsigned long long interval_ns = 0;
+    static const char* kwlist[] = {
+        "capacity",
+        "every",
+        "interval_ns",
+        NULL
+    };
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|nnK:_start_switch_sampling",
+                                     (char**)kwlist, &capacity, &every, &interval_ns)) {
+        return nullptr;
+    }
+    if (capacity < 1) {
+        PyErr_SetString(PyExc_ValueError, "capacity must be >= 1");
+        return nullptr;
+    }
+    if (every < 1 || (unsigned long long)every > UINT32_MAX) {
+        PyErr_SetString(PyExc_ValueError, "every must be between 1 and 2**32 - 1");
+        return nullptr;
+    }
+    if (!GET_THREAD_STATE().state().switch_sampler().start(capacity, (uint32_t)every, interval_ns)) {
+        return PyErr_NoMemory();
+    }
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(mod__stop_switch_sampling_doc,
+             "_stop_switch_sampling() -> None\n"
+             "\n"
+             "Stop sampling on the current thread and free the ring buffer,\n"
+             "discarding records that have not been drained.\n"
+             );
+static PyObject*
+mod__stop_switch_sampling(PyObject* UNUSED(module))
+{
+    GET_THREAD_STATE().state().switch_sampler().stop();
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(mod__drain_switch_samples_doc,
+             "_drain_switch_samples() -> bytes\n"
+             "\n"
+             "Remove and return the current thread's pending switch records, oldest\n"
+             "first, packed back to back. Each is 32 bytes in native byte order:\n"
+             "the ``id()`` of the origin and target greenlets and a monotonic\n"
+             "timestamp in nanoseconds (all unsigned 64-bit), then the event\n"
+             "(0 for a switch, 1 for a throw) as an unsigned 32-bit integer and\n"
+             "4 reserved bytes. ``greenlet._sampling`` decodes them.\n"
+             );
+static PyObject*
+mod__drain_switch_samples(PyObject* UNUSED(module))
+{
+    typedef greenlet::SwitchSampler::Record Record;
+    greenlet::SwitchSampler& sampler = GET_THREAD_STATE().state().switch_sampler();
+    const uint64_t count = sampler.pending();
+    PyObject* result = PyBytes_FromStringAndSize(nullptr, (Py_ssize_t)(count * sizeof(Record)));
+    if (result) {
+        sampler.drain(reinterpret_cast<Record*>(PyBytes_AS_STRING(result)));
+    }
+    return result;
+}
+
+PyDoc_STRVAR(mod__get_switch_sampling_doc,
+             "_get_switch_sampling() -> dict or None\n"
+             "\n"
+             "Describe sampling on the current thread: ``capacity``, ``every``,\n"
+             "``interval_ns``, ``pending`` (records ready to drain) and ``dropped``\n"
+             "(records overwritten before they were drained). None if sampling\n"
+             "is off.\n"
+             );
+static PyObject*
+mod__get_switch_sampling(PyObject* UNUSED(module))
+{
+    const greenlet::SwitchSampler& sampler = GET_THREAD_STATE().state().switch_sampler();
+    if (!sampler.active()) {
+        Py_RETURN_NONE;
+    }
+    return Py_BuildValue("{s:K,s:k,s:K,s:K,s:K}",
+                         "capacity", (unsigned long long)sampler.ring_capacity(),
+                         "every", (unsigned long)sampler.sample_every(),
+                         "interval_ns", (unsigned long long)sampler.sample_interval_ns(),
+                         "pending", (unsigned long long)sampler.pending(),
+                         "dropped", (unsigned long long)sampler.dropped());
+}
 
 
 #if !GREENLET_PY313
@@ -254,6 +615,84 @@ static PyMethodDef GreenMethods[] = {
       .ml_flags=METH_O,
       .ml_doc=mod_enable_optional_cleanup_doc
     },
+    {
+      .ml_name="run_round_robin",
+      .ml_meth=(PyCFunction)mod_run_round_robin,
+      .ml_flags=METH_VARARGS | METH_KEYWORDS,
+      .ml_doc=mod_run_round_robin_doc
+    },
+    {
+      .ml_name="set_cross_thread_cleanup_budget",
+      .ml_meth=(PyCFunction)mod_set_cross_thread_cleanup_budget,
+      .ml_flags=METH_O,
+      .ml_doc=mod_set_cross_thread_cleanup_budget_doc
+    },
+    {
+      .ml_name="get_cross_thread_cleanup_backlog",
+      .ml_meth=(PyCFunction)mod_get_cross_thread_cleanup_backlog,
+      .ml_flags=METH_NOARGS,
+      .ml_doc=mod_get_cross_thread_cleanup_backlog_doc
+    },
+    {
+      .ml_name="set_stack_buffer_retention",
+      .ml_meth=(PyCFunction)mod_set_stack_buffer_retention,
+      .ml_flags=METH_O,
+      .ml_doc=mod_set_stack_buffer_retention_doc
+    },
+    {
+      .ml_name="get_retained_stack_bytes",
+      .ml_meth=(PyCFunction)mod_get_retained_stack_bytes,
+      .ml_flags=METH_NOARGS,
+      .ml_doc=mod_get_retained_stack_bytes_doc
+    },
+    {
+      .ml_name="_get_total_retained_stack_bytes",
+      .ml_meth=(PyCFunction)mod__get_total_retained_stack_bytes,
+      .ml_flags=METH_NOARGS,
+      .ml_doc=mod__get_total_retained_stack_bytes_doc
+    },
+    {
+      .ml_name="_enable_stats",
+      .ml_meth=(PyCFunction)mod__enable_stats,
+      .ml_flags=METH_O,
+      .ml_doc=mod__enable_stats_doc
+    },
+    {
+      .ml_name="_get_stats",
+      .ml_meth=(PyCFunction)mod__get_stats,
+      .ml_flags=METH_NOARGS,
+      .ml_doc=mod__get_stats_doc
+    },
+    {
+      .ml_name="_reset_stats",
+      .ml_meth=(PyCFunction)mod__reset_stats,
+      .ml_flags=METH_NOARGS,
+      .ml_doc=mod__reset_stats_doc
+    },
+    {
+      .ml_name="_start_switch_sampling",
+      .ml_meth=(PyCFunction)mod__start_switch_sampling,
+      .ml_flags=METH_VARARGS | METH_KEYWORDS,
+      .ml_doc=mod__start_switch_sampling_doc
+    },
+    {
+      .ml_name="_stop_switch_sampling",
+      .ml_meth=(PyCFunction)mod__stop_switch_sampling,
+      .ml_flags=METH_NOARGS,
+      .ml_doc=mod__stop_switch_sampling_doc
+    },
+    {
+      .ml_name="_drain_switch_samples",
+      .ml_meth=(PyCFunction)mod__drain_switch_samples,
+      .ml_flags=METH_NOARGS,
+      .ml_doc=mod__drain_switch_samples_doc
+    },
+    {
+      .ml_name="_get_switch_sampling",
+      .ml_meth=(PyCFunction)mod__get_switch_sampling,
+      .ml_flags=METH_NOARGS,
+      .ml_doc=mod__get_switch_sampling_doc
+    },
 #if !GREENLET_PY313
     {
       .ml_name="get_tstate_trash_delete_nesting",
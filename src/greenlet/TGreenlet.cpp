@@ -26,7 +26,7 @@ Greenlet::Greenlet(PyGreenlet* p)
 }
 
 Greenlet::Greenlet(PyGreenlet* p, const StackState& initial_stack)
-    :  _self(p), stack_state(initial_stack)
+    :  _self(p), stack_state(initial_stack), _switches_in(0)
 {
     assert(p->pimpl == nullptr);
     p->pimpl = this;
@@ -74,8 +74,10 @@ Greenlet::slp_restore_state() noexcept
 #ifdef SLP_BEFORE_RESTORE_STATE
     SLP_BEFORE_RESTORE_STATE();
 #endif
+    ThreadState* const state = this->thread_state();
     this->stack_state.copy_heap_to_stack(
-           this->thread_state()->borrow_current()->stack_state);
+           state->borrow_current_without_cleanup()->stack_state,
+           SwitchStats::enabled() ? &state->switch_stats() : nullptr);
 }
 
 
@@ -89,8 +91,11 @@ Greenlet::slp_save_state(char *const stackref) noexcept
 #ifdef SLP_BEFORE_SAVE_STATE
     SLP_BEFORE_SAVE_STATE();
 #endif
+    ThreadState* const state = this->thread_state();
     return this->stack_state.copy_stack_to_heap(stackref,
-                                                this->thread_state()->borrow_current()->stack_state);
+                                                state->borrow_current_without_cleanup()->stack_state,
+                                                &state->stack_buffers(),
+                                                SwitchStats::enabled() ? &state->switch_stats() : nullptr);
 }
 
 /**
@@ -136,8 +141,18 @@ Greenlet::g_switchstack_success() noexcept
 
     // The thread state hasn't been changed yet.
     ThreadState* thread_state = this->thread_state();
-    OwnedGreenlet result(thread_state->get_current());
+    OwnedGreenlet result(thread_state->borrow_current_without_cleanup());
     thread_state->set_current(this->self());
+    this->_switches_in++;
+    if (SwitchStats::enabled()) {
+        thread_state->switch_stats().switches++;
+    }
+    SwitchSampler& sampler = thread_state->switch_sampler();
+    if (sampler.active()) {
+        // Like the trace function, a switch without args is a throw.
+        sampler.on_switch(result.borrow(), this->self().borrow(),
+                          this->args() ? SwitchSampler::EVENT_SWITCH : SwitchSampler::EVENT_THROW);
+    }
     //assert(thread_state->borrow_current().borrow() == this->_self);
     return result;
 }
@@ -7,6 +7,8 @@
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
+#include <chrono>
+
 #include "greenlet_compiler_compat.hpp"
 #include "greenlet_refs.hpp"
 #include "greenlet_cpython_compat.hpp"
@@ -174,6 +176,207 @@ namespace greenlet
         void did_finish(PyThreadState* tstate) noexcept;
     };
 
+    /**
+     * A per-thread free list of stack-copy buffers left behind by
+     * greenlets that finished while buffer retention was enabled.
+     *
+     * Buffers are linked through their own first bytes, so giving
+     * and taking never allocate. The total retained size is capped by
+     * the process-wide limit; a limit of 0 (the default) disables
+     * retention entirely and restores the classic
+     * allocate-on-save, free-on-restore behaviour.
+     */
+    class StackBufferPool
+    {
+    private:
+        struct Node
+        {
+            Node* next;
+            intptr_t size;
+        };
+        Node* head;
+        intptr_t _retained_bytes;
+        static intptr_t _max_retained_bytes;
+        // Sum of _retained_bytes over every thread's pool. All
+        // updates hold the GIL.
+        static intptr_t _total_retained_bytes;
+        G_NO_COPIES_OF_CLS(StackBufferPool);
+    public:
+        StackBufferPool();
+        // Return a buffer of at least *size* bytes (its real size
+        // goes in *capacity*), or null if none is free.
+        inline char* take(intptr_t size, intptr_t& capacity) noexcept;
+        // Keep *buf* for reuse if retention is on and it fits under
+        // the cap; otherwise free it.
+        inline void give(char* buf, intptr_t capacity) noexcept;
+        // Free everything. Requires the GIL.
+        void clear() noexcept;
+        inline intptr_t retained_bytes() const noexcept
+        {
+            return this->_retained_bytes;
+        }
+        inline static intptr_t total_retained_bytes() noexcept
+        {
+            return StackBufferPool::_total_retained_bytes;
+        }
+        inline static bool retaining() noexcept
+        {
+            return StackBufferPool::_max_retained_bytes > 0;
+        }
+        inline static intptr_t& max_retained_bytes() noexcept
+        {
+            return StackBufferPool::_max_retained_bytes;
+        }
+    };
+
+    /**
+     * Per-thread counters of stack switching and copying.
+     *
+     * Collection is off by default; when off, the switch path only
+     * pays for testing one static flag.
+     */
+    struct SwitchStats
+    {
+        unsigned long long switches;
+        unsigned long long bytes_copied_to_heap;
+        unsigned long long bytes_restored;
+        unsigned long long reallocs;
+        // Largest stack saved for a single greenlet.
+        intptr_t peak_saved_bytes;
+        static bool _enabled;
+
+        SwitchStats()
+        {
+            this->reset();
+        }
+        void reset() noexcept
+        {
+            this->switches = 0;
+            this->bytes_copied_to_heap = 0;
+            this->bytes_restored = 0;
+            this->reallocs = 0;
+            this->peak_saved_bytes = 0;
+        }
+        inline static bool& enabled() noexcept
+        {
+            return SwitchStats::_enabled;
+        }
+    };
+
+    /**
+     * Per-thread sampled switch trace.
+     *
+     * Every Nth switch (and, if an interval is set, at most one per
+     * interval) is written as a fixed-size record into a ring buffer
+     * allocated when sampling starts; once the ring is full, new
+     * records overwrite the oldest. Unlike ``settrace``, no Python
+     * code runs on the switch path. When sampling is off, the switch
+     * path only tests for a null buffer.
+     */
+    class SwitchSampler
+    {
+    public:
+        enum { EVENT_SWITCH = 0, EVENT_THROW = 1 };
+        // Layout is part of the Python API; see greenlet._sampling.
+        struct Record
+        {
+            // Addresses of the greenlet objects, i.e., their id().
+            uint64_t origin;
+            uint64_t target;
+            // std::chrono::steady_clock; CLOCK_MONOTONIC on Linux, the
+            // same clock as time.monotonic_ns().
+            uint64_t timestamp_ns;
+            uint32_t event;
+            uint32_t _reserved;
+        };
+    private:
+        Record* ring;
+        uint64_t capacity;
+        // Total records written since the last drain.
+        uint64_t written;
+        // Slot for the next record.
+        uint64_t next;
+        // Records overwritten before they could be drained, as of
+        // the last drain.
+        uint64_t _dropped;
+        uint64_t interval_ns;
+        uint64_t last_ns;
+        uint32_t every;
+        uint32_t countdown;
+        G_NO_COPIES_OF_CLS(SwitchSampler);
+
+        inline static uint64_t now_ns() noexcept
+        {
+            return std::chrono::duration_cast<std::chrono::nanoseconds>(
+                std::chrono::steady_clock::now().time_since_epoch()).count();
+        }
+    public:
+        SwitchSampler();
+        ~SwitchSampler();
+        /**
+         * Allocate a ring of *capacity* records and start sampling,
+         * discarding any previous samples. Returns false if the
+         * allocation failed (without setting a Python exception).
+         */
+        bool start(uint64_t capacity, uint32_t every, uint64_t interval_ns) noexcept;
+        void stop() noexcept;
+        /**
+         * Copy the pending records, oldest first, into *out*, which
+         * must have room for ``pending()`` records, and empty the ring.
+         */
+        void drain(Record* out) noexcept;
+
+        inline bool active() const noexcept
+        {
+            return this->ring != nullptr;
+        }
+        inline uint64_t pending() const noexcept
+        {
+            return this->written < this->capacity ? this->written : this->capacity;
+        }
+        inline uint64_t dropped() const noexcept
+        {
+            return this->_dropped + (this->written - this->pending());
+        }
+        inline uint64_t ring_capacity() const noexcept
+        {
+            return this->capacity;
+        }
+        inline uint32_t sample_every() const noexcept
+        {
+            return this->every;
+        }
+        inline uint64_t sample_interval_ns() const noexcept
+        {
+            return this->interval_ns;
+        }
+
+        inline void on_switch(const void* origin, const void* target, uint32_t event) noexcept
+        {
+            if (--this->countdown) {
+                return;
+            }
+            this->countdown = this->every;
+            const uint64_t now = SwitchSampler::now_ns();
+            if (this->interval_ns) {
+                if (now - this->last_ns < this->interval_ns) {
+                    return;
+                }
+                this->last_ns = now;
+            }
+            Record& record = this->ring[this->next];
+            if (++this->next == this->capacity) {
+                this->next = 0;
+            }
+            record.origin = (uint64_t)(uintptr_t)origin;
+            record.target = (uint64_t)(uintptr_t)target;
+            record.timestamp_ns = now;
+            record.event = event;
+            record._reserved = 0;
+            this->written++;
+        }
+    };
+
     class StackState
     {
         // By having only plain C (POD) members, no virtual functions
@@ -188,8 +391,13 @@ namespace greenlet
         char* stack_stop;
         char* stack_copy;
         intptr_t _stack_saved;
+        // Allocated size of stack_copy; can exceed _stack_saved
+        // when buffers are retained.
+        intptr_t _stack_copy_size;
         StackState* stack_prev;
-        inline int copy_stack_to_heap_up_to(const char* const stop) noexcept;
+        inline int copy_stack_to_heap_up_to(const char* const stop,
+                                            StackBufferPool* pool,
+                                            SwitchStats* stats) noexcept;
         inline void free_stack_copy() noexcept;
 
     public:
@@ -205,13 +413,17 @@ namespace greenlet
         ~StackState();
         StackState(const StackState& other);
         StackState& operator=(const StackState& other);
-        inline void copy_heap_to_stack(const StackState& current) noexcept;
-        inline int copy_stack_to_heap(char* const stackref, const StackState& current) noexcept;
+        inline void copy_heap_to_stack(const StackState& current,
+                                       SwitchStats* stats=nullptr) noexcept;
+        inline int copy_stack_to_heap(char* const stackref,
+                                      const StackState& current,
+                                      StackBufferPool* pool=nullptr,
+                                      SwitchStats* stats=nullptr) noexcept;
         inline bool started() const noexcept;
         inline bool main() const noexcept;
         inline bool active() const noexcept;
         inline void set_active() noexcept;
-        inline void set_inactive() noexcept;
+        inline void set_inactive(StackBufferPool* pool=nullptr) noexcept;
         inline intptr_t stack_saved() const noexcept;
         inline char* stack_start() const noexcept;
         static inline StackState make_main() noexcept;
@@ -347,6 +559,9 @@ namespace greenlet
         SwitchingArgs switch_args;
         StackState stack_state;
         PythonState python_state;
+        // Times this greenlet has been switched into, including
+        // being started. Kept always: it costs one increment.
+        uint64_t _switches_in;
         Greenlet(PyGreenlet* p, const StackState& initial_state);
     public:
         // This constructor takes ownership of the PyGreenlet, by
@@ -382,6 +597,11 @@ namespace greenlet
             return this->stack_state.stack_saved();
         }
 
+        inline uint64_t switches_in() const noexcept
+        {
+            return this->_switches_in;
+        }
+
         // This is used by the macro SLP_SAVE_STATE to compute the
         // difference in stack sizes. It might be nice to handle the
         // computation ourself, but the type of the result
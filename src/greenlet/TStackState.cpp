@@ -16,6 +16,7 @@ std::ostream& operator<<(std::ostream& os, const StackState& s)
        << ", stack_stop=" << (void*)s.stack_stop
        << ", stack_copy=" << (void*)s.stack_copy
        << ", stack_saved=" << s._stack_saved
+       << ", stack_copy_size=" << s._stack_copy_size
        << ", stack_prev=" << s.stack_prev
        << ", addr=" << &s
        << ")";
@@ -23,11 +24,129 @@ std::ostream& operator<<(std::ostream& os, const StackState& s)
 }
 #endif
 
+intptr_t StackBufferPool::_max_retained_bytes(0);
+intptr_t StackBufferPool::_total_retained_bytes(0);
+bool SwitchStats::_enabled(false);
+
+StackBufferPool::StackBufferPool()
+    : head(nullptr),
+      _retained_bytes(0)
+{
+}
+
+inline char* StackBufferPool::take(intptr_t size, intptr_t& capacity) noexcept
+{
+    // First fit. The list is short (bounded by the byte cap) and
+    // stacks of one workload tend to be similar sizes.
+    Node** link = &this->head;
+    while (*link) {
+        Node* node = *link;
+        if (node->size >= size) {
+            *link = node->next;
+            capacity = node->size;
+            this->_retained_bytes -= node->size;
+            StackBufferPool::_total_retained_bytes -= node->size;
+            return reinterpret_cast<char*>(node);
+        }
+        link = &node->next;
+    }
+    return nullptr;
+}
+
+inline void StackBufferPool::give(char* buf, intptr_t capacity) noexcept
+{
+    if (!buf) {
+        return;
+    }
+    if (!StackBufferPool::retaining()
+        || capacity < (intptr_t)sizeof(Node)
+        || this->_retained_bytes + capacity > StackBufferPool::_max_retained_bytes) {
+        PyMem_Free(buf);
+        return;
+    }
+    Node* node = reinterpret_cast<Node*>(buf);
+    node->next = this->head;
+    node->size = capacity;
+    this->head = node;
+    this->_retained_bytes += capacity;
+    StackBufferPool::_total_retained_bytes += capacity;
+}
+
+void StackBufferPool::clear() noexcept
+{
+    while (this->head) {
+        Node* node = this->head;
+        this->head = node->next;
+        PyMem_Free(node);
+    }
+    StackBufferPool::_total_retained_bytes -= this->_retained_bytes;
+    this->_retained_bytes = 0;
+}
+
+SwitchSampler::SwitchSampler()
+    : ring(nullptr),
+      capacity(0),
+      written(0),
+      next(0),
+      _dropped(0),
+      interval_ns(0),
+      last_ns(0),
+      every(1),
+      countdown(1)
+{
+}
+
+SwitchSampler::~SwitchSampler()
+{
+    this->stop();
+}
+
+bool SwitchSampler::start(uint64_t capacity, uint32_t every, uint64_t interval_ns) noexcept
+{
+    assert(capacity > 0 && every > 0);
+    this->stop();
+    // Allocated up front so the switch path never allocates.
+    this->ring = static_cast<Record*>(PyMem_Calloc((size_t)capacity, sizeof(Record)));
+    if (!this->ring) {
+        return false;
+    }
+    this->capacity = capacity;
+    this->every = this->countdown = every;
+    this->interval_ns = interval_ns;
+    return true;
+}
+
+void SwitchSampler::stop() noexcept
+{
+    PyMem_Free(this->ring);
+    this->ring = nullptr;
+    this->capacity = this->written = this->next = this->_dropped = 0;
+    this->interval_ns = this->last_ns = 0;
+    this->every = this->countdown = 1;
+}
+
+void SwitchSampler::drain(Record* out) noexcept
+{
+    const uint64_t count = this->pending();
+    if (!count) {
+        return;
+    }
+    // When the ring has wrapped, the oldest record is the next one
+    // to be overwritten.
+    const uint64_t oldest = this->written > this->capacity ? this->next : 0;
+    const uint64_t tail = count < this->capacity - oldest ? count : this->capacity - oldest;
+    memcpy(out, this->ring + oldest, tail * sizeof(Record));
+    memcpy(out + tail, this->ring, (count - tail) * sizeof(Record));
+    this->_dropped += this->written - count;
+    this->written = this->next = 0;
+}
+
 StackState::StackState(void* mark, StackState& current)
     : _stack_start(nullptr),
       stack_stop((char*)mark),
       stack_copy(nullptr),
       _stack_saved(0),
+      _stack_copy_size(0),
       /* Skip a dying greenlet */
       stack_prev(current._stack_start
                  ? &current
@@ -40,6 +159,7 @@ StackState::StackState()
       stack_stop(nullptr),
       stack_copy(nullptr),
       _stack_saved(0),
+      _stack_copy_size(0),
       stack_prev(nullptr)
 {
 }
@@ -51,6 +171,7 @@ StackState::StackState(const StackState& other)
       stack_stop(nullptr),
       stack_copy(nullptr),
       _stack_saved(0),
+      _stack_copy_size(0),
       stack_prev(nullptr)
 {
     this->operator=(other);
@@ -61,7 +182,7 @@ StackState& StackState::operator=(const StackState& other)
     if (&other == this) {
         return *this;
     }
-    if (other._stack_saved) {
+    if (other.stack_copy) {
         throw std::runtime_error("Refusing to steal memory.");
     }
 
@@ -72,6 +193,7 @@ StackState& StackState::operator=(const StackState& other)
     this->stack_stop = other.stack_stop;
     this->stack_copy = other.stack_copy;
     this->_stack_saved = other._stack_saved;
+    this->_stack_copy_size = other._stack_copy_size;
     this->stack_prev = other.stack_prev;
     return *this;
 }
@@ -81,15 +203,27 @@ inline void StackState::free_stack_copy() noexcept
     PyMem_Free(this->stack_copy);
     this->stack_copy = nullptr;
     this->_stack_saved = 0;
+    this->_stack_copy_size = 0;
 }
 
-inline void StackState::copy_heap_to_stack(const StackState& current) noexcept
+inline void StackState::copy_heap_to_stack(const StackState& current,
+                                           SwitchStats* stats) noexcept
 {
 
     /* Restore the heap copy back into the C stack */
     if (this->_stack_saved != 0) {
         memcpy(this->_stack_start, this->stack_copy, this->_stack_saved);
-        this->free_stack_copy();
+        if (stats) {
+            stats->bytes_restored += this->_stack_saved;
+        }
+        if (StackBufferPool::retaining()) {
+            // Keep the allocation for the next time we're switched
+            // out; it's the high-water mark of what we've needed.
+            this->_stack_saved = 0;
+        }
+        else {
+            this->free_stack_copy();
+        }
     }
     StackState* owner = const_cast<StackState*>(&current);
     if (!owner->_stack_start) {
@@ -103,7 +237,9 @@ inline void StackState::copy_heap_to_stack(const StackState& current) noexcept
     // cerr << "\tFinished with: " << *this << endl;
 }
 
-inline int StackState::copy_stack_to_heap_up_to(const char* const stop) noexcept
+inline int StackState::copy_stack_to_heap_up_to(const char* const stop,
+                                                StackBufferPool* pool,
+                                                SwitchStats* stats) noexcept
 {
     /* Save more of g's stack into the heap -- at least up to 'stop'
        g->stack_stop |________|
@@ -119,20 +255,42 @@ inline int StackState::copy_stack_to_heap_up_to(const char* const stop) noexcept
     intptr_t sz2 = stop - this->_stack_start;
     assert(this->_stack_start);
     if (sz2 > sz1) {
-        char* c = (char*)PyMem_Realloc(this->stack_copy, sz2);
-        if (!c) {
-            PyErr_NoMemory();
-            return -1;
+        if (sz2 > this->_stack_copy_size) {
+            char* c = nullptr;
+            intptr_t capacity = sz2;
+            if (!this->stack_copy && pool) {
+                c = pool->take(sz2, capacity);
+            }
+            if (!c) {
+                capacity = sz2;
+                c = (char*)PyMem_Realloc(this->stack_copy, sz2);
+                if (stats) {
+                    stats->reallocs++;
+                }
+            }
+            if (!c) {
+                PyErr_NoMemory();
+                return -1;
+            }
+            this->stack_copy = c;
+            this->_stack_copy_size = capacity;
         }
-        memcpy(c + sz1, this->_stack_start + sz1, sz2 - sz1);
-        this->stack_copy = c;
+        memcpy(this->stack_copy + sz1, this->_stack_start + sz1, sz2 - sz1);
         this->_stack_saved = sz2;
+        if (stats) {
+            stats->bytes_copied_to_heap += sz2 - sz1;
+            if (sz2 > stats->peak_saved_bytes) {
+                stats->peak_saved_bytes = sz2;
+            }
+        }
     }
     return 0;
 }
 
 inline int StackState::copy_stack_to_heap(char* const stackref,
-                                          const StackState& current) noexcept
+                                          const StackState& current,
+                                          StackBufferPool* pool,
+                                          SwitchStats* stats) noexcept
 {
     /* must free all the C stack up to target_stop */
     const char* const target_stop = this->stack_stop;
@@ -148,13 +306,13 @@ inline int StackState::copy_stack_to_heap(char* const stackref,
 
     while (owner->stack_stop < target_stop) {
         /* ts_current is entierely within the area to free */
-        if (owner->copy_stack_to_heap_up_to(owner->stack_stop)) {
+        if (owner->copy_stack_to_heap_up_to(owner->stack_stop, pool, stats)) {
             return -1; /* XXX */
         }
         owner = owner->stack_prev;
     }
     if (owner != this) {
-        if (owner->copy_stack_to_heap_up_to(target_stop)) {
+        if (owner->copy_stack_to_heap_up_to(target_stop, pool, stats)) {
             return -1; /* XXX */
         }
     }
@@ -182,7 +340,7 @@ inline void StackState::set_active() noexcept
     this->_stack_start = (char*)1;
 }
 
-inline void StackState::set_inactive() noexcept
+inline void StackState::set_inactive(StackBufferPool* pool) noexcept
 {
     this->_stack_start = nullptr;
     // XXX: What if we still have memory out there?
@@ -195,7 +353,15 @@ inline void StackState::set_inactive() noexcept
     // Those objects never get deallocated, so the destructor never
     // runs.
     // It *seems* safe to clean up the memory here?
-    if (this->_stack_saved) {
+    //
+    // A retained buffer outlives us: hand it to the thread's pool
+    // so the next greenlet to start there can reuse it.
+    if (this->stack_copy && pool && !this->_stack_saved) {
+        pool->give(this->stack_copy, this->_stack_copy_size);
+        this->stack_copy = nullptr;
+        this->_stack_copy_size = 0;
+    }
+    else if (this->stack_copy) {
         this->free_stack_copy();
     }
 }
@@ -221,7 +387,7 @@ inline StackState StackState::make_main() noexcept
 
 StackState::~StackState()
 {
-    if (this->_stack_saved != 0) {
+    if (this->stack_copy) {
         this->free_stack_copy();
     }
 }
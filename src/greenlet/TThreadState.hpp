@@ -113,12 +113,32 @@ private:
        refcounts are incremented in the copy.
     */
     deleteme_t deleteme;
+    /* Index of the oldest entry of deleteme still owned; budgeted
+       batches release from here so the list drains first in, first
+       out. Entries before it are already released and are dropped
+       when the list is compacted. */
+    deleteme_t::size_type deleteme_head;
+    /* True while a budgeted batch of deleteme is being released. */
+    bool releasing_deleteme;
+
+    /* Stack-copy buffers from finished greenlets, kept for reuse
+       when retention is enabled. */
+    StackBufferPool _stack_buffers;
+
+    /* Switch and stack-copy counters; see SwitchStats. */
+    SwitchStats _switch_stats;
+
+    /* Sampled switch records; see SwitchSampler. */
+    SwitchSampler _switch_sampler;
 
 #ifdef GREENLET_NEEDS_EXCEPTION_STATE_SAVED
     void* exception_state;
 #endif
 
     static std::clock_t _clocks_used_doing_gc;
+    // Most greenlets from the deleteme list to release per switch;
+    // 0 means all of them.
+    static Py_ssize_t _deleteme_budget;
     static ImmortalString get_referrers_name;
     static PythonAllocator<ThreadState> allocator;
 
@@ -164,6 +184,8 @@ public:
     }
 
     ThreadState()
+        : deleteme_head(0),
+          releasing_deleteme(false)
     {
 
 #ifdef GREENLET_NEEDS_EXCEPTION_STATE_SAVED
@@ -257,6 +279,16 @@ public:
         return this->current_greenlet;
     }
 
+    /**
+     * As for borrow_current(), but does no maintenance. Use this in
+     * the middle of a switch, where releasing greenlets (and so
+     * running arbitrary Python code) is not allowed.
+     */
+    inline BorrowedGreenlet borrow_current_without_cleanup() const noexcept
+    {
+        return this->current_greenlet;
+    }
+
     template<typename T, refs::TypeChecker TC>
     inline bool is_current(const refs::PyObjectPointer<T, TC>& obj) const
     {
@@ -282,12 +314,58 @@ private:
      */
     inline void clear_deleteme_list(const bool murder=false)
     {
-        if (!this->deleteme.empty()) {
+        if (ThreadState::_deleteme_budget && !murder) {
+            // Release a bounded batch so that a large backlog is
+            // spread over many switches instead of stalling one.
+            // Releasing a greenlet throws into it, and those switches
+            // come back here; they must not start batches of their
+            // own in the middle of that throw. Nor may we clobber an
+            // exception that is on its way somewhere.
+            if (this->releasing_deleteme || PyErr_Occurred()) {
+                return;
+            }
+            this->releasing_deleteme = true;
+            // Items are taken one at a time from the head, oldest
+            // first, so greenlets added while Python code runs wait
+            // their turn behind the existing backlog. Index access,
+            // because a release can append to (and reallocate) the
+            // list.
+            for (Py_ssize_t i = 0;
+                 i < ThreadState::_deleteme_budget
+                     && this->deleteme_head < this->deleteme.size();
+                 ++i) {
+                PyGreenlet* to_del = this->deleteme[this->deleteme_head];
+                this->deleteme[this->deleteme_head++] = nullptr;
+                Py_DECREF(to_del);
+                if (PyErr_Occurred()) {
+                    PyErr_WriteUnraisable(nullptr);
+                    PyErr_Clear();
+                }
+            }
+            // Drop the released prefix once it is at least half the
+            // list; each entry is then moved O(1) times on average.
+            if (this->deleteme_head == this->deleteme.size()) {
+                this->deleteme.clear();
+                this->deleteme_head = 0;
+            }
+            else if (this->deleteme_head * 2 >= this->deleteme.size()) {
+                this->deleteme.erase(this->deleteme.begin(),
+                                     this->deleteme.begin() + this->deleteme_head);
+                this->deleteme_head = 0;
+            }
+            this->releasing_deleteme = false;
+            return;
+        }
+        if (this->deleteme_head < this->deleteme.size()) {
             // It's possible we could add items to this list while
             // running Python code if there's a thread switch, so we
             // need to defensively copy it before that can happen.
-            deleteme_t copy = this->deleteme;
+            // Entries before the head were released by a budgeted
+            // batch already.
+            deleteme_t copy(this->deleteme.begin() + this->deleteme_head,
+                            this->deleteme.end());
             this->deleteme.clear(); // in case things come back on the list
+            this->deleteme_head = 0;
             for(deleteme_t::iterator it = copy.begin(), end = copy.end();
                 it != end;
                 ++it ) {
@@ -346,6 +424,34 @@ public:
         this->deleteme.push_back(to_del);
     }
 
+    /**
+     * The number of greenlets waiting on the deleteme list.
+     */
+    inline Py_ssize_t deleteme_backlog() const noexcept
+    {
+        return (Py_ssize_t)(this->deleteme.size() - this->deleteme_head);
+    }
+
+    inline static Py_ssize_t& deleteme_budget() noexcept
+    {
+        return ThreadState::_deleteme_budget;
+    }
+
+    inline StackBufferPool& stack_buffers() noexcept
+    {
+        return this->_stack_buffers;
+    }
+
+    inline SwitchStats& switch_stats() noexcept
+    {
+        return this->_switch_stats;
+    }
+
+    inline SwitchSampler& switch_sampler() noexcept
+    {
+        return this->_switch_sampler;
+    }
+
     /**
      * Set to std::clock_t(-1) to disable.
      */
@@ -475,6 +581,9 @@ public:
             this->main_greenlet.CLEAR();
         }
 
+        // Anything that died above may have returned a buffer.
+        this->_stack_buffers.clear();
+
         if (PyErr_Occurred()) {
             PyErr_WriteUnraisable(NULL);
             PyErr_Clear();
@@ -487,6 +596,7 @@ public:
 ImmortalString ThreadState::get_referrers_name(nullptr);
 PythonAllocator<ThreadState> ThreadState::allocator;
 std::clock_t ThreadState::_clocks_used_doing_gc(0);
+Py_ssize_t ThreadState::_deleteme_budget(0);
 
 
 
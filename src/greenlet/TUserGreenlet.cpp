@@ -278,7 +278,7 @@ UserGreenlet::g_initialstub(void* mark)
     /* start the greenlet */
     ThreadState& thread_state = GET_THREAD_STATE().state();
     this->stack_state = StackState(mark,
-                                   thread_state.borrow_current()->stack_state);
+                                   thread_state.borrow_current_without_cleanup()->stack_state);
     this->python_state.set_initial_state(PyThreadState_GET());
     this->exception_state.clear();
     this->_main_greenlet = thread_state.get_main_greenlet();
@@ -524,7 +524,7 @@ UserGreenlet::inner_bootstrap(PyGreenlet* origin_greenlet, PyObject* run)
     assert(this->thread_state()->borrow_current() == this->_self);
 
     /* jump back to parent */
-    this->stack_state.set_inactive(); /* dead */
+    this->stack_state.set_inactive(&this->thread_state()->stack_buffers()); /* dead */
 
 
     // TODO: Can we decref some things here? Release our main greenlet
@@ -16,6 +16,11 @@ __all__ = [
     'getcurrent',
     'greenlet',
 
+    'Hashlet',
+    'Pool',
+    'RehashingHashlet',
+    'run_round_robin',
+
     'gettrace',
     'settrace',
 ]
@@ -39,6 +44,10 @@ from ._greenlet import error
 ###
 from ._greenlet import getcurrent
 from ._greenlet import greenlet
+from ._greenlet import run_round_robin
+from ._pool import Pool
+from ._hashlet import Hashlet
+from ._hashlet import RehashingHashlet
 
 ###
 # tracing
@@ -67,5 +76,19 @@ from ._greenlet import GREENLET_USE_TRACING # pylint:disable=unused-import
 from ._greenlet import CLOCKS_PER_SEC # pylint:disable=unused-import
 from ._greenlet import enable_optional_cleanup # pylint:disable=unused-import
 from ._greenlet import get_clocks_used_doing_optional_cleanup # pylint:disable=unused-import
+# Spreading cross-thread greenlet cleanup over switches. Provisional API in 3.2.5.
+from ._greenlet import set_cross_thread_cleanup_budget # pylint:disable=unused-import
+from ._greenlet import get_cross_thread_cleanup_backlog # pylint:disable=unused-import
+# Reusing saved-stack buffers. Provisional API in 3.2.5.
+from ._greenlet import set_stack_buffer_retention # pylint:disable=unused-import
+# Switch and stack-copy counters. Provisional API in 3.2.5.
+from ._greenlet import _enable_stats # pylint:disable=unused-import
+from ._greenlet import _get_stats # pylint:disable=unused-import
+from ._greenlet import _reset_stats # pylint:disable=unused-import
+# Sampled switch records; see greenlet._sampling. Provisional API in 3.2.5.
+from ._greenlet import _start_switch_sampling # pylint:disable=unused-import
+from ._greenlet import _stop_switch_sampling # pylint:disable=unused-import
+from ._greenlet import _drain_switch_samples # pylint:disable=unused-import
+from ._greenlet import _get_switch_sampling # pylint:disable=unused-import
 
 # Other APIS in the _greenlet module are for test support.
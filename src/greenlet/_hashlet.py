@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Greenlets with a hash identity.
+
+A :class:`Hashlet` is an ordinary greenlet that also carries a SHA-256
+``hash_id`` and a matching ``rgb_color`` for display. Both are
+computed the first time they are read, so creating a hashlet costs
+the same as creating a greenlet. ``switch_count`` comes from the
+counter kept by the switch itself, so a hashlet does not override
+:meth:`~greenlet.greenlet.switch` and switches exactly as fast as a
+plain greenlet.
+
+To get a fresh ``hash_id`` after every switch, use
+:class:`RehashingHashlet`. It pays for a SHA-256 on each switch.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+import itertools
+import time
+
+from ._greenlet import greenlet
+
+# Keeps hashes distinct when the clock doesn't tick between them.
+_rehashes = itertools.count()
+
+
+class Hashlet(greenlet):
+    """
+    Hashlet(run=None, parent=None) -> hashlet
+
+    A greenlet with a lazily computed ``hash_id`` and ``rgb_color``.
+    """
+
+    @property
+    def hash_id(self):
+        """
+        Hex SHA-256 of this hashlet's ``id()`` and the time it was
+        first asked for; stable until :meth:`rehash`.
+        """
+        try:
+            return self.__dict__['hash_id']
+        except KeyError:
+            return self.rehash()
+
+    @property
+    def rgb_color(self):
+        """``hash_id`` as a ``#rrggbb`` color string."""
+        try:
+            return self.__dict__['rgb_color']
+        except KeyError:
+            color = self.__dict__['rgb_color'] = '#%06x' % (int(self.hash_id, 16) % 0xFFFFFF)
+            return color
+
+    @property
+    def switch_count(self):
+        """
+        How many times this hashlet has been switched into, including
+        being started.
+        """
+        return self._switch_count
+
+    def rehash(self):
+        """Compute, store and return a new ``hash_id``."""
+        data = '%d:%r:%d' % (id(self), time.time(), next(_rehashes))
+        hash_id = self.__dict__['hash_id'] = hashlib.sha256(data.encode()).hexdigest()
+        self.__dict__.pop('rgb_color', None)
+        return hash_id
+
+
+class RehashingHashlet(Hashlet):
+    """
+    A :class:`Hashlet` that takes a new ``hash_id`` each time a call
+    to :meth:`switch` returns.
+    """
+
+    def switch(self, *args, **kwargs):
+        result = greenlet.switch(self, *args, **kwargs)
+        self.rehash()
+        return result
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+A pool of parked greenlets for running many short tasks.
+
+Creating a greenlet, starting it, and letting it die costs more than
+a task that only runs for a few microseconds. A :class:`Pool` keeps
+finished workers parked instead, and hands each new task to one of
+them with a single switch.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from ._greenlet import GreenletExit
+from ._greenlet import getcurrent
+from ._greenlet import greenlet
+
+
+class _Worker(greenlet):
+    # Set by the worker just before it switches back with a result; a
+    # task that switched away in the middle leaves it False.
+    idle = False
+
+
+def _park(value, throw):
+    # Hand *value* to the parent and wait for the next task. The worker
+    # must not keep a reference to itself in any of its frames while
+    # parked: suspended greenlets are never garbage collected, so such
+    # a cycle would leak the worker after the pool is gone.
+    worker = getcurrent()
+    worker.idle = True
+    parent = worker.parent
+    del worker
+    if throw:
+        return parent.throw(value)
+    return parent.switch(value)
+
+
+def _work():
+    # Arguments of a greenlet's first switch stay referenced from its
+    # C stack until it dies, so tasks only ever arrive through _park.
+    func, args, kwargs = _park(None, False)
+    while True:
+        try:
+            result = func(*args, **kwargs)
+        except GreenletExit:
+            # Being killed (e.g., collected while the task was
+            # switched away); let it end the worker.
+            raise
+        except BaseException as ex: # pylint:disable=broad-except
+            error = ex
+            del ex
+            func = args = kwargs = None
+            func, args, kwargs = _park(error, True)
+        else:
+            func = args = kwargs = None
+            func, args, kwargs = _park(result, False)
+        result = error = None
+
+
+class Pool(object):
+    """
+    Pool(size=None) -> Pool
+
+    Run callables in reusable worker greenlets.
+
+    :meth:`run` switches into a parked worker (creating one if none is
+    free), calls the function there, and returns its result or raises
+    its exception in the caller. The worker's parent is the calling
+    greenlet. When the task finishes, the worker is parked again,
+    keeping at most *size* workers (no limit if ``None``).
+
+    A task that switches away before finishing keeps its worker; if
+    that worker later finishes the task, it switches to its parent
+    like any other greenlet and is not reused.
+
+    Workers belong to the thread that created them, so a pool must
+    only be used from one thread.
+
+    .. versionadded:: 3.2.5
+    """
+
+    def __init__(self, size=None):
+        if size is not None and size < 0:
+            raise ValueError("size must be None or >= 0")
+        self.size = size
+        self._idle = []
+
+    def __len__(self):
+        """The number of parked workers."""
+        return len(self._idle)
+
+    def run(self, func, *args, **kwargs):
+        """
+        Call ``func(*args, **kwargs)`` in a worker greenlet and return
+        the result.
+        """
+        idle = self._idle
+        current = getcurrent()
+        if idle:
+            worker = idle.pop()
+            if worker.parent is not current:
+                worker.parent = current
+        else:
+            worker = _Worker(_work)
+            worker.switch()
+        worker.idle = False
+        try:
+            return worker.switch(func, args, kwargs)
+        finally:
+            if worker.idle and (self.size is None or len(idle) < self.size):
+                idle.append(worker)
+
+    def map(self, func, iterable):
+        """Like :func:`map`, but each call runs in a worker."""
+        run = self.run
+        for item in iterable:
+            yield run(func, item)
+
+    def close(self):
+        """
+        Drop the parked workers. Each one is killed with
+        :exc:`GreenletExit` when it is collected.
+        """
+        del self._idle[:]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
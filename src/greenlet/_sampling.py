@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Decoding sampled switch records.
+
+``_start_switch_sampling()`` makes the current thread write a record
+for a sample of its switches into a preallocated ring buffer, without
+calling into Python; ``_drain_switch_samples()`` hands them over in
+bulk as packed bytes. The helpers here turn those bytes into tuples,
+or into a NumPy structured array without copying.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import struct
+
+from ._greenlet import _drain_switch_samples
+
+#: ``struct`` format of one record: origin id, target id,
+#: timestamp in nanoseconds, event, reserved.
+RECORD_FORMAT = '=QQQI4x'
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+#: A NumPy dtype description of one record, for ``numpy.dtype()``.
+RECORD_DTYPE = [
+    ('origin', '=u8'),
+    ('target', '=u8'),
+    ('timestamp_ns', '=u8'),
+    ('event', '=u4'),
+    ('_reserved', '=u4'),
+]
+
+#: Names of the ``event`` values, by value.
+EVENTS = ('switch', 'throw')
+
+
+def decode_switch_samples(data):
+    """
+    Return a list of ``(origin_id, target_id, timestamp_ns, event)``
+    tuples from the bytes of ``_drain_switch_samples()``, with
+    *event* as a name from :data:`EVENTS`.
+    """
+    return [(origin, target, ts, EVENTS[event])
+            for origin, target, ts, event in struct.iter_unpack(RECORD_FORMAT, data)]
+
+
+def switch_samples_array(data=None):
+    """
+    Return the records in *data* (by default, freshly drained from the
+    current thread) as a NumPy structured array sharing its memory.
+
+    Requires NumPy; the array is read-only.
+    """
+    import numpy # pylint:disable=import-outside-toplevel
+    if data is None:
+        data = _drain_switch_samples()
+    return numpy.frombuffer(data, dtype=numpy.dtype(RECORD_DTYPE))
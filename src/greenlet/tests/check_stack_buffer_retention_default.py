@@ -0,0 +1,10 @@
+"""
+Report stack buffer retention as a fresh interpreter starts: the bytes
+retained, then the setting that ``set_stack_buffer_retention`` replaces.
+"""
+
+import greenlet
+from greenlet import _greenlet
+
+print(_greenlet.get_retained_stack_bytes())
+print(greenlet.set_stack_buffer_retention(0))
@@ -0,0 +1,64 @@
+import threading
+
+import greenlet
+from . import TestCase
+
+
+class TestCrossThreadCleanupBudget(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(greenlet.set_cross_thread_cleanup_budget,
+                        greenlet.set_cross_thread_cleanup_budget(0))
+
+    def _release_in_other_thread(self, count, seen):
+        def run(i):
+            try:
+                greenlet.getcurrent().parent.switch()
+            finally:
+                seen.append(i)
+
+        doomed = []
+        for i in range(count):
+            g = greenlet.greenlet(run)
+            g.switch(i)
+            doomed.append(g)
+        del g
+
+        def drop():
+            # Oldest first, so the deleteme list is in index order.
+            while doomed:
+                del doomed[0]
+
+        t = threading.Thread(target=drop)
+        t.start()
+        t.join(10)
+        self.assertEqual(seen, [])
+        self.assertEqual(greenlet.get_cross_thread_cleanup_backlog(), count)
+
+    def test_default_releases_everything(self):
+        seen = []
+        self._release_in_other_thread(5, seen)
+        greenlet.getcurrent()
+        self.assertEqual(greenlet.get_cross_thread_cleanup_backlog(), 0)
+        self.assertEqual(sorted(seen), list(range(5)))
+
+    def test_budget_spreads_cleanup(self):
+        self.assertEqual(greenlet.set_cross_thread_cleanup_budget(2), 0)
+        seen = []
+        self._release_in_other_thread(5, seen)
+        greenlet.getcurrent()
+        self.assertEqual(greenlet.get_cross_thread_cleanup_backlog(), 3)
+        self.assertEqual(seen, [0, 1])
+        greenlet.getcurrent()
+        self.assertEqual(greenlet.get_cross_thread_cleanup_backlog(), 1)
+        greenlet.getcurrent()
+        self.assertEqual(greenlet.get_cross_thread_cleanup_backlog(), 0)
+        # Released in the order they were queued.
+        self.assertEqual(seen, list(range(5)))
+
+    def test_bad_budget(self):
+        with self.assertRaises(ValueError):
+            greenlet.set_cross_thread_cleanup_budget(-1)
+        self.assertEqual(greenlet.set_cross_thread_cleanup_budget(3), 0)
+        self.assertEqual(greenlet.set_cross_thread_cleanup_budget(0), 3)
@@ -0,0 +1,69 @@
+import greenlet
+from greenlet import Hashlet
+from greenlet import RehashingHashlet
+from . import TestCase
+
+
+def _bounce(n):
+    main = greenlet.getcurrent().parent
+    for _ in range(n):
+        main.switch()
+    return 'done'
+
+
+class TestHashlet(TestCase):
+
+    def test_is_a_greenlet(self):
+        h = Hashlet(_bounce)
+        self.assertIsInstance(h, greenlet.greenlet)
+        self.assertIs(Hashlet.switch, greenlet.greenlet.switch)
+        self.assertEqual(h.switch(0), 'done')
+        self.assertTrue(h.dead)
+
+    def test_hash_is_lazy_and_stable(self):
+        h = Hashlet()
+        self.assertNotIn('hash_id', h.__dict__)
+        hash_id = h.hash_id
+        self.assertEqual(len(hash_id), 64)
+        int(hash_id, 16)
+        self.assertEqual(h.hash_id, hash_id)
+        self.assertRegex(h.rgb_color, '^#[0-9a-f]{6}$')
+        self.assertEqual(h.rgb_color, '#%06x' % (int(hash_id, 16) % 0xFFFFFF))
+
+    def test_rehash(self):
+        h = Hashlet()
+        color = h.rgb_color
+        old = h.hash_id
+        new = h.rehash()
+        self.assertNotEqual(new, old)
+        self.assertEqual(h.hash_id, new)
+        if color != '#%06x' % (int(new, 16) % 0xFFFFFF):
+            self.assertNotEqual(h.rgb_color, color)
+
+    def test_switch_count(self):
+        h = Hashlet(_bounce)
+        self.assertEqual(h.switch_count, 0)
+        h.switch(3)
+        self.assertEqual(h.switch_count, 1)
+        h.switch()
+        h.switch()
+        self.assertEqual(h.switch_count, 3)
+        h.switch()
+        self.assertTrue(h.dead)
+        self.assertEqual(h.switch_count, 4)
+        # Plain greenlets count too.
+        main = greenlet.getcurrent()
+        before = main._switch_count
+        greenlet.greenlet(lambda: None).switch()
+        self.assertEqual(main._switch_count, before + 1)
+
+    def test_rehashing_hashlet(self):
+        h = RehashingHashlet(_bounce)
+        first = h.hash_id
+        h.switch(2)
+        second = h.hash_id
+        self.assertNotEqual(second, first)
+        h.switch()
+        self.assertNotEqual(h.hash_id, second)
+        self.assertEqual(h.switch(), 'done')
+        self.assertEqual(h.switch_count, 3)
@@ -0,0 +1,79 @@
+import gc
+import weakref
+
+import greenlet
+from greenlet import Pool
+from . import TestCase
+
+
+class TestPool(TestCase):
+
+    def test_run_returns_result_and_reuses_worker(self):
+        pool = Pool()
+        workers = set()
+
+        def task(x, y=0):
+            workers.add(greenlet.getcurrent())
+            return x + y
+
+        self.assertEqual(pool.run(task, 1, y=2), 3)
+        self.assertEqual(pool.run(task, 4), 4)
+        self.assertEqual(len(workers), 1)
+        self.assertEqual(len(pool), 1)
+        self.assertNotIn(greenlet.getcurrent(), workers)
+
+    def test_worker_parent_is_caller(self):
+        pool = Pool()
+        main = greenlet.getcurrent()
+        self.assertIs(pool.run(lambda: greenlet.getcurrent().parent), main)
+
+        def nested():
+            return pool.run(lambda: greenlet.getcurrent().parent)
+
+        g = greenlet.greenlet(nested)
+        self.assertIs(g.switch(), g)
+
+    def test_exception_propagates_and_worker_survives(self):
+        pool = Pool()
+
+        def boom():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            pool.run(boom)
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(pool.run(lambda: 42), 42)
+        self.assertEqual(len(pool), 1)
+
+    def test_size_limits_parked_workers(self):
+        pool = Pool(size=1)
+
+        def outer():
+            # The first worker is busy, so this needs a second one.
+            return pool.run(lambda: 1) + 1
+
+        self.assertEqual(pool.run(outer), 2)
+        self.assertEqual(len(pool), 1)
+        self.assertRaises(ValueError, Pool, -1)
+
+    def test_task_that_switches_away_is_not_parked(self):
+        pool = Pool()
+        main = greenlet.getcurrent()
+        self.assertEqual(pool.run(lambda: main.switch('away')), 'away')
+        self.assertEqual(len(pool), 0)
+
+    def test_map(self):
+        with Pool() as pool:
+            self.assertEqual(list(pool.map(str, range(5))), ['0', '1', '2', '3', '4'])
+            self.assertEqual(len(pool), 1)
+        self.assertEqual(len(pool), 0)
+
+    def test_close_kills_workers(self):
+        pool = Pool()
+        pool.run(lambda: None)
+        worker = weakref.ref(pool._idle[0])
+        self.assertFalse(worker().dead)
+        pool.close()
+        gc.collect()
+        self.assertEqual(len(pool), 0)
+        self.assertIsNone(worker())
@@ -0,0 +1,59 @@
+import greenlet
+from greenlet import run_round_robin
+from . import TestCase
+
+
+def _stepper(log, name, steps):
+    def run():
+        main = greenlet.getcurrent().parent
+        for i in range(steps):
+            log.append((name, i))
+            main.switch('ignored')
+        return name
+    return greenlet.greenlet(run)
+
+
+class TestRunRoundRobin(TestCase):
+
+    def test_interleaves_and_drops_dead(self):
+        log = []
+        gs = [_stepper(log, 'a', 3), _stepper(log, 'b', 1), _stepper(log, 'c', 2)]
+        self.assertEqual(run_round_robin(gs), [])
+        self.assertEqual(log, [('a', 0), ('b', 0), ('c', 0),
+                               ('a', 1), ('c', 1),
+                               ('a', 2)])
+        self.assertTrue(all(g.dead for g in gs))
+
+    def test_max_rounds_returns_survivors(self):
+        log = []
+        a = _stepper(log, 'a', 5)
+        b = _stepper(log, 'b', 1)
+        self.assertEqual(run_round_robin([a, b], max_rounds=2), [a])
+        self.assertEqual(log, [('a', 0), ('b', 0), ('a', 1)])
+        self.assertEqual(run_round_robin((a,), max_rounds=0), [a])
+        self.assertEqual(run_round_robin(iter([a])), [])
+        self.assertTrue(a.dead)
+
+    def test_exception_propagates(self):
+        log = []
+
+        def boom():
+            greenlet.getcurrent().parent.switch()
+            raise ValueError("boom")
+
+        ok = _stepper(log, 'ok', 5)
+        bad = greenlet.greenlet(boom)
+        with self.assertRaises(ValueError):
+            run_round_robin([bad, ok])
+        self.assertTrue(bad.dead)
+        self.assertFalse(ok.dead)
+        self.assertEqual(run_round_robin([ok]), [])
+
+    def test_bad_arguments(self):
+        with self.assertRaises(TypeError):
+            run_round_robin([object()])
+        with self.assertRaises(TypeError):
+            run_round_robin(42)
+        with self.assertRaises(ValueError):
+            run_round_robin([], max_rounds=-1)
+        self.assertEqual(run_round_robin([]), [])
@@ -0,0 +1,136 @@
+import threading
+import time
+import unittest
+
+import greenlet
+from greenlet import _sampling
+from . import TestCase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _ping_pong(n):
+    main = greenlet.getcurrent()
+    def run():
+        for _ in range(n):
+            main.switch()
+    g = greenlet.greenlet(run)
+    for _ in range(n + 1):
+        g.switch()
+    assert g.dead
+    return g
+
+
+class TestSwitchSampling(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(greenlet._stop_switch_sampling)
+
+    def test_off_by_default(self):
+        self.assertIsNone(greenlet._get_switch_sampling())
+        _ping_pong(3)
+        self.assertEqual(greenlet._drain_switch_samples(), b'')
+
+    def test_records_every_switch(self):
+        main = greenlet.getcurrent()
+        greenlet._start_switch_sampling(capacity=16)
+        before = time.monotonic_ns()
+        g = _ping_pong(2)
+        after = time.monotonic_ns()
+        records = _sampling.decode_switch_samples(greenlet._drain_switch_samples())
+        # start, 2 switches each way, and the final switch as g dies.
+        self.assertEqual([(o, t, e) for o, t, _, e in records], [
+            (id(main), id(g), 'switch'),
+            (id(g), id(main), 'switch'),
+            (id(main), id(g), 'switch'),
+            (id(g), id(main), 'switch'),
+            (id(main), id(g), 'switch'),
+            (id(g), id(main), 'switch'),
+        ])
+        stamps = [ts for _, _, ts, _ in records]
+        self.assertEqual(stamps, sorted(stamps))
+        self.assertGreaterEqual(stamps[0], before)
+        self.assertLessEqual(stamps[-1], after)
+        self.assertEqual(greenlet._drain_switch_samples(), b'')
+
+    def test_throw_event(self):
+        greenlet._start_switch_sampling(capacity=16)
+        def run():
+            greenlet.getcurrent().parent.switch()
+        g = greenlet.greenlet(run)
+        g.switch()
+        greenlet._drain_switch_samples()
+        g.throw(greenlet.GreenletExit)
+        events = [e for _, _, _, e in
+                  _sampling.decode_switch_samples(greenlet._drain_switch_samples())]
+        self.assertEqual(events, ['throw', 'switch'])
+
+    def test_every_nth(self):
+        greenlet._start_switch_sampling(capacity=100, every=4)
+        _ping_pong(9) # 20 switches
+        info = greenlet._get_switch_sampling()
+        self.assertEqual(info['every'], 4)
+        self.assertEqual(info['pending'], 5)
+        self.assertEqual(len(greenlet._drain_switch_samples()), 5 * _sampling.RECORD_SIZE)
+
+    def test_interval(self):
+        greenlet._start_switch_sampling(capacity=100, interval_ns=10**10)
+        _ping_pong(9)
+        self.assertEqual(greenlet._get_switch_sampling()['pending'], 1)
+
+    def test_ring_keeps_newest(self):
+        greenlet._start_switch_sampling(capacity=4)
+        _ping_pong(4) # 10 switches
+        info = greenlet._get_switch_sampling()
+        self.assertEqual((info['pending'], info['dropped']), (4, 6))
+        records = _sampling.decode_switch_samples(greenlet._drain_switch_samples())
+        self.assertEqual(len(records), 4)
+        stamps = [ts for _, _, ts, _ in records]
+        self.assertEqual(stamps, sorted(stamps))
+        info = greenlet._get_switch_sampling()
+        self.assertEqual((info['pending'], info['dropped']), (0, 6))
+
+    def test_restart_and_stop_discard(self):
+        greenlet._start_switch_sampling(capacity=8)
+        _ping_pong(1)
+        greenlet._start_switch_sampling(capacity=8)
+        self.assertEqual(greenlet._get_switch_sampling()['pending'], 0)
+        _ping_pong(1)
+        greenlet._stop_switch_sampling()
+        self.assertIsNone(greenlet._get_switch_sampling())
+        self.assertEqual(greenlet._drain_switch_samples(), b'')
+
+    def test_per_thread(self):
+        greenlet._start_switch_sampling(capacity=8)
+        other = []
+
+        def worker():
+            _ping_pong(1)
+            other.append((greenlet._get_switch_sampling(), greenlet._drain_switch_samples()))
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join(10)
+        self.assertEqual(other, [(None, b'')])
+        self.assertEqual(greenlet._get_switch_sampling()['pending'], 0)
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            greenlet._start_switch_sampling(capacity=0)
+        with self.assertRaises(ValueError):
+            greenlet._start_switch_sampling(every=0)
+        self.assertIsNone(greenlet._get_switch_sampling())
+
+    @unittest.skipIf(numpy is None, "Needs numpy")
+    def test_numpy_view(self):
+        main = greenlet.getcurrent()
+        greenlet._start_switch_sampling(capacity=16)
+        g = _ping_pong(1)
+        samples = _sampling.switch_samples_array()
+        self.assertEqual(samples.shape, (4,))
+        self.assertEqual(list(samples['origin']), [id(main), id(g), id(main), id(g)])
+        self.assertEqual(list(samples['event']), [0] * 4)
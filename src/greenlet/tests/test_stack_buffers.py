@@ -0,0 +1,93 @@
+import threading
+
+import greenlet
+from greenlet import _greenlet
+from . import TestCase
+
+
+def _deep(n, main):
+    if n:
+        return _deep(n - 1, main) + 1
+    for i in range(3):
+        main.switch(i)
+    return 0
+
+
+class TestStackBufferRetention(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Start each test with an empty free list.
+        _greenlet.set_stack_buffer_retention(0)
+        self.addCleanup(_greenlet.set_stack_buffer_retention, 0)
+
+    def _ping_pong(self, depth=50):
+        main = greenlet.getcurrent()
+        g = greenlet.greenlet(lambda: _deep(depth, main))
+        seen = [g.switch(), g.switch(), g.switch()]
+        self.assertGreater(g._stack_saved, 0)
+        self.assertEqual(g.switch(), depth)
+        self.assertTrue(g.dead)
+        return seen
+
+    def test_default_is_off(self):
+        # setUp has already changed the setting; ask a fresh interpreter.
+        output = self.run_script('check_stack_buffer_retention_default.py')
+        self.assertEqual(output.split(), ['0', '0'])
+        self._ping_pong()
+        self.assertEqual(_greenlet.get_retained_stack_bytes(), 0)
+
+    def test_returns_previous_and_validates(self):
+        self.assertEqual(greenlet.set_stack_buffer_retention(1 << 20), 0)
+        self.assertEqual(greenlet.set_stack_buffer_retention(1 << 21), 1 << 20)
+        with self.assertRaises(ValueError):
+            greenlet.set_stack_buffer_retention(-1)
+        with self.assertRaises(TypeError):
+            greenlet.set_stack_buffer_retention('big')
+
+    def test_dead_greenlets_feed_the_pool(self):
+        _greenlet.set_stack_buffer_retention(1 << 20)
+        self.assertEqual(self._ping_pong(), [0, 1, 2])
+        retained = _greenlet.get_retained_stack_bytes()
+        self.assertGreater(retained, 0)
+        # The next greenlet takes the buffer rather than allocating.
+        self.assertEqual(self._ping_pong(), [0, 1, 2])
+        self.assertEqual(_greenlet.get_retained_stack_bytes(), retained)
+
+    def test_cap_is_respected(self):
+        _greenlet.set_stack_buffer_retention(1)
+        self._ping_pong()
+        self.assertEqual(_greenlet.get_retained_stack_bytes(), 0)
+
+    def test_disabling_frees_pool(self):
+        _greenlet.set_stack_buffer_retention(1 << 20)
+        self._ping_pong()
+        self.assertGreater(_greenlet.get_retained_stack_bytes(), 0)
+        _greenlet.set_stack_buffer_retention(0)
+        self.assertEqual(_greenlet.get_retained_stack_bytes(), 0)
+        self.assertEqual(self._ping_pong(), [0, 1, 2])
+
+    def test_killed_and_collected_greenlets(self):
+        _greenlet.set_stack_buffer_retention(1 << 20)
+        main = greenlet.getcurrent()
+        for _ in range(10):
+            g = greenlet.greenlet(lambda: _deep(20, main))
+            g.switch()
+            del g # GreenletExit raised into the suspended greenlet
+        self.assertEqual(self._ping_pong(), [0, 1, 2])
+
+    def test_pool_freed_with_thread(self):
+        _greenlet.set_stack_buffer_retention(1 << 20)
+        retained = []
+
+        def worker():
+            self._ping_pong()
+            retained.append(_greenlet.get_retained_stack_bytes())
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join(10)
+        self.assertGreater(retained[0], 0)
+        # The worker's pool goes with its thread state; this thread's is empty.
+        self.wait_for_pending_cleanups()
+        self.assertEqual(_greenlet._get_total_retained_stack_bytes(), 0)
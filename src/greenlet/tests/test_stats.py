@@ -0,0 +1,73 @@
+import threading
+
+import greenlet
+from . import TestCase
+
+
+def _deep(n, main):
+    if n:
+        return _deep(n - 1, main) + 1
+    main.switch()
+    return 0
+
+
+class TestSwitchStats(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(greenlet._enable_stats, greenlet._enable_stats(True))
+        greenlet._reset_stats()
+
+    def test_disabled_collects_nothing(self):
+        greenlet._enable_stats(False)
+        g = greenlet.greenlet(lambda: _deep(20, greenlet.getcurrent().parent))
+        g.switch()
+        g.switch()
+        stats = greenlet._get_stats()
+        self.assertFalse(stats['enabled'])
+        self.assertEqual(stats['switches'], 0)
+        self.assertEqual(stats['bytes_copied_to_heap'], 0)
+
+    def test_enable_returns_previous(self):
+        self.assertTrue(greenlet._enable_stats(False))
+        self.assertFalse(greenlet._enable_stats(True))
+
+    def test_counts_switches_and_copies(self):
+        main = greenlet.getcurrent()
+        g = greenlet.greenlet(lambda: _deep(50, main))
+        g.switch() # start: main -> g, then g -> main
+        saved = g._stack_saved
+        self.assertGreater(saved, 0)
+        self.assertEqual(g.switch(), 50) # main -> g, g dies -> main
+        self.assertTrue(g.dead)
+
+        stats = greenlet._get_stats()
+        self.assertTrue(stats['enabled'])
+        self.assertEqual(stats['switches'], 4)
+        self.assertGreaterEqual(stats['bytes_copied_to_heap'], saved)
+        self.assertGreaterEqual(stats['bytes_restored'], saved)
+        self.assertGreaterEqual(stats['peak_saved_bytes'], saved)
+        self.assertGreater(stats['reallocs'], 0)
+
+    def test_reset(self):
+        g = greenlet.greenlet(lambda: None)
+        g.switch()
+        self.assertGreater(greenlet._get_stats()['switches'], 0)
+        greenlet._reset_stats()
+        stats = greenlet._get_stats()
+        self.assertEqual(
+            {k: v for k, v in stats.items() if k != 'enabled'},
+            dict.fromkeys(stats.keys() - {'enabled'}, 0))
+
+    def test_per_thread(self):
+        greenlet.greenlet(lambda: None).switch()
+        other = []
+
+        def worker():
+            other.append(greenlet._get_stats()['switches'])
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join(10)
+        self.assertEqual(other, [0])
+        self.assertGreater(greenlet._get_stats()['switches'], 0)
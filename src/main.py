@@ -9,11 +9,14 @@
 
 import os
 import hashlib
+import functools
+import logging
 from src.config import *
 from src.utils.hash_utils import HashUtils
 from src.utils.math_utils import *
 from src.utils.image_utils import ImageProcessor, encode_image, decode_image
 from src.utils.data_utils import *
+from src.utils.validation_cache import ValidationCache
 from src.models.bastion import SHA1664, EphemeralBastion
 from src.models.grokwalk import Grokwalk
 from src.models.hash_simulator import HashSimulator
@@ -22,71 +25,70 @@ from src.models.green_models import Facehuggers, CurvatureVerbismGenerator, Boas
 from src.models.blockchain_models import GreedyFillSimulator, PerpLib, OpsPool, ExperienceRamp
 from src.visuals.animations import demo_greenspline_animation, animate_logo, demo_shuttle
 import random
+import sys
 import uuid
+from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+# Content files, keyed by the module-level names they used to be read
+# into. Each is read the first time it is asked for, not at import.
+CONTENT_FILES = {
+    'GREEN_TXT': 'content/green.txt',
+    'HYBRID_CY_CONTENT': 'content/hybrid_cy.pyx',
+    'GREENSPLINE_CONTENT': 'content/greenspline_v1.3.py',
+    'HYBRID_CONTENT': 'content/hybrid.py',
+    'GREEN_PARSER_CONTENT': 'content/green_parser.pl',
+    'JITHOOK_CONTENT': 'content/jithook.sol',
+    'LIB_RUST_CONTENT': 'content/lib_rust.rs',
+}
+
+# Keys of the contents dictionary, with the content each one holds and
+# the hash it is validated against.
+CONTENT_KEYS = {
+    'green.txt': ('GREEN_TXT', GREEN_TXT_HASH),
+    'hybrid_cy.py': ('HYBRID_CY_CONTENT', HYBRID_CY_HASH),
+    'greenspline_v1.3.py': ('GREENSPLINE_CONTENT', GREENSPLINE_HASH),
+    'hybrid.py': ('HYBRID_CONTENT', HYBRID_HASH),
+    'green_parser.pl': ('GREEN_PARSER_CONTENT', GREEN_PARSER_HASH),
+    'jithook.sol': ('JITHOOK_CONTENT', JITHOOK_HASH),
+    'librs_rust.rs': ('LIB_RUST_CONTENT', LIBRS_RUST_HASH),
+}
+
+# Digests of the content files by (path, size, mtime_ns, inode), so an
+# unchanged file isn't re-read on every validation.
+VALIDATION_CACHE_FILE = 'content/.hash_cache.json'
+
+@functools.lru_cache(maxsize=None)
+def load_content(name: str) -> str:
+    """Read and cache one of the CONTENT_FILES."""
+    with open(CONTENT_FILES[name], 'r') as f:
+        return f.read()
+
+def __getattr__(name):
+    # Keeps ``from src.main import GREEN_TXT`` and friends working.
+    if name in CONTENT_FILES:
+        return load_content(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Load content from files
-with open('content/green.txt', 'r') as f:
-    GREEN_TXT = f.read()
-with open('content/hybrid_cy.pyx', 'r') as f:
-    HYBRID_CY_CONTENT = f.read()
-with open('content/greenspline_v1.3.py', 'r') as f:
-    GREENSPLINE_CONTENT = f.read()
-with open('content/hybrid.py', 'r') as f:
-    HYBRID_CONTENT = f.read()
-with open('content/green_parser.pl', 'r') as f:
-    GREEN_PARSER_CONTENT = f.read()
-with open('content/jithook.sol', 'r') as f:
-    JITHOOK_CONTENT = f.read()
-with open('content/lib_rust.rs', 'r') as f:
-    LIB_RUST_CONTENT = f.read()
+class LazyContents(Mapping):
+    """The contents dictionary, reading each file on first lookup."""
+    def __getitem__(self, key: str) -> str:
+        return load_content(CONTENT_KEYS[key][0])
+
+    def __iter__(self):
+        return iter(CONTENT_KEYS)
+
+    def __len__(self) -> int:
+        return len(CONTENT_KEYS)
 
 # Initialize contents dictionary
-contents = {
-    'green.txt': GREEN_TXT,
-    'hybrid_cy.py': HYBRID_CY_CONTENT,
-    'greenspline_v1.3.py': GREENSPLINE_CONTENT,
-    'hybrid.py': HYBRID_CONTENT,
-    'green_parser.pl': GREEN_PARSER_CONTENT,
-    'jithook.sol': JITHOOK_CONTENT,
-    'librs_rust.rs': LIB_RUST_CONTENT
-}
+contents = LazyContents()
 
 class GreenpaperUX:
+    """Greenpaper demos by TOC section. Each component is built the first time a demo uses it."""
     def __init__(self):
-        self.contents = contents  # Assign the initialized contents dictionary
-        self.sha1664 = SHA1664()
-        self.bastion = EphemeralBastion(str(uuid.uuid4()))
-        self.grokwalk = Grokwalk()
-        self.image_processor = ImageProcessor(self.sha1664, self.bastion, self.grokwalk)
-        self.chart = CandlestickChart(SAMPLE_DATA)
-        self.order_book = OrderBookUI()
-        self.portfolio = PortfolioUI()
-        self.pillbox = PillboxUI([pair.split('/')[0] for pair in TRADING_PAIRS])
-        self.quote = QuoteBoxUI()
-        self.time_selector = TimeSelectorUI()
-        self.channel_selector = ChannelSelectorUI(self.sha1664, self.bastion)
-        self.dashboard = DashboardUI(
-            self.chart, self.order_book, self.portfolio, self.pillbox,
-            self.quote, self.time_selector, self.channel_selector
-        )
-        self.hash_simulator = HashSimulator()
-        self.greedy_fill = GreedyFillSimulator(target=1000.0)
-        self.perp_lib = PerpLib("BTC/USDT")
-        self.ops_pool = OpsPool()
-        self.experience_ramp = ExperienceRamp()
-        self.spiral_nu = SpiralNU()
-        self.hybrid_green = HybridGreenText()
-        self.boas = BoasAllocations()
-        self.verbism_generator = CurvatureVerbismGenerator()
-        self.greentext = GreenTextLanguage(GREEN_TXT)
-        self.facehuggers = Facehuggers()
-        self.keyspace_hud = KeyspaceHUD()
-        self.obe_weaving = OBEWeaving()
-        self.shuttle = ShuttleModel()  # Now valid
-        self.hash_utils = HashUtils()
-        self.weaving_utils = WeavingUtils()
-        self.seraph = SeraphGuardian()
-        self.buffer_war = BufferWar()
+        self.contents = contents  # Assign the lazily loaded contents dictionary
         self.demo_functions_dict = {
             "5.1": self.demo_scalability,
             "6.3": self.demo_consensus,
@@ -127,18 +129,134 @@ class GreenpaperUX:
             "50": self.demo_ultimate_interface,
         }
 
-    def validate_hashes(self) -> bool:
-        """Validate hashes of integrated content."""
+    @functools.cached_property
+    def sha1664(self):
+        return SHA1664()
+
+    @functools.cached_property
+    def bastion(self):
+        return EphemeralBastion(str(uuid.uuid4()))
+
+    @functools.cached_property
+    def grokwalk(self):
+        return Grokwalk()
+
+    @functools.cached_property
+    def image_processor(self):
+        return ImageProcessor(self.sha1664, self.bastion, self.grokwalk)
+
+    @functools.cached_property
+    def chart(self):
+        return CandlestickChart(SAMPLE_DATA)
+
+    @functools.cached_property
+    def order_book(self):
+        return OrderBookUI()
+
+    @functools.cached_property
+    def portfolio(self):
+        return PortfolioUI()
+
+    @functools.cached_property
+    def pillbox(self):
+        return PillboxUI([pair.split('/')[0] for pair in TRADING_PAIRS])
+
+    @functools.cached_property
+    def quote(self):
+        return QuoteBoxUI()
+
+    @functools.cached_property
+    def time_selector(self):
+        return TimeSelectorUI()
+
+    @functools.cached_property
+    def channel_selector(self):
+        return ChannelSelectorUI(self.sha1664, self.bastion)
+
+    @functools.cached_property
+    def dashboard(self):
+        return DashboardUI(
+            self.chart, self.order_book, self.portfolio, self.pillbox,
+            self.quote, self.time_selector, self.channel_selector
+        )
+
+    @functools.cached_property
+    def hash_simulator(self):
+        return HashSimulator()
+
+    @functools.cached_property
+    def greedy_fill(self):
+        return GreedyFillSimulator(target=1000.0)
+
+    @functools.cached_property
+    def perp_lib(self):
+        return PerpLib("BTC/USDT")
+
+    @functools.cached_property
+    def ops_pool(self):
+        return OpsPool()
+
+    @functools.cached_property
+    def experience_ramp(self):
+        return ExperienceRamp()
+
+    @functools.cached_property
+    def spiral_nu(self):
+        return SpiralNU()
+
+    @functools.cached_property
+    def hybrid_green(self):
+        return HybridGreenText()
+
+    @functools.cached_property
+    def boas(self):
+        return BoasAllocations()
+
+    @functools.cached_property
+    def verbism_generator(self):
+        return CurvatureVerbismGenerator()
+
+    @functools.cached_property
+    def greentext(self):
+        return GreenTextLanguage(self.contents['green.txt'])
+
+    @functools.cached_property
+    def facehuggers(self):
+        return Facehuggers()
+
+    @functools.cached_property
+    def keyspace_hud(self):
+        return KeyspaceHUD()
+
+    @functools.cached_property
+    def obe_weaving(self):
+        return OBEWeaving()
+
+    @functools.cached_property
+    def shuttle(self):
+        return ShuttleModel()
+
+    @functools.cached_property
+    def hash_utils(self):
+        return HashUtils()
+
+    @functools.cached_property
+    def weaving_utils(self):
+        return WeavingUtils()
+
+    @functools.cached_property
+    def seraph(self):
+        return SeraphGuardian()
+
+    @functools.cached_property
+    def buffer_war(self):
+        return BufferWar()
+
+    def validate_hashes(self, force: bool = False) -> bool:
+        """Validate hashes of integrated content; force re-reads every file instead of trusting the cache."""
         try:
-            return (
-                hashlib.sha256(GREEN_TXT.encode()).hexdigest() == GREEN_TXT_HASH and
-                hashlib.sha256(HYBRID_CY_CONTENT.encode()).hexdigest() == HYBRID_CY_HASH and
-                hashlib.sha256(GREENSPLINE_CONTENT.encode()).hexdigest() == GREENSPLINE_HASH and
-                hashlib.sha256(HYBRID_CONTENT.encode()).hexdigest() == HYBRID_HASH and
-                hashlib.sha256(GREEN_PARSER_CONTENT.encode()).hexdigest() == GREEN_PARSER_HASH and
-                hashlib.sha256(JITHOOK_CONTENT.encode()).hexdigest() == JITHOOK_HASH and
-                hashlib.sha256(LIBRS_CONTENT.encode()).hexdigest() == LIBRS_RUST_HASH
-            )
+            expected = {CONTENT_FILES[name]: expected_hash for name, expected_hash in CONTENT_KEYS.values()}
+            return ValidationCache(VALIDATION_CACHE_FILE).validate(expected, force=force)
         except Exception as e:
             logger.error(f"Validate hashes error: {e}")
             return False
@@ -321,7 +439,7 @@ class GreenpaperUX:
     def demo_greentext_language(self):
         """Demo for TOC 38: Greentext Parsing."""
         try:
-            parsed = self.greentext.parse(GREEN_TXT)
+            parsed = self.greentext.parse(self.contents['green.txt'])
             print(f"Demo 38 - Parsed Verbism: {' '.join(parsed[:2])}")
             print(f"Hash Valid: {self.validate_hashes()}")
         except Exception as e:
@@ -444,21 +562,42 @@ class GreenpaperUX:
         except Exception as e:
             logger.error(f"Demo ultimate interface error: {e}")
 
-    def demo_functions(self) -> None:
+    def run_demo(self, key: str) -> None:
+        """Run the demo for a single TOC section."""
+        if key not in self.demo_functions_dict:
+            print(f"No demo for TOC {key}")
+            return
+        print(f"\nRunning Demo for TOC {key}:")
+        self.demo_functions_dict[key]()
+
+    def demo_functions(self, force_validation: bool = False) -> None:
         """Run demos for all 50 TOC sections."""
         try:
             random.seed(42)  # Set random seed for consistent output
             print("Validating hashes...")
-            if not self.validate_hashes():
+            if not self.validate_hashes(force=force_validation):
                 print("Hash validation failed!")
                 return
             print("\n=== Running Demos ===")
             for key in self.demo_functions_dict:
-                print(f"\nRunning Demo for TOC {key}:")
-                self.demo_functions_dict[key]()
+                self.run_demo(key)
         except Exception as e:
             logger.error(f"Demo functions error: {e}")
 
 if __name__ == "__main__":
+    # python -m src.main [--revalidate] [TOC ...] runs only the given
+    # sections; --revalidate rehashes every content file first.
+    args = sys.argv[1:]
+    revalidate = '--revalidate' in args
+    keys = [arg for arg in args if arg != '--revalidate']
     ux = GreenpaperUX()
-    ux.demo_functions()
+    if keys:
+        if revalidate:
+            print("Validating hashes...")
+            if not ux.validate_hashes(force=True):
+                print("Hash validation failed!")
+                sys.exit(1)
+        for key in keys:
+            ux.run_demo(key)
+    else:
+        ux.demo_functions(force_validation=revalidate)
@@ -1,6 +1,9 @@
 import logging
 import random  # Kept for potential future use, though replaced in ExperienceRamp
+from typing import List
 from src.config import *
+from src.models.order_book import OrderBook, Fill, BUY
+from src.models.pool_registry import PoolRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -23,49 +26,101 @@ class GreedyFillSimulator:
             logger.error(f"Fill order error: {e}")
             return False
 
+    def simulate_paths(self, n_paths: int, n_steps: int, base_amount: float = 1.0, **kwargs) -> dict:
+        """Monte Carlo of martingale-sized fills against this simulator's target (see src.models.monte_carlo)."""
+        from src.models.monte_carlo import simulate_martingale_paths
+        return simulate_martingale_paths(n_paths, n_steps, self.target, base_amount, **kwargs)
+
 class PerpLib:
     def __init__(self, symbol: str):
         self.symbol = symbol
-        self.liquidity_amount = 0.0
-        self.interest_rate = 0.05
-        self.orders = []
+        self.book = OrderBook()
+        # Standalone until it joins an OpsPool; then liquidity, rate and
+        # order count live in the pool's PoolRegistry row.
+        self.registry = None
+        self.row = None
+        self._liquidity_amount = 0.0
+        self._interest_rate = 0.05
+
+    def attach(self, registry: PoolRegistry) -> int:
+        """Move this market's values into registry and become a view of its row."""
+        self.row = registry.add(self.symbol, self._liquidity_amount, self._interest_rate, len(self.book))
+        self.registry = registry
+        return self.row
+
+    @property
+    def liquidity_amount(self) -> float:
+        if self.registry is None:
+            return self._liquidity_amount
+        return float(self.registry.liquidity[self.row])
+
+    @liquidity_amount.setter
+    def liquidity_amount(self, value: float):
+        if self.registry is None:
+            self._liquidity_amount = value
+        else:
+            self.registry.liquidity[self.row] = value
+
+    @property
+    def interest_rate(self) -> float:
+        if self.registry is None:
+            return self._interest_rate
+        return float(self.registry.interest_rate[self.row])
 
-    def add_order(self, price: float, volume: float):
-        """Add an order to the perpetual market."""
+    @interest_rate.setter
+    def interest_rate(self, value: float):
+        if self.registry is None:
+            self._interest_rate = value
+        else:
+            self.registry.interest_rate[self.row] = value
+
+    def add_order(self, price: float, volume: float, side: str = BUY) -> List[Fill]:
+        """Add an order to the perpetual market, matching it against the book; returns the fills."""
         try:
-            self.orders.append({'price': price, 'volume': volume})
+            _, fills = self.book.submit(side, price, volume)
             self.liquidity_amount += volume
-            logger.info(f"Added order: {volume} {self.symbol} @ {price}")
+            if self.registry is not None:
+                self.registry.order_count[self.row] = len(self.book)
+            logger.info(f"Added order: {side} {volume} {self.symbol} @ {price}, {len(fills)} fills")
+            return fills
         except Exception as e:
             logger.error(f"Add order error: {e}")
+            return []
 
     def get_status(self) -> dict:
         """Get the status of the perpetual market."""
         try:
-            return {'symbol': self.symbol, 'liquidity_amount': self.liquidity_amount, 'orders': len(self.orders)}
+            return {'symbol': self.symbol, 'liquidity_amount': self.liquidity_amount, 'orders': len(self.book)}
         except Exception as e:
             logger.error(f"Get status error: {e}")
             return {}
 
 class OpsPool:
     def __init__(self):
-        self.Ops_pool = []
+        self.registry = PoolRegistry()
+        self.Ops_pool = []  # PerpLib views; markets from add_markets have registry rows only
 
     def add_Ops(self, ops_instance: PerpLib):
         """Add a PerpLib instance to the operations pool."""
         try:
+            ops_instance.attach(self.registry)
             self.Ops_pool.append(ops_instance)
             logger.info(f"Added Ops instance for {ops_instance.symbol}")
         except Exception as e:
             logger.error(f"Add Ops error: {e}")
 
+    def add_markets(self, symbols, liquidity=0.0, interest_rate=0.05) -> range:
+        """Add many markets straight to the registry, without PerpLib objects; returns their rows."""
+        try:
+            return self.registry.add_many(symbols, liquidity, interest_rate)
+        except Exception as e:
+            logger.error(f"Add markets error: {e}")
+            return range(0)
+
     def redistribute_liquidity(self, redistribution_factor: float = 0.1):
         """Redistribute liquidity across the operations pool."""
         try:
-            total_liquidity = sum(r.liquidity_amount for r in self.Ops_pool)
-            redistributed_amount = total_liquidity * redistribution_factor
-            for ops_instance in self.Ops_pool:
-                ops_instance.liquidity_amount += redistributed_amount / len(self.Ops_pool)
+            redistributed_amount = self.registry.redistribute(redistribution_factor)
             logger.info(f"Redistributed {redistributed_amount} liquidity")
         except Exception as e:
             logger.error(f"Redistribute liquidity error: {e}")
@@ -73,21 +128,18 @@ class OpsPool:
     def calculate_global_interest_rate(self) -> float:
         """Calculate the global interest rate for the pool."""
         try:
-            if not self.Ops_pool:
-                return 0.0
-            return sum(r.interest_rate for r in self.Ops_pool) / len(self.Ops_pool)
+            return self.registry.mean_interest_rate()
         except Exception as e:
             logger.error(f"Calculate global interest rate error: {e}")
             return 0.0
 
-    def get_pool_status(self) -> dict:
-        """Get the status of the operations pool."""
+    def get_pool_status(self, details: bool = True) -> dict:
+        """Get the status of the operations pool; details=False skips the per-market dicts."""
         try:
-            pool_status = [r.get_status() for r in self.Ops_pool]
             return {
-                "Total Liquidity": sum(r["liquidity_amount"] for r in pool_status),
+                "Total Liquidity": self.registry.total_liquidity(),
                 "Global Interest Rate": self.calculate_global_interest_rate(),
-                "Pool Details": pool_status
+                "Pool Details": self.registry.details() if details else []
             }
         except Exception as e:
             logger.error(f"Get pool status error: {e}")
@@ -3,16 +3,14 @@ import hashlib
 import subprocess
 import logging
 from src.config import *
-from typing import List, Dict, Any
-from src.utils.math_utils import compute_curvature
+from typing import List, Dict, Any, Optional
+from src.utils.math_utils import compute_curvature, kappa_calc
+from src.utils.entropy import shannon_entropy, shannon_entropy_batch
 from src.visuals.plot_utils import create_blob_surface, add_light_slicks
 from src.visuals.animations import create_droplets
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-from scipy.interpolate import splprep, splev
-from scipy.ndimage import gaussian_filter1d
-from scipy.interpolate import griddata
-from matplotlib.colors import LightSource
+from src.models.mersenne import default_factor_bits, is_probable_prime, search_exponents, trial_factor
+# matplotlib and scipy are imported in the methods that use them, so
+# importing the models for a single demo doesn't load either stack.
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +65,7 @@ class CurvatureVerbismGenerator:
     def curve_map_kappa(self, points: np.ndarray = None, curve_mode: str = 'k_curves') -> np.ndarray:
         """Compute curvature for NURBS curve, ensuring constant curvature with n=5 B-spline."""
         try:
+            from scipy.interpolate import splprep, splev
             points = points if points is not None else self.points
             if len(points) <= self.degree:
                 logger.warning(f"Insufficient points ({len(points)}) for degree {self.degree}, using default points")
@@ -97,6 +96,9 @@ class CurvatureVerbismGenerator:
     def demo_greenspline_animation(self, frames: int = 200) -> None:
         """Generate and save greenspline animation with constant curvature and Boas rendering."""
         try:
+            import matplotlib.pyplot as plt
+            from matplotlib.animation import FuncAnimation
+            from matplotlib.colors import LightSource
             fig = plt.figure(figsize=(10, 8), facecolor='black')
             ax = fig.add_subplot(111, projection='3d')
             t = np.linspace(0, 1, 100)
@@ -192,6 +194,7 @@ class BoasAllocations:
     def allocate(self, hash_str: str, color: str = "blue") -> str:
         """Allocate hash string with blue or gold strides."""
         try:
+            from scipy.ndimage import gaussian_filter1d
             stride = self.strides.get(color, 4)
             allocated = ""
             for i in range(0, len(hash_str), stride):
@@ -247,6 +250,7 @@ class HybridGreenText:
     def scale_curvature(self, kappa_values: np.ndarray, blue_gold_swap: bool = True) -> np.ndarray:
         """Scale curvature values with blue/gold swap option."""
         try:
+            from scipy.interpolate import griddata
             if not isinstance(kappa_values, np.ndarray) or kappa_values.size < 2:
                 logger.error("Invalid kappa_values: empty or insufficient points")
                 return np.array([0.02500125] * 1000)
@@ -372,6 +376,8 @@ class OBEWeaving:
     def animate_logo(self, frames: int = 200) -> None:
         """Generate and save logo animation with ternary swap."""
         try:
+            import matplotlib.pyplot as plt
+            from matplotlib.animation import FuncAnimation
             fig, ax = plt.subplots(facecolor='black')
             t = np.linspace(0, 1, 100)
             x, y, _ = compute_green_segment(t)
@@ -423,16 +429,19 @@ class SeraphGuardian:
         self.threshold = threshold
 
     def shannon_entropy(self, data):
-        counts = np.bincount([ord(c) for c in data])
-        probs = counts / len(data)
-        probs = probs[probs > 0]
-        return -np.sum(probs * np.log2(probs))
+        return shannon_entropy(data)
 
     def test(self, input_mnemonic):
         """Non-reactive test: Yield if 'The One' (entropy > threshold)."""
-        echo_hash = hashlib.sha256(input_mnemonic.encode()).hexdigest()
-        entropy = self.shannon_entropy(input_mnemonic)
-        return True, echo_hash if entropy > self.threshold else (False, "Apology: Not The One")
+        if self.shannon_entropy(input_mnemonic) > self.threshold:
+            return True, hashlib.sha256(input_mnemonic.encode()).hexdigest()
+        return False, "Apology: Not The One"
+
+    def test_batch(self, mnemonics: List[str]) -> List[tuple]:
+        """test() for many mnemonics with one batched entropy pass; only granted ones are hashed."""
+        granted = shannon_entropy_batch(mnemonics) > self.threshold
+        return [(True, hashlib.sha256(m.encode()).hexdigest()) if ok else (False, "Apology: Not The One")
+                for m, ok in zip(mnemonics, granted)]
 
 class BufferWar:
     def mev_opportunity(self, hash_b, window=141, sides=24):
@@ -442,8 +451,14 @@ class BufferWar:
 
     def profitable_arbitrage(self, target, current, volume):
         """Check profitability with martingale factor."""
+        from green_profit import checkProfitable
         return checkProfitable(target, current, volume)
 
+    def profitable_arbitrage_batch(self, targets, currents, volumes, exact=False):
+        """Profitable mask and margins for arrays of trades in one vectorized pass (see profit_scan)."""
+        from profit_scan import check_profitable_batch
+        return check_profitable_batch(targets, currents, volumes, exact=exact)
+
 class WeavingUtils:
     def modulate_encode_sequence(self, data, grid_dim=GRID_DIM, float_length=3):
         """Modulate encode sequence with moving heddles and float watermark."""
@@ -503,42 +518,41 @@ class SpiralNU:
             logger.error(f"Run spiral error: {e}")
             return []
 
-    def predict_next_prime(self) -> int:
-        """Predict the next Mersenne prime exponent."""
+    def predict_next_prime(self, start: Optional[int] = None, stop: Optional[int] = None, workers: int = 1) -> int:
+        """First exponent p in [start, stop) with 2^p - 1 prime, or 0 if there is none."""
         try:
-            target = 1.5 * (2 ** self.exponents[-1] - 1)
-            n = self.exponents[-1] + 1
-            while True:
-                n += 1
-                if self.is_prime(2 ** n - 1):
-                    if 2 ** n - 1 > target:
-                        return n
+            if stop is None:
+                raise ValueError("predict_next_prime needs a stop exponent; Lucas-Lehmer above ~10^5 takes hours per exponent")
+            if start is None:
+                start = self.exponents[-1] + 1
+            found = search_exponents(start, stop, workers=workers, first=True)
+            return found[0] if found else 0
         except Exception as e:
             logger.error(f"Predict next prime error: {e}")
             return 0
 
     def is_prime(self, n: int) -> bool:
-        """Check if a number is prime."""
+        """Check if a number is prime (Miller-Rabin)."""
         try:
-            if n < 2:
-                return False
-            for i in range(2, int(math.sqrt(n)) + 1):
-                if n % i == 0:
-                    return False
-            return True
+            return is_probable_prime(n)
         except Exception as e:
             logger.error(f"Is prime error: {e}")
             return False
 
-    def check_m53_candidate(self):
+    def check_m53_candidate(self, factor_bits: Optional[int] = None):
         """Check M53 candidate exponent for Mersenne prime."""
         try:
             p = 194062501
             if not self.is_prime(p):
                 return f"Exponent {p} is not prime, so 2^{p}-1 cannot be Mersenne prime."
+            factor_bits = factor_bits or default_factor_bits(p)
+            factor = trial_factor(p, factor_bits)
+            if factor is not None:
+                return f"2^{p}-1 has the factor {factor}, so it is not a Mersenne prime."
             remainder = p % 369
             kappa_at_316 = kappa_calc(316)
-            return f"Exponent {p} mod 369 = {remainder}. kappa at n=316: {kappa_at_316:.4f} (symmetry point)."
+            return (f"Exponent {p} mod 369 = {remainder}; no factor of 2^{p}-1 below 2^{factor_bits}. "
+                    f"kappa at n=316: {kappa_at_316:.4f} (symmetry point).")
         except Exception as e:
             logger.error(f"Check M53 candidate error: {e}")
             return "M53 check failed."
@@ -568,6 +582,9 @@ class ShuttleModel:
     def demo_shuttle(self, frames: int = 200) -> None:
         """Generate and save shuttle animation with constant curvature."""
         try:
+            import matplotlib.pyplot as plt
+            from matplotlib.animation import FuncAnimation
+            from matplotlib.colors import LightSource
             fig = plt.figure(figsize=(10, 8), facecolor='black')
             ax = fig.add_subplot(111, projection='3d')
             t = np.linspace(0, 1, 100)
@@ -0,0 +1,223 @@
+import decimal
+import functools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Miller-Rabin with these bases is deterministic below 3.3 * 10^24, far
+# beyond any exponent; above that it is a strong probable-prime test.
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+# By default trial factoring tries factors up to this many bits beyond
+# the exponent's, i.e. k < 2^(FACTOR_DEPTH - 1): about one sieved block,
+# well under the cost of the Lucas-Lehmer test it can save.
+FACTOR_DEPTH = 16
+# Candidate factors divisible by one of these are sieved out before the powmod.
+SIEVE_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+FACTOR_BLOCK = 1 << 16
+CHECKPOINT_EVERY = 10000
+# Decimal renderings of M_p for p at least this large (300k+ digits, tens
+# of ms and up to seconds to build) are kept on disk between runs.
+DIGIT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'hashlet', 'mersenne')
+DISK_CACHE_MIN_EXPONENT = 1000000
+
+def is_probable_prime(n: int) -> bool:
+    """Miller-Rabin primality test, deterministic for n < 3.3 * 10^24."""
+    if n < 2:
+        return False
+    for p in MR_BASES:
+        if n % p == 0:
+            return n == p
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for a in MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def default_factor_bits(p: int) -> int:
+    return p.bit_length() + FACTOR_DEPTH
+
+def trial_factor(p: int, bits: Optional[int] = None) -> Optional[int]:
+    """Smallest factor q < 2^bits of 2^p - 1 for prime p > 2, or None.
+
+    Every factor of a Mersenne number with prime exponent is q = 2kp + 1
+    with q = +-1 mod 8, so only those are tried, in blocks of k; blocks
+    are sieved by small primes in NumPy and the survivors checked with
+    pow(2, p, q) == 1.
+    """
+    if bits is None:
+        bits = default_factor_bits(p)
+    limit = min(1 << bits, 1 << (p // 2 + 1))  # No factor above sqrt(2^p - 1) is smallest
+    max_k = (limit - 1) // (2 * p)
+    vectorized = limit < (1 << 62)
+    for first in range(1, max_k + 1, FACTOR_BLOCK):
+        last = min(first + FACTOR_BLOCK, max_k + 1)
+        if not vectorized:
+            candidates = (2 * k * p + 1 for k in range(first, last))
+            candidates = (q for q in candidates if q % 8 in (1, 7))
+        else:
+            q = 2 * p * np.arange(first, last, dtype=np.int64) + 1
+            keep = (q % 8 == 1) | (q % 8 == 7)
+            for small in SIEVE_PRIMES:
+                keep &= (q % small != 0) | (q == small)
+            candidates = q[keep].tolist()
+        for q in candidates:
+            if pow(2, p, q) == 1:
+                return q
+    return None
+
+def _load_checkpoint(path: str, p: int):
+    try:
+        with open(path, 'r') as f:
+            state = json.load(f)
+        if state['p'] == p:
+            return state['iteration'], int(state['residue'], 16)
+        logger.warning(f"Checkpoint {path} is for M{state['p']}, not M{p}; starting over")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring checkpoint {path}: {e}")
+    return 0, 4
+
+def _save_checkpoint(path: str, p: int, iteration: int, residue: int) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump({'p': p, 'iteration': iteration, 'residue': format(residue, 'x')}, f)
+    os.replace(tmp, path)
+
+def lucas_lehmer(p: int, checkpoint: Optional[str] = None, checkpoint_every: int = CHECKPOINT_EVERY) -> bool:
+    """Lucas-Lehmer test: is 2^p - 1 prime, for prime p.
+
+    s(i+1) = s(i)^2 - 2 mod 2^p - 1 over Python ints, reduced with shifts
+    and masks instead of a division. With checkpoint set, the residue is
+    written there every checkpoint_every iterations (atomically) and a
+    run resumes from it; the file is removed once the test finishes.
+    """
+    if p == 2:
+        return True
+    m = (1 << p) - 1
+    start, s = _load_checkpoint(checkpoint, p) if checkpoint else (0, 4)
+    for i in range(start, p - 2):
+        s = s * s + m - 2  # + m keeps it non-negative when s < 2
+        s = (s & m) + (s >> p)
+        while s >= m:
+            s -= m
+        if checkpoint and (i + 1) % checkpoint_every == 0:
+            _save_checkpoint(checkpoint, p, i + 1, s)
+    if checkpoint:
+        try:
+            os.unlink(checkpoint)
+        except FileNotFoundError:
+            pass
+    return s == 0
+
+def check_exponent(p: int, factor_bits: Optional[int] = None, checkpoint_dir: Optional[str] = None) -> Dict:
+    """Run the full pipeline on 2^p - 1: exponent primality, trial factoring, Lucas-Lehmer."""
+    result = {'p': p, 'exponent_prime': is_probable_prime(p), 'factor': None, 'prime': False}
+    if not result['exponent_prime']:
+        return result
+    if p > 2:
+        result['factor'] = trial_factor(p, factor_bits)
+        if result['factor'] is not None:
+            return result
+    checkpoint = os.path.join(checkpoint_dir, f"M{p}.json") if checkpoint_dir else None
+    result['prime'] = lucas_lehmer(p, checkpoint)
+    return result
+
+def _check_task(args) -> Dict:
+    return check_exponent(*args)
+
+def search_exponents(start: int, stop: int, workers: int = 1, factor_bits: Optional[int] = None,
+                     checkpoint_dir: Optional[str] = None, first: bool = False) -> List[int]:
+    """Exponents p in [start, stop) with 2^p - 1 prime, in increasing order.
+
+    Composite exponents are dropped up front; the prime ones are tested
+    in order, spread over workers processes when workers > 1. With
+    first=True the search stops at the first Mersenne prime found.
+    """
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+    tasks = [(p, factor_bits, checkpoint_dir) for p in range(max(start, 2), stop) if is_probable_prime(p)]
+    found = []
+    if workers > 1 and len(tasks) > 1:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(tasks), os.cpu_count() or 1))
+        try:
+            for result in pool.map(_check_task, tasks):
+                if result['prime']:
+                    found.append(result['p'])
+                    if first:
+                        break
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    else:
+        for task in tasks:
+            if _check_task(task)['prime']:
+                found.append(task[0])
+                if first:
+                    break
+    return found
+
+@functools.lru_cache(maxsize=64)
+def mersenne_number(p: int) -> int:
+    """M_p = 2^p - 1 as an exact Python int, built with a shift."""
+    if p < 0:
+        raise ValueError("Mersenne exponents must be non-negative")
+    return (1 << p) - 1
+
+@functools.lru_cache(maxsize=4096)
+def mersenne_residue(p: int, modulus: int) -> int:
+    """M_p mod modulus (369, 2^256, ...) without building M_p."""
+    return (pow(2, p, modulus) - 1) % modulus
+
+def _render_digits(p: int) -> str:
+    # libmpdec's power and str are subquadratic, unlike int -> str, which
+    # Python 3.11 also refuses past 4300 digits.
+    with decimal.localcontext() as ctx:
+        ctx.prec = decimal.MAX_PREC
+        ctx.Emax = decimal.MAX_EMAX
+        return str(decimal.Decimal(2) ** p - 1)
+
+@functools.lru_cache(maxsize=8)
+def mersenne_digits(p: int, cache_dir: Optional[str] = DIGIT_CACHE_DIR) -> str:
+    """Decimal digits of M_p, rendered on first use; large ones are cached under cache_dir."""
+    if p < DISK_CACHE_MIN_EXPONENT or not cache_dir:
+        return _render_digits(p)
+    path = os.path.join(cache_dir, f"M{p}.txt")
+    try:
+        with open(path, 'r') as f:
+            digits = f.read()
+        if digits.isdigit():
+            return digits
+        logger.warning(f"Ignoring damaged Mersenne digit cache {path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not read Mersenne digit cache {path}: {e}")
+    digits = _render_digits(p)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp, 'w') as f:
+            f.write(digits)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not write Mersenne digit cache {path}: {e}")
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return digits
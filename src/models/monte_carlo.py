@@ -0,0 +1,131 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+import numpy as np
+from src.config import FEE_RATE, MARTINGALE_FACTOR
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+# Paths * steps per chunk; bounds the working set to a few MB per array.
+DEFAULT_CHUNK_CELLS = 1 << 22
+
+def _simulate_chunk(args) -> Dict[str, np.ndarray]:
+    """Simulate one chunk of paths; runs in a worker process when workers > 1."""
+    (seed, n_paths, n_steps, target, base_amount,
+     fee_rate, martingale_factor, win_prob, payoff) = args
+    rng = np.random.Generator(np.random.PCG64(seed))
+    # Per-path parameters: scalars broadcast, arrays were sliced to this chunk.
+    fee_rate = np.broadcast_to(fee_rate, n_paths)
+    martingale_factor = np.broadcast_to(martingale_factor, n_paths)
+    win_prob = np.broadcast_to(win_prob, n_paths)
+    payoff = np.broadcast_to(payoff, n_paths)
+    base_amount = np.broadcast_to(np.asarray(base_amount, dtype=np.float64), n_paths)
+
+    stake = base_amount.copy()
+    filled = np.zeros(n_paths)
+    fees = np.zeros(n_paths)
+    pnl = np.zeros(n_paths)
+    peak = np.zeros(n_paths)
+    drawdown = np.zeros(n_paths)
+    steps = np.zeros(n_paths, dtype=np.int64)
+    active = np.ones(n_paths, dtype=bool)
+    for _ in range(n_steps):
+        # GreedyFillSimulator.fill_order fills stake * martingale_factor, and
+        # refuses a fill that would pass the target, which ends the path.
+        weighted = stake * martingale_factor
+        active &= filled + weighted <= target
+        if not active.any():
+            break
+        amount = np.where(active, weighted, 0.0)
+        filled += amount
+        fees += amount * fee_rate
+        won = rng.random(n_paths) < win_prob
+        pnl += np.where(won, amount * payoff, -amount)
+        np.maximum(peak, pnl - fees, out=peak)
+        np.maximum(drawdown, peak - (pnl - fees), out=drawdown)
+        steps += active
+        # martingale_hedge: scale the stake up after a loss, reset after a win.
+        stake = np.where(active & ~won, stake * martingale_factor, np.where(active, base_amount, stake))
+    return {
+        'net': pnl - fees,
+        'filled': filled,
+        'fees': fees,
+        'max_drawdown': drawdown,
+        'steps': steps,
+        'capped': ~active,
+    }
+
+def _summary(values: np.ndarray) -> Dict[str, float]:
+    quantiles = np.percentile(values, PERCENTILES)
+    summary = {'mean': float(values.mean()), 'std': float(values.std()),
+               'min': float(values.min()), 'max': float(values.max())}
+    summary.update({f"p{p}": float(q) for p, q in zip(PERCENTILES, quantiles)})
+    return summary
+
+def _chunk_param(value, start: int, stop: int):
+    value = np.asarray(value, dtype=np.float64)
+    return value if value.ndim == 0 else value[start:stop]
+
+def simulate_martingale_paths(n_paths: int, n_steps: int, target: float, base_amount=1.0,
+                              fee_rate=FEE_RATE, martingale_factor=MARTINGALE_FACTOR,
+                              win_prob=0.5, payoff=1.0, seed: Optional[int] = None,
+                              chunk_paths: Optional[int] = None, workers: int = 1) -> Dict:
+    """Monte Carlo of GreedyFillSimulator fills sized by martingale_hedge.
+
+    Each path starts at base_amount. Every step places the stake, which
+    fill_order fills as stake * martingale_factor (refused, ending the
+    path, once the cumulative fill would pass target); the path pays
+    fee_rate on the filled amount and wins filled * payoff with
+    probability win_prob or loses it. A loss multiplies the next stake
+    by martingale_factor, a win resets it. base_amount, fee_rate,
+    martingale_factor, win_prob and payoff may be scalars or arrays of
+    length n_paths.
+
+    Paths run in chunks of chunk_paths (by default sized to keep about
+    4M path-steps per chunk), each with its own stream spawned from
+    seed, so a (seed, chunk_paths) pair gives the same result however
+    many workers run it. workers > 1 spreads chunks over processes.
+    Returns distribution summaries only.
+    """
+    if n_paths <= 0 or n_steps <= 0:
+        raise ValueError("n_paths and n_steps must be positive")
+    for name, value in (('base_amount', base_amount), ('fee_rate', fee_rate),
+                        ('martingale_factor', martingale_factor), ('win_prob', win_prob),
+                        ('payoff', payoff)):
+        shape = np.shape(value)
+        if shape not in ((), (n_paths,)):
+            raise ValueError(f"{name} must be a scalar or have shape ({n_paths},), not {shape}")
+    if chunk_paths is None:
+        chunk_paths = max(1, DEFAULT_CHUNK_CELLS // n_steps)
+    starts = range(0, n_paths, chunk_paths)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    tasks = [
+        (seeds[i], min(chunk_paths, n_paths - start), n_steps, target,
+         _chunk_param(base_amount, start, start + chunk_paths),
+         _chunk_param(fee_rate, start, start + chunk_paths),
+         _chunk_param(martingale_factor, start, start + chunk_paths),
+         _chunk_param(win_prob, start, start + chunk_paths),
+         _chunk_param(payoff, start, start + chunk_paths))
+        for i, start in enumerate(starts)
+    ]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks), os.cpu_count() or 1)) as pool:
+            chunks = list(pool.map(_simulate_chunk, tasks))
+    else:
+        chunks = [_simulate_chunk(task) for task in tasks]
+    results = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+    net = results['net']
+    return {
+        'paths': n_paths,
+        'steps': n_steps,
+        'seed': seed,
+        'net_pnl': _summary(net),
+        'filled': _summary(results['filled']),
+        'fees': _summary(results['fees']),
+        'max_drawdown': _summary(results['max_drawdown']),
+        'steps_active': _summary(results['steps'].astype(np.float64)),
+        'prob_loss': float((net < 0).mean()),
+        'prob_capped': float(results['capped'].mean()),
+    }
@@ -0,0 +1,179 @@
+import heapq
+import itertools
+import logging
+from collections import deque, namedtuple
+from typing import Dict, List, Optional, Tuple
+from src.config import TICK_SPACING
+
+logger = logging.getLogger(__name__)
+
+BUY = 'buy'
+SELL = 'sell'
+
+# One trade between a resting (maker) order and an incoming (taker) one.
+Fill = namedtuple('Fill', 'maker_id taker_id price volume')
+
+class Order:
+    __slots__ = ('id', 'side', 'ticks', 'volume', 'owner')
+
+    def __init__(self, id_: int, side: str, ticks: int, volume: float, owner=None):
+        self.id = id_
+        self.side = side
+        self.ticks = ticks
+        self.volume = volume
+        self.owner = owner
+
+class PriceLevel:
+    """Resting orders at one price, oldest first."""
+    __slots__ = ('orders', 'volume', 'count')
+
+    def __init__(self):
+        self.orders = deque()
+        self.volume = 0.0
+        self.count = 0  # Live orders; cancelled ones stay in the deque until they reach the front
+
+class OrderBook:
+    """Price-time priority limit order book with a matching engine.
+
+    Prices are held as integer ticks of tick_size, so levels are exact
+    dict keys. Each side keeps a dict of price levels and a heap of their
+    ticks (bids negated), giving O(log n) to open a level, O(1) cancel,
+    and O(1) best bid/ask. Heap entries for emptied levels are dropped
+    when they reach the top, and the heaps are rebuilt if stale entries
+    pile up.
+    """
+    def __init__(self, tick_size: float = TICK_SPACING):
+        self.tick_size = tick_size
+        self.bid_levels: Dict[int, PriceLevel] = {}
+        self.ask_levels: Dict[int, PriceLevel] = {}
+        self._bid_heap: List[int] = []  # Negated ticks
+        self._ask_heap: List[int] = []
+        self.orders: Dict[int, Order] = {}
+        self._ids = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def to_ticks(self, price: float) -> int:
+        return round(price / self.tick_size)
+
+    def to_price(self, ticks: int) -> float:
+        return round(ticks * self.tick_size, 10)
+
+    def best_bid_ticks(self) -> Optional[int]:
+        heap, levels = self._bid_heap, self.bid_levels
+        while heap and -heap[0] not in levels:
+            heapq.heappop(heap)
+        return -heap[0] if heap else None
+
+    def best_ask_ticks(self) -> Optional[int]:
+        heap, levels = self._ask_heap, self.ask_levels
+        while heap and heap[0] not in levels:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def best_bid(self) -> Optional[float]:
+        ticks = self.best_bid_ticks()
+        return None if ticks is None else self.to_price(ticks)
+
+    def best_ask(self) -> Optional[float]:
+        ticks = self.best_ask_ticks()
+        return None if ticks is None else self.to_price(ticks)
+
+    def submit(self, side: str, price: Optional[float], volume: float, owner=None) -> Tuple[int, List[Fill]]:
+        """Match a limit order (or a market order, if price is None) and rest what's left.
+
+        Returns the order id and the fills it made, in the order they
+        happened. Market orders never rest.
+        """
+        if volume <= 0:
+            raise ValueError(f"Order volume must be positive, not {volume}")
+        if side == BUY:
+            limit = None if price is None else self.to_ticks(price)
+            levels, heap, sign = self.ask_levels, self._ask_heap, 1
+            own_levels, own_heap, own_sign = self.bid_levels, self._bid_heap, -1
+        elif side == SELL:
+            limit = None if price is None else self.to_ticks(price)
+            levels, heap, sign = self.bid_levels, self._bid_heap, -1
+            own_levels, own_heap, own_sign = self.ask_levels, self._ask_heap, 1
+        else:
+            raise ValueError(f"Order side must be {BUY!r} or {SELL!r}, not {side!r}")
+
+        order_id = next(self._ids)
+        fills = []
+        orders = self.orders
+        # Walk the opposite side best level first. In heap terms both
+        # sides compare the same way: sign * ticks <= sign * limit.
+        while volume > 0 and heap:
+            key = heap[0]
+            level = levels.get(sign * key)
+            if level is None:
+                heapq.heappop(heap)
+                continue
+            if limit is not None and key > sign * limit:
+                break
+            ticks = sign * key
+            price = self.to_price(ticks)
+            queue = level.orders
+            while volume > 0 and queue:
+                maker = queue[0]
+                if maker.volume <= 0:
+                    queue.popleft()
+                    continue
+                traded = volume if volume < maker.volume else maker.volume
+                volume -= traded
+                maker.volume -= traded
+                level.volume -= traded
+                fills.append(Fill(maker.id, order_id, price, traded))
+                if maker.volume <= 0:
+                    queue.popleft()
+                    level.count -= 1
+                    del orders[maker.id]
+            if not level.count:
+                del levels[ticks]
+                heapq.heappop(heap)
+
+        if volume > 0 and limit is not None:
+            order = Order(order_id, side, limit, volume, owner)
+            level = own_levels.get(limit)
+            if level is None:
+                level = own_levels[limit] = PriceLevel()
+                heapq.heappush(own_heap, own_sign * limit)
+                if len(own_heap) > 2 * len(own_levels) + 64:
+                    own_heap[:] = [own_sign * t for t in own_levels]
+                    heapq.heapify(own_heap)
+            level.orders.append(order)
+            level.volume += volume
+            level.count += 1
+            orders[order_id] = order
+        return order_id, fills
+
+    def cancel(self, order_id: int) -> bool:
+        """Cancel a resting order; False if it isn't resting (filled, cancelled or unknown)."""
+        order = self.orders.pop(order_id, None)
+        if order is None:
+            return False
+        levels = self.bid_levels if order.side == BUY else self.ask_levels
+        level = levels[order.ticks]
+        level.volume -= order.volume
+        level.count -= 1
+        order.volume = 0
+        if not level.count:
+            del levels[order.ticks]
+        return True
+
+    def depth(self, side: str, levels: int = 3) -> List[Tuple[float, float]]:
+        """The best (price, volume) levels on one side, best first."""
+        if side == BUY:
+            ticks = heapq.nlargest(levels, self.bid_levels)
+            book = self.bid_levels
+        else:
+            ticks = heapq.nsmallest(levels, self.ask_levels)
+            book = self.ask_levels
+        return [(self.to_price(t), book[t].volume) for t in ticks]
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.best_bid_ticks(), self.best_ask_ticks()
+        if bid is None or ask is None:
+            return None
+        return self.to_price(ask - bid)
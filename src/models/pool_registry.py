@@ -0,0 +1,112 @@
+import logging
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class PoolRegistry:
+    """Struct-of-arrays store for perp markets, one row per symbol.
+
+    Liquidity, interest rate and resting order count are NumPy columns,
+    so pool-wide operations (redistribution, aggregate rates, totals)
+    are single vectorized expressions instead of loops over objects.
+    Columns grow by doubling; only the first len(self) rows are live.
+    """
+    def __init__(self, capacity: int = 16):
+        capacity = max(1, capacity)
+        self.symbols: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._liquidity = np.zeros(capacity, dtype=np.float64)
+        self._interest_rate = np.zeros(capacity, dtype=np.float64)
+        self._order_count = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+
+    @property
+    def liquidity(self) -> np.ndarray:
+        """Live liquidity column; a view, so writes go to the registry."""
+        return self._liquidity[:len(self.symbols)]
+
+    @property
+    def interest_rate(self) -> np.ndarray:
+        return self._interest_rate[:len(self.symbols)]
+
+    @property
+    def order_count(self) -> np.ndarray:
+        return self._order_count[:len(self.symbols)]
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._liquidity)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in ('_liquidity', '_interest_rate', '_order_count'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, symbol: str, liquidity: float = 0.0, interest_rate: float = 0.05, order_count: int = 0) -> int:
+        """Add one market and return its row."""
+        return self.add_many([symbol], liquidity, interest_rate, order_count)[0]
+
+    def add_many(self, symbols: Iterable[str], liquidity=0.0, interest_rate=0.05, order_count=0) -> range:
+        """Add markets in bulk; the value arguments are scalars or per-symbol arrays."""
+        symbols = list(symbols)
+        if len(set(symbols)) != len(symbols) or any(symbol in self.index for symbol in symbols):
+            raise ValueError("Market symbols must be unique")
+        # Shape and dtype errors surface here, before the registry is touched;
+        # the index goes last so a symbol is never visible without its row.
+        count = len(symbols)
+        liquidity = np.broadcast_to(np.asarray(liquidity, dtype=self._liquidity.dtype), count)
+        interest_rate = np.broadcast_to(np.asarray(interest_rate, dtype=self._interest_rate.dtype), count)
+        order_count = np.broadcast_to(np.asarray(order_count, dtype=self._order_count.dtype), count)
+        start = len(self.symbols)
+        end = start + count
+        self._reserve(end)
+        self._liquidity[start:end] = liquidity
+        self._interest_rate[start:end] = interest_rate
+        self._order_count[start:end] = order_count
+        self.symbols.extend(symbols)
+        self.index.update((symbol, row) for row, symbol in enumerate(symbols, start))
+        return range(start, end)
+
+    def row(self, symbol: str) -> int:
+        return self.index[symbol]
+
+    def total_liquidity(self) -> float:
+        return float(self.liquidity.sum())
+
+    def mean_interest_rate(self) -> float:
+        """Unweighted mean rate over all markets; 0.0 for an empty registry."""
+        if not self.symbols:
+            return 0.0
+        return float(self.interest_rate.mean())
+
+    def redistribute(self, factor: float) -> float:
+        """Add factor * total liquidity, split evenly, to every market; returns the amount."""
+        if not self.symbols:
+            return 0.0
+        liquidity = self.liquidity
+        amount = float(liquidity.sum()) * factor
+        liquidity += amount / len(self.symbols)
+        return amount
+
+    def status(self, symbol: str) -> Dict:
+        row = self.index[symbol]
+        return {
+            'symbol': symbol,
+            'liquidity_amount': float(self._liquidity[row]),
+            'orders': int(self._order_count[row]),
+        }
+
+    def details(self, symbols: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Per-market status dicts, built only when asked for."""
+        if symbols is None:
+            symbols = self.symbols
+        return [self.status(symbol) for symbol in symbols]
@@ -1,9 +1,9 @@
 import logging
 from datetime import datetime
-import pytz
 from src.config import *
 from typing import List, Dict
 from src.models.bastion import SHA1664, EphemeralBastion
+from src.models.order_book import OrderBook, Fill, BUY, SELL
 from collections import defaultdict  # Add this import
 import asyncio
 import json
@@ -25,23 +25,34 @@ class CandlestickChart:
             logger.error(f"Chart render error: {e}")
 
 class OrderBookUI:
-    def __init__(self):
-        self.bids = []
-        self.asks = []
+    def __init__(self, book: OrderBook = None):
+        self.book = book if book is not None else OrderBook()
+
+    @property
+    def bids(self) -> List[Dict]:
+        """Bid levels, best first."""
+        return [{'price': p, 'volume': v} for p, v in self.book.depth(BUY, len(self.book.bid_levels))]
+
+    @property
+    def asks(self) -> List[Dict]:
+        """Ask levels, best first."""
+        return [{'price': p, 'volume': v} for p, v in self.book.depth(SELL, len(self.book.ask_levels))]
 
-    def add_bid(self, price: float, volume: float):
-        """Add a bid to the order book."""
+    def add_bid(self, price: float, volume: float) -> List[Fill]:
+        """Add a bid to the order book, returning any fills against resting asks."""
         try:
-            self.bids.append({'price': price, 'volume': volume})
+            return self.book.submit(BUY, price, volume)[1]
         except Exception as e:
             logger.error(f"Add bid error: {e}")
+            return []
 
-    def add_ask(self, price: float, volume: float):
-        """Add an ask to the order book."""
+    def add_ask(self, price: float, volume: float) -> List[Fill]:
+        """Add an ask to the order book, returning any fills against resting bids."""
         try:
-            self.asks.append({'price': price, 'volume': volume})
+            return self.book.submit(SELL, price, volume)[1]
         except Exception as e:
             logger.error(f"Add ask error: {e}")
+            return []
 
     def render(self, current_price: float):
         """Render the order book UI."""
@@ -49,11 +60,11 @@ class OrderBookUI:
             print("\n=== Order Book ===")
             print(f"Current Price: ${current_price:.2f}")
             print("Bids:")
-            for bid in self.bids[:3]:
-                print(f"${bid['price']:.2f} | Vol: {bid['volume']:.2f}")
+            for price, volume in self.book.depth(BUY, 3):
+                print(f"${price:.2f} | Vol: {volume:.2f}")
             print("Asks:")
-            for ask in self.asks[:3]:
-                print(f"${ask['price']:.2f} | Vol: {ask['volume']:.2f}")
+            for price, volume in self.book.depth(SELL, 3):
+                print(f"${price:.2f} | Vol: {volume:.2f}")
         except Exception as e:
             logger.error(f"Order book render error: {e}")
 
@@ -64,6 +75,7 @@ class PortfolioUI:
     def add_trade(self, ticker: str, price: float, amount: float, type_: str, tx_hash: str, current_price: float = 0.0) -> dict:
         """Add a trade to the portfolio."""
         try:
+            import pytz
             pl = (current_price - price) * amount if type_ == "Buy" and current_price else 0.0
             trade = {
                 'time': datetime.now(pytz.timezone('Australia/Sydney')).strftime("%Y-%m-%d %H:%M:%S"),
@@ -154,6 +166,7 @@ class QuoteBoxUI:
 
 class TimeSelectorUI:
     def __init__(self):
+        import pytz
         self.timeframe = '1m'
         self.current_time = datetime(2025, 9, 18, 0, 5, tzinfo=pytz.timezone('Australia/Sydney'))  # 12:05 AM AEST
 
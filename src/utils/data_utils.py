@@ -1,5 +1,6 @@
 import math
 from src.config import *
+from src.utils.entropy import shannon_entropy  # Re-exported; was a Counter loop here
 
 def simulate_scalability_issue(tx_count: int) -> float:
     """Simulate scalability delay based on transaction count."""
@@ -18,16 +19,6 @@ def arbitrage_exception(current_price: float, oracle_price: float) -> bool:
     """Check for arbitrage opportunity based on price difference."""
     return abs(current_price - oracle_price) > 0.01 * oracle_price
 
-def shannon_entropy(s: str) -> float:
-    """Calculate Shannon entropy of a string."""
-    from collections import Counter
-    from math import log2
-    freq = Counter(s)
-    len_s = len(s)
-    if len_s == 0:
-        return 0.0
-    return -sum(count / len_s * log2(count / len_s) for count in freq.values() if count > 0)
-
 def benchmark_hashes(num_hashes: int = 1000) -> dict:
     """Benchmark SHA-256 and SHA-3 hash performance."""
     return {"SHA-256": num_hashes * 0.05, "SHA-3": num_hashes * 0.03}
@@ -0,0 +1,140 @@
+import math
+from collections import Counter
+from typing import Iterable, Union
+import numpy as np
+
+Data = Union[str, bytes, bytearray]
+
+# Longer byte inputs are counted with NumPy instead of a Counter.
+NUMPY_MIN_BYTES = 512
+
+def _counts(data: Data):
+    if isinstance(data, (bytes, bytearray)) and len(data) >= NUMPY_MIN_BYTES:
+        counts = np.bincount(np.frombuffer(data, dtype=np.uint8))
+        return counts[counts > 0].tolist()
+    return list(Counter(data).values())
+
+def shannon_entropy(data: Data) -> float:
+    """Shannon entropy in bits per symbol: characters of a str, bytes of bytes; 0.0 when empty."""
+    n = len(data)
+    if n == 0:
+        return 0.0
+    return math.log2(n) - sum(c * math.log2(c) for c in _counts(data)) / n
+
+def unique_ratio(data: Data) -> float:
+    """Distinct symbols over length (the Seraph/ethics digest check); 0.0 when empty."""
+    return len(set(data)) / len(data) if data else 0.0
+
+def _flatten(messages: Iterable[Data]):
+    """One symbol array for all messages, plus per-message lengths.
+
+    bytes are read as Latin-1, so byte values and code points below 256
+    coincide and mixed str/bytes batches count the same way as one at a
+    time.
+    """
+    texts = [m.decode('latin-1') if isinstance(m, (bytes, bytearray)) else m for m in messages]
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    joined = ''.join(texts)
+    try:
+        symbols = np.frombuffer(joined.encode('latin-1'), dtype=np.uint8)
+    except UnicodeEncodeError:
+        symbols = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+    return symbols, lengths
+
+def _batch_stats(messages: Iterable[Data]):
+    """Per-message sum of c*log2(c) over symbol counts c, distinct symbols, and lengths.
+
+    Sorting (message, symbol) keys puts equal symbols of a message in
+    runs; run lengths are the counts. One sort for the whole batch
+    instead of a histogram per message.
+    """
+    symbols, lengths = _flatten(messages)
+    n = len(lengths)
+    if not len(symbols):
+        return np.zeros(n), np.zeros(n, dtype=np.int64), lengths
+    shift = 8 if symbols.dtype == np.uint8 else 21  # Code points fit in 21 bits
+    rows = np.repeat(np.arange(n, dtype=np.int64), lengths)
+    keys = np.sort((rows << shift) | symbols)
+    starts = np.empty(len(keys), dtype=bool)
+    starts[0] = True
+    np.not_equal(keys[1:], keys[:-1], out=starts[1:])
+    run_starts = np.flatnonzero(starts)
+    counts = np.diff(run_starts, append=len(keys))
+    run_rows = keys[run_starts] >> shift
+    xlogx = np.bincount(run_rows, weights=counts * np.log2(counts), minlength=n)
+    distinct = np.bincount(run_rows, minlength=n)
+    return xlogx, distinct, lengths
+
+def shannon_entropy_batch(messages: Iterable[Data]) -> np.ndarray:
+    """shannon_entropy for many messages in a few NumPy passes."""
+    xlogx, _, lengths = _batch_stats(messages)
+    safe = np.maximum(lengths, 1)
+    return np.where(lengths > 0, np.log2(safe) - xlogx / safe, 0.0)
+
+def unique_ratio_batch(messages: Iterable[Data]) -> np.ndarray:
+    """unique_ratio for many messages in a few NumPy passes."""
+    _, distinct, lengths = _batch_stats(messages)
+    return np.where(lengths > 0, distinct / np.maximum(lengths, 1), 0.0)
+
+class SlidingEntropy:
+    """Shannon entropy of the last `window` bytes of a stream, updated in O(1) per byte.
+
+    Keeps byte counts and the running sum of c*log2(c), so entropy() is
+    log2(n) - sum / n. The sum is recomputed from the counts once per
+    window of evictions to stop rounding drift.
+    """
+    def __init__(self, window: int = 4096):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._ring = bytearray(window)
+        self._pos = 0
+        self._size = 0
+        self._counts = [0] * 256
+        self._distinct = 0
+        self._xlogx = [0.0] + [c * math.log2(c) for c in range(1, window + 1)]
+        self._sum = 0.0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, byte: int) -> None:
+        self.update((byte,))
+
+    def update(self, data: Iterable[int]) -> None:
+        """Push bytes (a bytes-like object or ints 0-255), evicting the oldest past the window."""
+        ring, counts, xlogx, window = self._ring, self._counts, self._xlogx, self.window
+        pos, size, distinct, total, evictions = self._pos, self._size, self._distinct, self._sum, self._evictions
+        for byte in data:
+            if size == window:
+                old = ring[pos]
+                c = counts[old]
+                total += xlogx[c - 1] - xlogx[c]
+                counts[old] = c - 1
+                if c == 1:
+                    distinct -= 1
+                evictions += 1
+                if evictions == window:
+                    evictions = 0
+                    total = sum(xlogx[c] for c in counts)
+            else:
+                size += 1
+            c = counts[byte]
+            total += xlogx[c + 1] - xlogx[c]
+            counts[byte] = c + 1
+            if c == 0:
+                distinct += 1
+            ring[pos] = byte
+            pos = pos + 1 if pos + 1 < window else 0
+        self._pos, self._size, self._distinct, self._sum, self._evictions = pos, size, distinct, total, evictions
+
+    def entropy(self) -> float:
+        """Bits per byte over the current window; 0.0 when empty."""
+        n = self._size
+        if n == 0:
+            return 0.0
+        return max(0.0, math.log2(n) - self._sum / n)
+
+    def unique_ratio(self) -> float:
+        return self._distinct / self._size if self._size else 0.0
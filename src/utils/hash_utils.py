@@ -1,8 +1,7 @@
 import hashlib
-import mpmath
 import numpy as np
 import logging
-from src.config import GRID_DIM  # Import GRID_DIM specifically
+from src.config import GRID_DIM, PHI_FLOAT
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +11,7 @@ class HashUtils:
 
     def sha1664(self, indexed_hash):
         """Generate SHA1664 hash with sponge permutations."""
+        import mpmath
         base_hash = hashlib.sha512(str(indexed_hash).encode()).digest()
         mp_state = mpmath.mpf(int(base_hash.hex(), 16))
         for _ in range(4):
@@ -32,7 +32,7 @@ class HashUtils:
         pos_index = sum(left_seq[i % laps] * ((original >> i) & 1) for i in range(bits))
         neg_index = sum(right_seq[i % laps] * ((reverse >> i) & 1) for i in range(bits))
         total_index = pos_index + neg_index
-        theta_flat = int(total_index * 0.3536 * mpmath.phi) % 180
+        theta_flat = int(total_index * 0.3536 * PHI_FLOAT) % 180
         if theta_flat != 0:
             total_index = (total_index // 180) * 180
         return total_index & ((1 << (bits * 2)) - 1), pos_index, neg_index
@@ -27,6 +27,8 @@ from matplotlib import MatplotlibDeprecationWarning
 import struct
 import base64
 from kappawise import compute_kappa_grid
+# Greencurve (custom kappa NURBS with endpoint kappa and theta decay, degree 5 for G4 approx G5), shared with ribit_telemetry
+from src.utils.nurbs import custom_interoperations_green_curve
 
 # Try to import mpld3; if it fails, set a flag to skip HTML export
 try:
@@ -220,71 +222,6 @@ def compute_golden_spiral():
     y *= scale_factor
     return x, y
 
-# Custom interoperations for greencurve (custom kappa NURBS with endpoint kappa and theta decay, upgraded to degree 5 for G4 approx G5)
-def custom_interoperations_green_curve(points, kappas, is_closed=False):
-    """
-    Custom kappa NURBS-like curve through points with endpoint kappa and theta decay for curvature continuity.
-    For closed curves, appends points for periodic wrapping to achieve higher continuity at closure.
- 
-    Args:
-        points (list): List of (x, y) points (kappa nodes).
-        kappas (list): Kappa values at each node.
-        is_closed (bool): If True, treat as closed curve with periodic continuity.
- 
-    Returns:
-        tuple: (x, y) arrays for the interoperated curve.
-    """
-    if len(points) < 2:
-        return np.array([]), np.array([])
- 
-    # Dynamically adjust degree for few points to ensure anchoring (line for 2 points)
-    degree = min(5, len(points) - 1)
- 
-    if is_closed:
-        points = points + points[1:degree + 1]
-        kappas = kappas + kappas[1:degree + 1]
- 
-    x_points = [p[0] for p in points]
-    y_points = [p[1] for p in points]
-    t = np.cumsum([0] + [np.sqrt((x_points[i+1] - x_points[i])**2 + (y_points[i+1] - y_points[i])**2) for i in range(len(points)-1)])
-    t_fine = np.linspace(0, t[-1], 1000) if t[-1] > 0 else np.linspace(0, 1, 1000)
- 
-    # Custom NURBS basis functions (recursive for higher degree)
-    def nurbs_basis(u, i, p, knots):
-        if p == 0:
-            return 1.0 if knots[i] <= u < knots[i+1] else 0.0
-        if knots[i+p] == knots[i]:
-            c1 = 0.0
-        else:
-            c1 = (u - knots[i]) / (knots[i+p] - knots[i]) * nurbs_basis(u, i, p-1, knots)
-        if knots[i+p+1] == knots[i+1]:
-            c2 = 0.0
-        else:
-            c2 = (knots[i+p+1] - u) / (knots[i+p+1] - knots[i+1]) * nurbs_basis(u, i+1, p-1, knots)
-        return c1 + c2
- 
-    # Generate knots based on theta (distance), non-uniform for decay, adjusted for higher degree
-    knots = [0] * (degree + 1) + list(np.cumsum([kappas[i] for i in range(len(points))])) + [t[-1]] * (degree + 1) # Clamped knots for endpoint interpolation
- 
-    x_fine = []
-    y_fine = []
-    for u in t_fine:
-        x_val = 0.0
-        y_val = 0.0
-        n = len(points) - 1
-        for i in range(n + 1):
-            b = nurbs_basis(u, i, degree, knots) # Higher degree basis
-            weight = kappas[i] if i < len(kappas) else kappas[-1] # Weight by kappa
-            x_val += b * x_points[i] * weight
-            y_val += b * y_points[i] * weight
-        # Theta decay adjustment
-        decay = np.exp(-u / t[-1] / 20.0) if t[-1] > 0 else 1.0
-        x_val *= decay
-        y_val *= decay
-        x_fine.append(x_val)
-        y_fine.append(y_val)
- 
-    return np.array(x_fine), np.array(y_fine)
 # Compute kappa for a segment, second endpoint influences next kappa
 def compute_segment_kappa(p1, p2, base_kappa=1.0, prev_kappa=1.0):
     """
@@ -0,0 +1,94 @@
+import functools
+from typing import Optional, Sequence, Tuple
+import numpy as np
+
+# Basis matrices kept; each is samples x basis functions (1000 x ~20 floats for a green curve).
+BASIS_CACHE_SIZE = 128
+GREEN_CURVE_SAMPLES = 1000
+GREEN_CURVE_MAX_DEGREE = 5
+
+def bspline_basis(u, knots: Sequence[float], degree: int, closed_end: bool = False) -> np.ndarray:
+    """Cox-de Boor basis for every sample at once: a (len(u), len(knots) - degree - 1) matrix.
+
+    Level p is built from level p - 1 for all samples and all basis
+    functions together, with the same per-term arithmetic as the scalar
+    recursion (a zero-width span contributes 0). Spans are half-open;
+    closed_end also counts the right end of the last non-empty span, so
+    a clamped curve reaches its last control point.
+    """
+    u = np.asarray(u, dtype=np.float64)[:, None]
+    k = np.asarray(knots, dtype=np.float64)
+    if len(k) < degree + 2:
+        raise ValueError(f"A degree {degree} basis needs at least {degree + 2} knots")
+    basis = ((k[:-1] <= u) & (u < k[1:])).astype(np.float64)
+    if closed_end:
+        spans = np.flatnonzero(k[:-1] < k[1:])
+        if len(spans):
+            last = spans[-1]
+            basis[:, last] = np.maximum(basis[:, last], (u[:, 0] == k[last + 1]))
+    for p in range(1, degree + 1):
+        left = k[p:-1] - k[:-p - 1]
+        right = k[p + 1:] - k[1:-p]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c1 = np.where(left != 0, (u - k[:-p - 1]) / left * basis[:, :-1], 0.0)
+            c2 = np.where(right != 0, (k[p + 1:] - u) / right * basis[:, 1:], 0.0)
+        basis = c1 + c2
+    return basis
+
+@functools.lru_cache(maxsize=BASIS_CACHE_SIZE)
+def basis_matrix(knots: Tuple[float, ...], degree: int, count: int, start: Optional[float] = None,
+                 stop: Optional[float] = None, closed_end: bool = False) -> np.ndarray:
+    """bspline_basis at count evenly spaced samples, cached per knot vector (read-only).
+
+    start and stop default to the curve's domain, knots[degree] to
+    knots[-degree - 1]. Once cached, a curve with new control points or
+    weights over the same knots costs one matrix multiply.
+    """
+    start = knots[degree] if start is None else start
+    stop = knots[-degree - 1] if stop is None else stop
+    basis = bspline_basis(np.linspace(start, stop, count), knots, degree, closed_end)
+    basis.setflags(write=False)
+    return basis
+
+def nurbs_curve(control_points, weights, degree: int, knots: Sequence[float], num_points: int = 1000) -> np.ndarray:
+    """Points of the rational curve sum(N_i w_i P_i) / sum(N_i w_i) over its whole domain."""
+    points = np.asarray(control_points, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    basis = basis_matrix(tuple(float(k) for k in knots), degree, num_points, closed_end=True)
+    weighted = basis * weights
+    return (weighted @ points) / weighted.sum(axis=1)[:, None]
+
+def custom_interoperations_green_curve(points, kappas, is_closed=False, num_points=GREEN_CURVE_SAMPLES):
+    """
+    Custom kappa NURBS-like curve through points with endpoint kappa and theta decay for curvature continuity.
+    For closed curves, appends points for periodic wrapping to achieve higher continuity at closure.
+
+    Args:
+        points (list): List of (x, y) points (kappa nodes).
+        kappas (list): Kappa values at each node.
+        is_closed (bool): If True, treat as closed curve with periodic continuity.
+        num_points (int): Samples along the curve.
+
+    Returns:
+        tuple: (x, y) arrays for the interoperated curve.
+    """
+    if len(points) < 2:
+        return np.array([]), np.array([])
+    # Degree 5 (G4, approximating G5), lower for few points so 2 points give a line
+    degree = min(GREEN_CURVE_MAX_DEGREE, len(points) - 1)
+    points, kappas = list(points), list(kappas)
+    if is_closed:
+        points = points + points[1:degree + 1]
+        kappas = kappas + kappas[1:degree + 1]
+    n = len(points)
+    xy = np.asarray(points, dtype=np.float64)
+    steps = np.sqrt((xy[1:, 0] - xy[:-1, 0]) ** 2 + (xy[1:, 1] - xy[:-1, 1]) ** 2)
+    t_end = float(np.cumsum(steps)[-1])
+    weights = np.asarray([kappas[i] for i in range(n)], dtype=np.float64)
+    # Clamped at 0, interior knots at the running kappa sum, t_end repeated at the end;
+    # only the first n basis functions carry control points.
+    knots = (0.0,) * (degree + 1) + tuple(float(k) for k in np.cumsum(weights)) + (t_end,) * (degree + 1)
+    stop = t_end if t_end > 0 else 1.0
+    basis = basis_matrix(knots, degree, num_points, 0.0, stop)[:, :n]
+    decay = np.exp(-np.linspace(0, stop, num_points) / t_end / 20.0) if t_end > 0 else 1.0
+    return (basis @ (xy[:, 0] * weights)) * decay, (basis @ (xy[:, 1] * weights)) * decay
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 20
+# A file modified this close to when it was hashed may change again
+# without its size or mtime changing, so its digest isn't cached.
+RACY_WINDOW_NS = 2 * 10**9
+
+def file_sha256(path: str, chunk_size: int = CHUNK_SIZE) -> str:
+    """SHA-256 of a file's bytes, read in chunks so large files aren't held in memory."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ValidationCache:
+    """Content digests remembered by (path, size, mtime_ns, inode) in a JSON sidecar file."""
+    def __init__(self, sidecar: str):
+        self.sidecar = sidecar
+        self.entries: Dict[str, dict] = {}
+        self.hashed = 0  # Files actually read since load()
+        self.dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Read the sidecar file; a missing or unreadable one starts an empty cache."""
+        try:
+            with open(self.sidecar, 'r') as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring validation cache {self.sidecar}: {e}")
+            self.entries = {}
+        self.hashed = 0
+        self.dirty = False
+
+    def save(self) -> None:
+        """Write the sidecar file if anything changed, replacing it atomically."""
+        if not self.dirty:
+            return
+        tmp = f"{self.sidecar}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.sidecar)
+            self.dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write validation cache {self.sidecar}: {e}")
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def digest(self, path: str, force: bool = False) -> str:
+        """SHA-256 of path, reusing the cached digest if the file's stat key is unchanged."""
+        key = os.path.abspath(path)
+        st = os.stat(path)
+        stat_key = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'inode': st.st_ino}
+        entry = self.entries.get(key)
+        if not force and entry is not None and all(entry.get(k) == v for k, v in stat_key.items()):
+            return entry['sha256']
+        started_ns = time.time_ns()
+        sha256 = file_sha256(path)
+        self.hashed += 1
+        if started_ns - st.st_mtime_ns >= RACY_WINDOW_NS:
+            self.entries[key] = dict(stat_key, sha256=sha256)
+            self.dirty = True
+        elif self.entries.pop(key, None) is not None:
+            self.dirty = True
+        return sha256
+
+    def validate(self, expected: Dict[str, str], force: bool = False) -> bool:
+        """Check each path against its expected SHA-256 and save the cache.
+
+        Every file is checked, so the log names all mismatches. With
+        force, every file is re-read and its cache entry replaced.
+        """
+        valid = True
+        for path, expected_sha256 in expected.items():
+            try:
+                actual = self.digest(path, force=force)
+            except OSError as e:
+                logger.error(f"Validate {path} error: {e}")
+                valid = False
+                continue
+            if actual != expected_sha256:
+                logger.error(f"Hash mismatch for {path}: {actual} != {expected_sha256}")
+                valid = False
+        self.save()
+        return valid
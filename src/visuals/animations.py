@@ -1,7 +1,10 @@
+import logging
 import numpy as np
-from matplotlib.animation import FuncAnimation
 from src.config import *
-from src.visuals.plot_utils import compute_green_segment
+from src.visuals.plot_utils import compute_green_segment, create_blob_surface, add_light_slicks
+# matplotlib is imported by each demo when it runs.
+
+logger = logging.getLogger(__name__)
 
 def create_droplets(ax, positions, alpha=0.7):
     """Create ternary droplets for visualization."""
@@ -21,6 +24,9 @@ def create_droplets(ax, positions, alpha=0.7):
 def demo_greenspline_animation(frames: int = 200) -> None:
     """Generate and save greenspline animation with constant curvature and Boas rendering."""
     try:
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+        from matplotlib.colors import LightSource
         fig = plt.figure(figsize=(10, 8), facecolor='black')
         ax = fig.add_subplot(111, projection='3d')
         t = np.linspace(0, 1, 100)
@@ -111,6 +117,8 @@ def demo_greenspline_animation(frames: int = 200) -> None:
 def animate_logo(frames: int = 200) -> None:
     """Generate and save logo animation with ternary swap."""
     try:
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
         fig, ax = plt.subplots(facecolor='black')
         t = np.linspace(0, 1, 100)
         x, y, _ = compute_green_segment(t)
@@ -160,6 +168,10 @@ def animate_logo(frames: int = 200) -> None:
 def demo_shuttle(frames: int = 200) -> None:
     """Generate and save shuttle animation with constant curvature."""
     try:
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+        from matplotlib.colors import LightSource
+        from src.models.green_models import ShuttleModel
         fig = plt.figure(figsize=(10, 8), facecolor='black')
         ax = fig.add_subplot(111, projection='3d')
         t = np.linspace(0, 1, 100)
@@ -1,7 +1,9 @@
+import logging
 import numpy as np
-from matplotlib.colors import LightSource
 from src.config import *
 
+logger = logging.getLogger(__name__)
+
 def compute_green_segment(t, scale=1.0):
     """Compute a green segment for visualization with scaled curvature."""
     try:
@@ -62,6 +64,7 @@ def compute_curvature(x, y, t):
 def create_blob_surface(x, y, z, radius_base, num_sides, kappa, curve_mode='k_curves'):
     """Create a 3D blob surface for visualization with Boas rendering."""
     try:
+        from scipy.ndimage import gaussian_filter1d
         if len(x) != len(y) or len(y) != len(z) or len(z) != len(kappa):
             logger.error(f"Input length mismatch in create_blob_surface: len(x)={len(x)}, len(y)={len(y)}, len(z)={len(z)}, len(kappa)={len(kappa)}")
             return np.zeros((num_sides, len(x))), np.zeros((num_sides, len(x))), np.zeros((num_sides, len(x))), \
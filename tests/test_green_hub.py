@@ -0,0 +1,82 @@
+import errno
+import socket
+import threading
+import unittest
+
+from green_hub import GreenSocket, Hub
+
+
+def run_in_thread(target, timeout=5):
+    """Run target in its own thread (so it gets its own hub); False if it did not finish."""
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+class TestHub(unittest.TestCase):
+
+    def test_close_wakes_parked_reader(self):
+        results = {}
+
+        def main():
+            hub = Hub()
+            a, b = socket.socketpair()
+            reader = GreenSocket(sock=a, hub=hub)
+
+            def read():
+                try:
+                    reader.recv(1)
+                except OSError as e:
+                    results['errno'] = e.errno
+
+            def close():
+                reader.close()
+
+            hub.spawn(read)
+            hub.spawn(close)
+            hub.join()
+            results['waiting'] = hub.waiting
+            b.close()
+
+        self.assertTrue(run_in_thread(main), "run() did not return")
+        self.assertEqual(results['errno'], errno.EBADF)
+        self.assertEqual(results['waiting'], 0)
+
+    def test_sleep_zero_does_not_starve_timers_or_io(self):
+        results = {}
+
+        def main():
+            hub = Hub()
+            a, b = socket.socketpair()
+            reader = GreenSocket(sock=a, hub=hub)
+            done = []
+
+            def spin():
+                while len(done) < 2:
+                    hub.sleep(0)
+
+            def nap():
+                hub.sleep(0.01)
+                done.append('timer')
+
+            def read():
+                results['data'] = reader.recv(1)
+                done.append('io')
+
+            hub.spawn(spin)
+            hub.spawn(nap)
+            hub.spawn(read)
+            b.send(b'x')
+            hub.join()
+            results['done'] = sorted(done)
+            reader.close()
+            b.close()
+
+        self.assertTrue(run_in_thread(main), "run() did not return")
+        self.assertEqual(results['done'], ['io', 'timer'])
+        self.assertEqual(results['data'], b'x')
+
+
+if __name__ == '__main__':
+    unittest.main()
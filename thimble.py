@@ -0,0 +1,44 @@
+# thimble.py - Closed-form Thimble Solver for block arrivals
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Notes: Solves sin(thimble * diff / last_diff) = delta / 600 numerically (arcsine branch that
+# sympy.solve lists first), memoized on (diff ratio, delta ratio). sympy is only imported when
+# verify=True, so fleet workers never pay for it. Run as-is for a self-check against sympy.
+
+import math
+from functools import lru_cache
+
+BLOCK_TARGET = 600.0  # Seconds per block
+
+@lru_cache(maxsize=4096)
+def _thimble(ratio, pressure):
+    if ratio == 0 or not -1.0 <= pressure <= 1.0:
+        return None  # No real solution
+    return math.asin(pressure) / ratio
+
+def solve_thimble(diff, last_diff, delta, verify=False):
+    """Principal real root of sin(thimble * diff / last_diff) = delta / 600, or None."""
+    if not last_diff:
+        return None
+    ratio = diff / last_diff
+    pressure = delta / BLOCK_TARGET
+    sol = _thimble(ratio, pressure)
+    if verify and sol is not None:
+        verify_thimble(ratio, pressure, sol)
+    return sol
+
+def verify_thimble(ratio, pressure, sol, tol=1e-9):
+    """Optional slow path: check sol against sympy.solve."""
+    import sympy as sp
+    thimble = sp.symbols('thimble')
+    sols = sp.solve(sp.Eq(sp.sin(thimble * ratio), pressure), thimble)
+    if not sols or abs(complex(sols[0]) - sol) > tol:
+        raise ValueError(f"Thimble mismatch: numeric {sol}, sympy {sols}")
+    return True
+
+def cache_info():
+    return _thimble.cache_info()
+
+if __name__ == "__main__":
+    for diff, last_diff, delta in [(1.0, 1.0, 300), (1.3, 1.0, 120), (0.9, 1.0, -240), (2.0, 1.0, 600)]:
+        print(f"diff {diff}/{last_diff}, delta {delta}s -> thimble {solve_thimble(diff, last_diff, delta, verify=True)}")
+    print(cache_info())